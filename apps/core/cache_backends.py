@@ -0,0 +1,272 @@
+"""
+Cache de dos niveles: LRU en memoria del proceso (L1) delante de django-redis
+
+Los valores chicos y muy leídos (categorías, tags, datos del home y los
+contadores de generación de cache_generations) se piden a Redis, se
+descomprimen (zlib) y se deserializan en cada request. Con este backend,
+las claves de las familias de L1_KEY_PREFIXES se guardan además en un LRU
+del proceso, con TTL corto y un máximo de entradas; las demás claves van
+directo a Redis como siempre.
+
+Coherencia entre pods: toda escritura o borrado de una clave L1 (set, add,
+delete, incr, ...) se publica por pub/sub de Redis en L1_CHANNEL y cada
+proceso la descarta de su LRU al recibirla. Si el suscriptor pierde la
+conexión, el LRU se vacía y no se usa hasta reconectar. El TTL de L1 acota
+lo que puede durar un valor viejo si se pierde un mensaje.
+
+Los valores de L1 se entregan sin copiar: quien los lee no debe
+modificarlos. invalidate_tags borra con Lua directo en Redis y no publica,
+por eso las claves indexadas por tags no deben estar en L1 (las de
+namespaces no lo necesitan: cambian de nombre al subir la generación).
+
+Configuración (CACHES['default']):
+
+    'BACKEND': 'apps.core.cache_backends.TwoTierRedisCache',
+    'L1': {
+        'KEY_PREFIXES': ['all_categories_', 'cache:generation:', ...],
+        'TIMEOUT': 30,
+        'MAX_ENTRIES': 1000,
+    },
+"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django_redis.cache import RedisCache
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+# Mensaje que vacía el L1 completo (clear, delete_pattern)
+FLUSH_ALL = '*'
+
+
+class LocalLRU:
+    """LRU con TTL por entrada, seguro entre hilos"""
+
+    def __init__(self, max_entries=1000):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        # Sube con cada invalidación: una lectura de Redis que empezó antes no se guarda
+        self.epoch = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return _MISSING
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return _MISSING
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout, epoch):
+        with self._lock:
+            if epoch != self.epoch:
+                return
+            self._data[key] = (value, time.monotonic() + timeout)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def discard(self, keys):
+        with self._lock:
+            self.epoch += 1
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self.epoch += 1
+            self._data.clear()
+
+
+class TwoTierRedisCache(RedisCache):
+    """RedisCache con L1 en memoria para las familias de claves configuradas"""
+
+    def __init__(self, server, params):
+        super().__init__(server, params)
+        l1_options = params.get('L1', {})
+        self.l1_prefixes = tuple(l1_options.get('KEY_PREFIXES', ()))
+        self.l1_timeout = l1_options.get('TIMEOUT', 30)
+        self.l1_channel = l1_options.get('CHANNEL', f'{self.key_prefix or "cache"}:l1:invalidate')
+        self.local = LocalLRU(l1_options.get('MAX_ENTRIES', 1000))
+
+        self._listener_pid = None
+        self._listener_lock = threading.Lock()
+        self._listening = False
+
+    # ---------- L1 ----------
+
+    def _is_local(self, key):
+        return bool(self.l1_prefixes) and str(key).startswith(self.l1_prefixes)
+
+    def _local_key(self, key, version=None):
+        return str(self.make_key(key, version=version))
+
+    def _l1_ready(self):
+        """Arranca el suscriptor en este proceso (también tras un fork) y dice si L1 está al día"""
+        if not self.l1_prefixes:
+            return False
+        if self._listener_pid != os.getpid():
+            with self._listener_lock:
+                if self._listener_pid != os.getpid():
+                    self._listener_pid = os.getpid()
+                    self._listening = False
+                    self.local.clear()
+                    threading.Thread(target=self._listen, name='cache-l1-invalidation', daemon=True).start()
+        return self._listening
+
+    def _listen(self):
+        pid = os.getpid()
+        while self._listener_pid == pid:
+            pubsub = None
+            try:
+                pubsub = self.client.get_client(write=True).pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.l1_channel)
+                self.local.clear()
+                self._listening = True
+                while self._listener_pid == pid:
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get('type') == 'message':
+                        self._handle_message(message['data'])
+            except Exception as e:
+                logger.warning(f"Suscripción de invalidación L1 caída, se reintenta: {e}")
+                time.sleep(1)
+            finally:
+                # Sin suscripción no se sabe qué cambió
+                self._listening = False
+                self.local.clear()
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+    def _handle_message(self, data):
+        if isinstance(data, bytes):
+            data = data.decode('utf-8')
+        keys = json.loads(data)
+        if FLUSH_ALL in keys:
+            self.local.clear()
+        else:
+            self.local.discard(keys)
+
+    def _publish(self, local_keys):
+        """Descarta `local_keys` aquí y avisa a los demás procesos"""
+        if not local_keys:
+            return
+        if FLUSH_ALL in local_keys:
+            self.local.clear()
+        else:
+            self.local.discard(local_keys)
+        try:
+            self.client.get_client(write=True).publish(self.l1_channel, json.dumps(list(local_keys)))
+        except Exception as e:
+            logger.warning(f"No se pudo publicar la invalidación L1 de {local_keys}: {e}")
+
+    def _local_keys(self, keys, version=None):
+        return [self._local_key(key, version) for key in keys if self._is_local(key)]
+
+    # ---------- Lecturas ----------
+
+    def get(self, key, default=None, version=None, client=None):
+        if client is not None or not self._is_local(key) or not self._l1_ready():
+            return super().get(key, default, version=version, client=client)
+
+        local_key = self._local_key(key, version)
+        value = self.local.get(local_key)
+        if value is not _MISSING:
+            return value
+
+        epoch = self.local.epoch
+        value = super().get(key, _MISSING, version=version)
+        if value is _MISSING:
+            return default
+        self.local.set(local_key, value, self.l1_timeout, epoch)
+        return value
+
+    def get_many(self, keys, version=None, client=None):
+        keys = list(keys)
+        if client is not None or not any(self._is_local(key) for key in keys) or not self._l1_ready():
+            return super().get_many(keys, version=version, client=client)
+
+        found = {}
+        remote_keys = []
+        for key in keys:
+            value = self.local.get(self._local_key(key, version)) if self._is_local(key) else _MISSING
+            if value is _MISSING:
+                remote_keys.append(key)
+            else:
+                found[key] = value
+
+        if remote_keys:
+            epoch = self.local.epoch
+            fetched = super().get_many(remote_keys, version=version)
+            for key, value in fetched.items():
+                if self._is_local(key):
+                    self.local.set(self._local_key(key, version), value, self.l1_timeout, epoch)
+            found.update(fetched)
+        return found
+
+    # ---------- Escrituras (publican la invalidación) ----------
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None, client=None, nx=False, xx=False):
+        result = super().set(key, value, timeout=timeout, version=version, client=client, nx=nx, xx=xx)
+        if result:
+            self._publish(self._local_keys([key], version))
+        return result
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None, client=None):
+        result = super().add(key, value, timeout=timeout, version=version, client=client)
+        if result:
+            self._publish(self._local_keys([key], version))
+        return result
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None, client=None):
+        result = super().set_many(data, timeout=timeout, version=version, client=client)
+        self._publish(self._local_keys(data, version))
+        return result
+
+    def delete(self, key, version=None, prefix=None, client=None):
+        result = super().delete(key, version=version, prefix=prefix, client=client)
+        if prefix is None:
+            self._publish(self._local_keys([key], version))
+        else:
+            self._publish([FLUSH_ALL])
+        return result
+
+    def delete_many(self, keys, version=None, client=None):
+        keys = list(keys)
+        result = super().delete_many(keys, version=version, client=client)
+        self._publish(self._local_keys(keys, version))
+        return result
+
+    def incr(self, key, delta=1, version=None, client=None, ignore_key_check=False):
+        result = super().incr(key, delta=delta, version=version, client=client, ignore_key_check=ignore_key_check)
+        self._publish(self._local_keys([key], version))
+        return result
+
+    def decr(self, key, delta=1, version=None, client=None):
+        result = super().decr(key, delta=delta, version=version, client=client)
+        self._publish(self._local_keys([key], version))
+        return result
+
+    def delete_pattern(self, *args, **kwargs):
+        result = super().delete_pattern(*args, **kwargs)
+        if self.l1_prefixes:
+            self._publish([FLUSH_ALL])
+        return result
+
+    def clear(self, *args, **kwargs):
+        result = super().clear(*args, **kwargs)
+        if self.l1_prefixes:
+            self._publish([FLUSH_ALL])
+        return result
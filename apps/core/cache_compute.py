@@ -0,0 +1,144 @@
+"""
+get_or_compute: cache con protección contra estampidas
+
+Con el esquema get -> calcular -> set, cuando vence una clave muy leída (o
+tras clear_cache_for_post) todas las requests concurrentes recalculan las
+mismas queries a la vez. get_or_compute lo evita con tres mecanismos:
+
+- Refresco anticipado probabilístico (XFetch): cada valor guarda cuánto
+  tardó en calcularse (delta) y cuándo vence. Una lectura lo recalcula
+  antes de tiempo si  ahora - delta * beta * ln(rand()) >= vencimiento,
+  así que los valores caros se renuevan antes de vencer y en una sola
+  request, sin coordinación.
+- Single-flight: solo quien obtiene el lock de Redis ('lock:<clave>')
+  recalcula; el resto no repite el trabajo.
+- Valor viejo mientras se refresca: el valor queda en Redis
+  CACHE_STALE_TTL segundos después de vencer y además se guarda una copia
+  en 'stale:<clave>' (sin generación ni tags), de modo que tras subir una
+  generación o invalidar un tag se sigue sirviendo el último valor mientras
+  una sola request calcula el nuevo. Si no hay copia, se espera al que
+  tiene el lock hasta CACHE_LOCK_WAIT segundos y luego se calcula igual.
+
+Uso:
+    categories = get_or_compute(
+        f'all_categories_{lang}', lambda: list(Category.objects.all()), 60 * 60 * 2,
+        namespaces=['categories'],
+    )
+"""
+import logging
+import math
+import random
+import time
+from collections import namedtuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.core.cache_generations import namespaced_key
+from apps.core.cache_tags import register_keys
+
+logger = logging.getLogger(__name__)
+
+# Lo que se guarda en Redis: el valor, segundos que costó calcularlo y vencimiento lógico (epoch)
+CachedValue = namedtuple('CachedValue', ['value', 'delta', 'expiry'])
+
+STALE_KEY = 'stale:{key}'
+LOCK_KEY = 'lock:{key}'
+WAIT_INTERVAL = 0.05
+
+
+def _read(key):
+    entry = cache.get(key)
+    # Valores guardados antes de get_or_compute (sin sobre) cuentan como ausentes
+    return entry if isinstance(entry, CachedValue) else None
+
+
+def _is_fresh(entry, beta):
+    # 1 - random() está en (0, 1]: el logaritmo nunca es de cero
+    return time.time() - entry.delta * beta * math.log(1 - random.random()) < entry.expiry
+
+
+def _acquire_lock(key):
+    """Lock no bloqueante; None si otro proceso ya está calculando"""
+    lock_timeout = getattr(settings, 'CACHE_LOCK_TIMEOUT', 30)
+    try:
+        lock = cache.lock(LOCK_KEY.format(key=key), timeout=lock_timeout)
+        return lock if lock.acquire(blocking=False) else None
+    except Exception as e:
+        # Sin Redis no hay coordinación posible: se calcula directo
+        logger.warning(f"No se pudo tomar el lock de cache {key}: {e}")
+        return False
+
+
+def _release_lock(lock):
+    try:
+        lock.release()
+    except Exception:
+        # Venció mientras se calculaba: ya no es nuestro
+        pass
+
+
+def _compute_and_store(key, full_key, compute, timeout, tags):
+    started = time.monotonic()
+    value = compute()
+    delta = time.monotonic() - started
+
+    entry = CachedValue(value, delta, time.time() + timeout)
+    stored_timeout = timeout + getattr(settings, 'CACHE_STALE_TTL', 300)
+    cache.set(full_key, entry, stored_timeout)
+    cache.set(STALE_KEY.format(key=key), entry, stored_timeout)
+
+    tags = tags(value) if callable(tags) else tags
+    if tags:
+        register_keys([full_key], tags, stored_timeout)
+    return value
+
+
+def get_or_compute(key, compute, timeout, *, namespaces=(), tags=(), beta=None):
+    """
+    Valor cacheado de `key` o el de `compute()` guardado por `timeout`
+    segundos.
+
+    Args:
+        key: Clave base (sin generación)
+        compute: Función sin argumentos que calcula el valor
+        timeout: Segundos que el valor se considera vigente
+        namespaces: Namespaces de generación de los que depende (ver cache_generations)
+        tags: Tags del índice (ver cache_tags), o función que los obtiene del valor
+        beta: Agresividad del refresco anticipado (CACHE_XFETCH_BETA; 0 lo desactiva)
+    """
+    if beta is None:
+        beta = getattr(settings, 'CACHE_XFETCH_BETA', 1.0)
+    full_key = namespaced_key(key, namespaces) if namespaces else key
+
+    entry = _read(full_key)
+    if entry is not None and _is_fresh(entry, beta):
+        return entry.value
+
+    lock = _acquire_lock(full_key)
+    if lock is False:
+        return _compute_and_store(key, full_key, compute, timeout, tags)
+
+    if lock is None:
+        # Otro proceso está calculando: valor viejo si hay, si no esperarlo
+        stale = entry or _read(STALE_KEY.format(key=key))
+        if stale is not None:
+            return stale.value
+
+        deadline = time.monotonic() + getattr(settings, 'CACHE_LOCK_WAIT', 5)
+        while time.monotonic() < deadline:
+            time.sleep(WAIT_INTERVAL)
+            entry = _read(full_key)
+            if entry is not None:
+                return entry.value
+        logger.warning(f"Se agotó la espera del cálculo de {full_key}, se calcula sin lock")
+        return _compute_and_store(key, full_key, compute, timeout, tags)
+
+    try:
+        # Pudo haberlo guardado quien tenía el lock justo antes
+        entry = _read(full_key)
+        if entry is not None and _is_fresh(entry, beta):
+            return entry.value
+        return _compute_and_store(key, full_key, compute, timeout, tags)
+    finally:
+        _release_lock(lock)
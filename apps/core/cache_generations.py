@@ -0,0 +1,54 @@
+"""
+Namespaces de cache con contador de generación
+
+Los caches de listados (home, listado de noticias, categorías, tags) se
+guardan bajo claves que incluyen la generación actual de cada namespace del
+que dependen:
+
+    home_data_es:home@4
+    queryset_post_list_es_..._page_2:news_list@17.category:maderas@3
+
+Invalidar un namespace es un INCR de su generación (O(1)): las claves
+viejas dejan de leerse y expiran solas con su timeout. El feed de noticias
+scrapeadas (apps.news.feed) usa los mismos contadores. Las generaciones se
+leen en cada request; con TwoTierRedisCache quedan en memoria del proceso
+y cada INCR se propaga por pub/sub (ver apps.core.cache_backends).
+
+Namespaces en uso: 'home', 'news_list', 'categories', 'tags',
+'category:<slug>', 'tag:<slug>' y 'news_feed:<fuente o all>'.
+"""
+from django.core.cache import cache
+
+GENERATION_KEY = 'cache:generation:{namespace}'
+
+
+def get_generations(namespaces):
+    """{namespace: generación} en una sola lectura (crea las que falten)"""
+    keys = {namespace: GENERATION_KEY.format(namespace=namespace) for namespace in namespaces}
+    found = cache.get_many(list(keys.values()))
+
+    generations = {}
+    for namespace, key in keys.items():
+        generation = found.get(key)
+        if generation is None:
+            cache.add(key, 1, None)
+            generation = cache.get(key) or 1
+        generations[namespace] = generation
+    return generations
+
+
+def bump_generation(*namespaces):
+    """Invalida todo lo cacheado bajo `namespaces`"""
+    for namespace in set(namespaces):
+        key = GENERATION_KEY.format(namespace=namespace)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # La clave no existía: cualquier valor nuevo sirve
+            cache.set(key, 2, None)
+
+
+def namespaced_key(key, namespaces):
+    """`key` con la generación actual de cada namespace"""
+    generations = get_generations(namespaces)
+    return f'{key}:' + '.'.join(f'{namespace}@{generations[namespace]}' for namespace in namespaces)
@@ -0,0 +1,116 @@
+"""
+Invalidación de cache diferida y agrupada
+
+Las vistas del panel no purgan el cache en la request: emiten un evento
+(tags del índice y namespaces de generación) con invalidate_cache(). Los
+eventos se acumulan en dos SET de Redis y el primero de cada ráfaga agenda
+la tarea flush_cache_invalidations con CACHE_INVALIDATION_WINDOW segundos
+de retraso; la tarea toma todo lo acumulado y purga cada tag (y sube cada
+generación) una sola vez, aunque la ráfaga haya tenido decenas de
+ediciones.
+
+Con CACHE_INVALIDATION_ASYNC = False, con sync=True o si no se puede
+encolar (Redis o el broker caídos), la invalidación se aplica en el momento.
+"""
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django_redis import get_redis_connection
+
+from apps.core.cache_generations import bump_generation
+from apps.core.cache_tags import invalidate_tags
+
+logger = logging.getLogger(__name__)
+
+PENDING_TAGS_KEY = 'cache:invalidation:tags'
+PENDING_NAMESPACES_KEY = 'cache:invalidation:namespaces'
+SCHEDULED_KEY = 'cache:invalidation:scheduled'
+
+# Toma y vacía los pendientes en un paso: lo que llegue después queda para la próxima pasada
+POP_PENDING_LUA = """
+local tags = redis.call('SMEMBERS', KEYS[1])
+local namespaces = redis.call('SMEMBERS', KEYS[2])
+redis.call('DEL', KEYS[1], KEYS[2])
+return {tags, namespaces}
+"""
+
+_pop_script = None
+
+
+def _decode(values):
+    return [value.decode('utf-8') if isinstance(value, bytes) else value for value in values]
+
+
+def apply_invalidation(tags=(), namespaces=()):
+    """Invalida en el momento. Retorna cuántas claves borró"""
+    if namespaces:
+        bump_generation(*namespaces)
+    return invalidate_tags(*tags)
+
+
+def invalidate_cache(tags=(), namespaces=(), sync=None):
+    """
+    Invalida `tags` (ver cache_tags) y `namespaces` (ver cache_generations).
+    Por defecto encola y retorna 0; en modo síncrono retorna cuántas
+    claves borró.
+    """
+    tags, namespaces = set(tags), set(namespaces)
+    if not tags and not namespaces:
+        return 0
+    if sync is None:
+        sync = not getattr(settings, 'CACHE_INVALIDATION_ASYNC', True)
+
+    if not sync:
+        try:
+            enqueue_invalidation(tags, namespaces)
+            return 0
+        except Exception as e:
+            logger.warning(f"No se pudo encolar la invalidación, se aplica ahora: {e}")
+    return apply_invalidation(tags, namespaces)
+
+
+def enqueue_invalidation(tags, namespaces):
+    """Acumula el evento y agenda la purga si es el primero de la ráfaga"""
+    window = getattr(settings, 'CACHE_INVALIDATION_WINDOW', 5)
+    redis_conn = get_redis_connection('default')
+
+    pipe = redis_conn.pipeline(transaction=False)
+    for key, members in ((PENDING_TAGS_KEY, tags), (PENDING_NAMESPACES_KEY, namespaces)):
+        if members:
+            pipe.sadd(cache.make_key(key), *members)
+            # Por si el worker no corre: que no se acumulen para siempre
+            pipe.expire(cache.make_key(key), 60 * 60)
+    pipe.execute()
+
+    # Expira solo si la tarea nunca llega a correr
+    scheduled_key = cache.make_key(SCHEDULED_KEY)
+    if not redis_conn.set(scheduled_key, 1, nx=True, ex=window * 10 + 60):
+        return
+
+    from apps.core.tasks import flush_cache_invalidations
+    try:
+        flush_cache_invalidations.apply_async(countdown=window)
+    except Exception:
+        redis_conn.delete(scheduled_key)
+        raise
+
+
+def flush_pending_invalidations():
+    """
+    Aplica todo lo acumulado. Retorna (tags, namespaces, claves borradas).
+    Corre dentro de flush_cache_invalidations.
+    """
+    global _pop_script
+    redis_conn = get_redis_connection('default')
+    # Antes de tomar los pendientes: un evento nuevo agenda otra pasada
+    redis_conn.delete(cache.make_key(SCHEDULED_KEY))
+
+    if _pop_script is None:
+        _pop_script = redis_conn.register_script(POP_PENDING_LUA)
+    tags, namespaces = _pop_script(
+        keys=[cache.make_key(PENDING_TAGS_KEY), cache.make_key(PENDING_NAMESPACES_KEY)],
+        client=redis_conn,
+    )
+    tags, namespaces = _decode(tags), _decode(namespaces)
+    return tags, namespaces, apply_invalidation(tags, namespaces)
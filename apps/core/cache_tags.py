@@ -0,0 +1,170 @@
+"""
+Índice de dependencias del cache por tags
+
+Cada valor cacheado registra de qué depende con tags ('post:12',
+'category:3', 'tag:7', 'list:news', 'lang:es', ...). Por cada tag hay un
+SET en Redis con las claves completas (prefijo y versión incluidos) que lo
+usan:
+
+    pymemad:cache:tag:post:12 -> {pymemad:1:post_detail_..., pymemad:1:views.decorators.cache.cache_page...}
+
+Invalidar un tag borra exactamente esas claves y el SET, en un script Lua
+(atómico: una clave registrada mientras se invalida no queda huérfana).
+El costo es O(claves afectadas), sin recorrer el keyspace con SCAN.
+
+Las páginas completas (cache de Django por middleware o cache_page) se
+registran al guardarse: siempre con 'page' y 'lang:<idioma>', más los tags
+que la vista agregó con add_cache_tags(request, ...).
+
+Los SET se quedan con miembros de claves ya expiradas; prune_tag_index()
+los limpia (tarea cleanup_orphaned_cache).
+"""
+import logging
+
+from django.core.cache import cache
+from django.middleware.cache import CacheMiddleware
+from django.utils.cache import get_cache_key
+from django.utils.decorators import decorator_from_middleware_with_args
+from django.utils.translation import get_language
+from django_redis import get_redis_connection
+
+logger = logging.getLogger(__name__)
+
+TAG_KEY = 'cache:tag:{tag}'
+# Todos los tags con claves registradas, para poder podarlos sin SCAN
+TAG_REGISTRY_KEY = 'cache:tags'
+# Los SET duran al menos lo que la clave más larga que contienen
+MIN_TAG_TTL = 60 * 60 * 24
+
+INVALIDATE_TAGS_LUA = """
+local deleted = 0
+for _, tag_key in ipairs(KEYS) do
+    local members = redis.call('SMEMBERS', tag_key)
+    for i = 1, #members, 500 do
+        deleted = deleted + redis.call('UNLINK', unpack(members, i, math.min(i + 499, #members)))
+    end
+    redis.call('DEL', tag_key)
+end
+return deleted
+"""
+
+_invalidate_script = None
+
+
+def _tag_key(tag):
+    return cache.make_key(TAG_KEY.format(tag=tag))
+
+
+def register_keys(keys, tags, timeout=None):
+    """
+    Registra claves de cache (sin prefijo, como se usan con `cache`) bajo
+    cada uno de `tags`. Un fallo de Redis no interrumpe la respuesta.
+    """
+    keys = [cache.make_key(key) for key in keys if key]
+    tags = {tag for tag in tags if tag}
+    if not keys or not tags:
+        return
+
+    ttl = max(MIN_TAG_TTL, int(timeout or 0))
+    try:
+        pipe = get_redis_connection('default').pipeline(transaction=False)
+        for tag in tags:
+            tag_key = _tag_key(tag)
+            pipe.sadd(tag_key, *keys)
+            pipe.expire(tag_key, ttl)
+        pipe.sadd(cache.make_key(TAG_REGISTRY_KEY), *tags)
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f"No se pudieron registrar tags de cache {sorted(tags)}: {e}")
+
+
+def set_tagged(key, value, timeout, tags):
+    """cache.set() registrando la clave bajo `tags`"""
+    cache.set(key, value, timeout)
+    register_keys([key], tags, timeout)
+
+
+def invalidate_tags(*tags):
+    """Borra todas las claves registradas bajo `tags`. Retorna cuántas borró"""
+    global _invalidate_script
+    tags = sorted({tag for tag in tags if tag})
+    if not tags:
+        return 0
+
+    redis_conn = get_redis_connection('default')
+    if _invalidate_script is None:
+        _invalidate_script = redis_conn.register_script(INVALIDATE_TAGS_LUA)
+    deleted = int(_invalidate_script(keys=[_tag_key(tag) for tag in tags], client=redis_conn))
+    logger.debug(f"Tags de cache invalidados {tags}: {deleted} claves")
+    return deleted
+
+
+def prune_tag_index():
+    """
+    Quita de los SET de tags las claves que ya expiraron y olvida los tags
+    vacíos. Retorna cuántas referencias quitó.
+    """
+    redis_conn = get_redis_connection('default')
+    registry_key = cache.make_key(TAG_REGISTRY_KEY)
+    removed = 0
+
+    for raw_tag in redis_conn.smembers(registry_key):
+        tag = raw_tag.decode('utf-8') if isinstance(raw_tag, bytes) else raw_tag
+        tag_key = _tag_key(tag)
+        members = list(redis_conn.sscan_iter(tag_key, count=500))
+        for start in range(0, len(members), 500):
+            chunk = members[start:start + 500]
+            pipe = redis_conn.pipeline(transaction=False)
+            for member in chunk:
+                pipe.exists(member)
+            expired = [member for member, exists in zip(chunk, pipe.execute()) if not exists]
+            if expired:
+                removed += redis_conn.srem(tag_key, *expired)
+        if not redis_conn.exists(tag_key):
+            redis_conn.srem(registry_key, raw_tag)
+
+    return removed
+
+
+def add_cache_tags(request, *tags):
+    """Tags extra para la página que se está generando (ver register_page)"""
+    if not hasattr(request, 'cache_tags'):
+        request.cache_tags = set()
+    request.cache_tags.update(tags)
+
+
+def register_page(request, response, middleware):
+    """
+    Registra la página que `middleware` (UpdateCacheMiddleware o el de
+    cache_page) acaba de cachear bajo 'page', 'lang:<idioma>' y los tags
+    de la vista.
+    """
+    if not getattr(request, '_cache_update_cache', False) or response.status_code != 200:
+        return
+    if middleware.cache_alias != 'default':
+        # El índice vive en el cache por defecto
+        return
+
+    cache_key = get_cache_key(request, middleware.key_prefix, request.method, cache=middleware.cache)
+    if cache_key is None:
+        return
+    tags = {'page', f'lang:{get_language()}', *getattr(request, 'cache_tags', ())}
+    register_keys([cache_key], tags, middleware.page_timeout or middleware.cache_timeout)
+
+
+class TaggedCacheMiddleware(CacheMiddleware):
+    """CacheMiddleware (el de cache_page) que registra la página en el índice"""
+
+    def process_response(self, request, response):
+        response = super().process_response(request, response)
+        register_page(request, response, self)
+        return response
+
+
+def tagged_cache_page(timeout, *, cache=None, key_prefix=None):
+    """Igual que django.views.decorators.cache.cache_page, con registro de tags"""
+    return decorator_from_middleware_with_args(TaggedCacheMiddleware)(
+        page_timeout=timeout,
+        cache_alias=cache,
+        key_prefix=key_prefix,
+    )
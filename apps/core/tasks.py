@@ -11,6 +11,7 @@ from parler.utils.context import switch_language
 import logging
 from datetime import timedelta
 
+from apps.core.cache_tags import prune_tag_index
 from apps.landing.models import Category, Post
 
 logger = logging.getLogger(__name__)
@@ -332,7 +333,10 @@ def cleanup_orphaned_cache():
             if cursor == 0:
                 break
 
-        result = f"Cache huérfano limpiado: {orphaned} entradas"
+        # Referencias del índice de tags a claves que ya expiraron
+        pruned = prune_tag_index()
+
+        result = f"Cache huérfano limpiado: {orphaned} entradas, {pruned} referencias de tags"
         logger.info(result)
         return result
 
@@ -341,6 +345,17 @@ def cleanup_orphaned_cache():
         return "Error limpiando cache huérfano"
 
 
+@shared_task(queue='short_tasks')
+def flush_cache_invalidations():
+    """Purga en una sola pasada las invalidaciones de cache acumuladas (ver cache_invalidation)"""
+    from apps.core.cache_invalidation import flush_pending_invalidations
+
+    tags, namespaces, deleted = flush_pending_invalidations()
+    result = f"Cache invalidado: {len(tags)} tags, {len(namespaces)} namespaces, {deleted} claves"
+    logger.info(result)
+    return result
+
+
 @shared_task(queue='short_tasks')
 def comprehensive_cache_warm():
     """Calentamiento completo del cache - ejecutar cada 30 minutos"""
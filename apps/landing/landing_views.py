@@ -2,39 +2,36 @@ from django.shortcuts import render, redirect
 from django.utils.translation import gettext as _, get_language
 from django.views import View
 from django.http import JsonResponse
-from django.views.decorators.cache import cache_page, never_cache
+from django.views.decorators.cache import never_cache
 from django.views.decorators.vary import vary_on_headers
 from django.utils.decorators import method_decorator
-from django.core.cache import cache
 from django.conf import settings
 from django.urls import reverse
 from captcha.models import CaptchaStore
 from captcha.helpers import captcha_image_url
+from apps.core.cache_compute import get_or_compute
+from apps.core.cache_tags import add_cache_tags, tagged_cache_page
 from apps.landing.models import Post
 from apps.landing.forms import ContactForm
 
 
 # ========== VISTA HOME OPTIMIZADA ========== #
-@method_decorator(cache_page(settings.CACHE_TIMES.get('home', 3600)), name='dispatch')
+@method_decorator(tagged_cache_page(settings.CACHE_TIMES.get('home', 3600)), name='dispatch')
 @method_decorator(vary_on_headers('Accept-Language'), name='dispatch')
 class HomeView(View):
     def get(self, request, *args, **kwargs):
         language = get_language()  # obtiene el idioma activo del usuario
 
-        # Cache key para datos del home
-        cache_key = f'home_data_{language}'
-        context_data = cache.get(cache_key)
-
-        if context_data is None:
+        def get_home_data():
             # Obtener los últimos 3 posts publicados
             latest_posts = Post.published.all().select_related('author', 'category').prefetch_related('translations', 'tags')[:3]
-            
-            context_data = {
+            return {
                 'latest_posts': list(latest_posts),
             }
-            
-            # Cachear por 1 hora
-            cache.set(cache_key, context_data, 60 * 60)
+
+        # Datos del home, cacheados por 1 hora
+        context_data = get_or_compute(f'home_data_{language}', get_home_data, 60 * 60, namespaces=['home'])
+        add_cache_tags(request, 'list:news', 'page:home')
 
         # Obtener el host y esquema
         scheme = self.request.scheme
@@ -95,6 +92,8 @@ class MembersView(View):
         context = {
             'canonical_url': canonical_url,
         }
+        # Los invalida SmartCacheInvalidationMiddleware al editar miembros
+        add_cache_tags(request, 'list:members', 'list:directory')
 
         return render(request, 'members_directory.html', context)
 
@@ -143,6 +142,7 @@ class MagazineView(View):
         context = {
             'canonical_url': canonical_url,
         }
+        add_cache_tags(request, 'list:magazine')
 
         return render(request, 'magazine.html', context)
 
@@ -10,17 +10,19 @@ from django.http import HttpResponseRedirect, Http404, JsonResponse
 from django.urls import reverse
 from django.utils.decorators import method_decorator
 from django.utils.translation import gettext as _, get_language
-from django.views.decorators.cache import cache_page, never_cache
+from django.views.decorators.cache import never_cache
 from django.views.decorators.vary import vary_on_headers
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST
 from django.views.generic import ListView, DetailView, CreateView
 
+from apps.core.cache_compute import get_or_compute
+from apps.core.cache_tags import add_cache_tags, tagged_cache_page
 from apps.landing.forms import CommentForm
 from apps.landing.models import Post, Category, Tag, Comment
 
 
-@method_decorator(cache_page(settings.CACHE_TIMES.get('news_list', 1800)), name='dispatch')
+@method_decorator(tagged_cache_page(settings.CACHE_TIMES.get('news_list', 1800)), name='dispatch')
 @method_decorator(vary_on_headers('Accept-Language', 'X-Requested-With'), name='dispatch')
 class PostListView(ListView):
     """Vista de lista de posts con cache y queries optimizadas"""
@@ -50,6 +52,17 @@ class PostListView(ListView):
 
         return '_'.join(filter(None, key_parts))
 
+    def get_cache_namespaces(self):
+        """Namespaces de generación de los que depende el listado filtrado"""
+        namespaces = ['news_list']
+        category_slug = self.request.GET.get('category', '')
+        tag_slug = self.kwargs.get('tag_slug', '')
+        if category_slug:
+            namespaces.append(f'category:{category_slug}')
+        if tag_slug:
+            namespaces.append(f'tag:{tag_slug}')
+        return namespaces
+
     def get_queryset(self):
         """Filtra publicaciones con cache de queries complejas"""
         # Inicializar atributos aquí porque necesitamos self.request
@@ -57,40 +70,7 @@ class PostListView(ListView):
         self.category = None
         self.search_query = self.request.GET.get('search', '').strip()
         self.invalid_filter = False
-
-        # Intentar obtener de cache primero
-        cache_key = f'queryset_{self.get_cache_key()}'
-        cached_ids = cache.get(cache_key)
-
-        if cached_ids is not None:
-            # Reconstruir el queryset desde los IDs cacheados con optimizaciones
-            return Post.objects.filter(
-                id__in=cached_ids
-            ).select_related(
-                'author',
-                'category'
-            ).prefetch_related(
-                'translations',
-                'tags',
-                'comments'  # Si necesitas contar comentarios
-            ).order_by('-publish')
-
-        # Si no está en cache, hacer la query normal
-        queryset = super().get_queryset()
-        current_lang = get_language()
-
-        # Optimizar con select_related y prefetch_related
-        queryset = queryset.select_related(
-            'author',  # Para evitar queries adicionales al acceder al autor
-            'category'  # Para evitar queries adicionales al acceder a la categoría
-        ).prefetch_related(
-            'translations',  # Para todas las traducciones
-            'tags',  # Para los tags
-            'comments'  # Si necesitas mostrar cantidad de comentarios
-        )
-
-        # Filtro base por idioma
-        queryset = queryset.translated(current_lang)
+        add_cache_tags(self.request, 'list:news')
 
         tag_slug = self.kwargs.get('tag_slug')
         category_slug = self.request.GET.get('category')
@@ -98,27 +78,12 @@ class PostListView(ListView):
         try:
             if category_slug:
                 self.category = Category.objects.get(slug=category_slug)
-                queryset = queryset.filter(category=self.category)
+                # Tags de la página completa (ver apps.core.cache_tags)
+                add_cache_tags(self.request, f'category:{self.category.pk}')
 
             if tag_slug:
                 self.tags = Tag.objects.get(slug=tag_slug)
-                queryset = queryset.filter(tags=self.tags)
-
-            if self.search_query:
-                queryset = queryset.filter(
-                    Q(translations__language_code=current_lang) & (
-                            Q(translations__title__icontains=self.search_query) |
-                            Q(translations__body__icontains=self.search_query)
-                    )
-                )
-
-            queryset = queryset.distinct()
-
-            # Cachear los IDs del resultado
-            post_ids = list(queryset.values_list('id', flat=True))
-            cache.set(cache_key, post_ids, 60 * 30)  # Cache por 30 minutos
-
-            return queryset
+                add_cache_tags(self.request, f'tag:{self.tags.pk}')
 
         except Category.DoesNotExist:
             self.invalid_filter = True
@@ -130,6 +95,50 @@ class PostListView(ListView):
             self.tags = None
             return Post.published.none()
 
+        # IDs del resultado, con la generación de cada namespace: editar un post la cambia
+        post_ids = get_or_compute(
+            f'queryset_{self.get_cache_key()}',
+            self.get_filtered_post_ids,
+            60 * 30,  # Cache por 30 minutos
+            namespaces=self.get_cache_namespaces(),
+        )
+
+        # Reconstruir el queryset desde los IDs cacheados con optimizaciones
+        return Post.objects.filter(
+            id__in=post_ids
+        ).select_related(
+            'author',  # Para evitar queries adicionales al acceder al autor
+            'category'  # Para evitar queries adicionales al acceder a la categoría
+        ).prefetch_related(
+            'translations',  # Para todas las traducciones
+            'tags',  # Para los tags
+            'comments'  # Si necesitas mostrar cantidad de comentarios
+        ).order_by('-publish')
+
+    def get_filtered_post_ids(self):
+        """IDs de los posts publicados que cumplen los filtros (la query cara)"""
+        queryset = super().get_queryset()
+        current_lang = get_language()
+
+        # Filtro base por idioma
+        queryset = queryset.translated(current_lang)
+
+        if self.category:
+            queryset = queryset.filter(category=self.category)
+
+        if self.tags:
+            queryset = queryset.filter(tags=self.tags)
+
+        if self.search_query:
+            queryset = queryset.filter(
+                Q(translations__language_code=current_lang) & (
+                        Q(translations__title__icontains=self.search_query) |
+                        Q(translations__body__icontains=self.search_query)
+                )
+            )
+
+        return list(queryset.distinct().values_list('id', flat=True))
+
     def get_context_data(self, **kwargs):
         """Agrega información adicional al contexto con cache"""
         context = super().get_context_data(**kwargs)
@@ -139,15 +148,15 @@ class PostListView(ListView):
         cache_key_categories = f'all_categories_{current_lang}'
         cache_key_tags = f'all_tags_{current_lang}'
 
-        categories = cache.get(cache_key_categories)
-        if categories is None:
-            categories = list(Category.objects.all())
-            cache.set(cache_key_categories, categories, 60 * 60 * 2)  # 2 horas
-
-        tags = cache.get(cache_key_tags)
-        if tags is None:
-            tags = list(Tag.objects.all())
-            cache.set(cache_key_tags, tags, 60 * 60 * 2)  # 2 horas
+        categories = get_or_compute(
+            cache_key_categories, lambda: list(Category.objects.all()), 60 * 60 * 2,  # 2 horas
+            namespaces=['categories'],
+        )
+        tags = get_or_compute(
+            cache_key_tags, lambda: list(Tag.objects.all()), 60 * 60 * 2,  # 2 horas
+            namespaces=['tags'],
+        )
+        add_cache_tags(self.request, 'list:categories', 'list:tags')
 
         # Construir URL canónica
         scheme = self.request.scheme
@@ -189,7 +198,7 @@ class PostListView(ListView):
 
 
 # Cache más largo para artículos (4 horas)
-@method_decorator(cache_page(settings.CACHE_TIMES.get('news_detail', 14400)), name='dispatch')
+@method_decorator(tagged_cache_page(settings.CACHE_TIMES.get('news_detail', 14400)), name='dispatch')
 @method_decorator(vary_on_headers('Accept-Language'), name='dispatch')
 class PostDetailView(DetailView):
     """Vista de detalle con cache agresivo y optimizaciones"""
@@ -206,18 +215,24 @@ class PostDetailView(DetailView):
         month = self.kwargs['month']
         day = self.kwargs['day']
 
-        # Cache key para este post específico
+        # Cache key para este post específico (también cachea la redirección)
         cache_key = f'post_detail_{year}_{month}_{day}_{slug}_{current_lang}'
-        cached_result = cache.get(cache_key)
+        post, redirect_url = get_or_compute(
+            cache_key,
+            lambda: self.find_post(year, month, day, slug, current_lang),
+            60 * 60 * 6,  # 6 horas
+            tags=lambda result: [f'post:{result[0].pk}'],
+        )
 
-        if cached_result:
-            if isinstance(cached_result, str) and cached_result.startswith('redirect:'):
-                # Es una redirección cacheada
-                return HttpResponseRedirect(cached_result.replace('redirect:', ''))
-            else:
-                # Es el post cacheado
-                return cached_result
+        if redirect_url:
+            return HttpResponseRedirect(redirect_url)
+        return post
 
+    def find_post(self, year, month, day, slug, current_lang):
+        """
+        Busca el post publicado ese día con ese slug en cualquier idioma.
+        Retorna (post, URL de redirección si el slug no es el del idioma actual)
+        """
         # Importar datetime y timezone de Chile
         from datetime import datetime
         chile_tz = pytz.timezone('America/Santiago')
@@ -281,13 +296,9 @@ class PostDetailView(DetailView):
                     'day': localized_publish.day,
                     'post': correct_slug
                 })
-                # Cachear la redirección
-                cache.set(cache_key, f'redirect:{redirect_url}', 60 * 60 * 24)  # 24 horas
-                return HttpResponseRedirect(redirect_url)
+                return post, redirect_url
 
-        # Cachear el post
-        cache.set(cache_key, post, 60 * 60 * 6)  # 6 horas
-        return post
+        return post, None
 
     def get(self, request, *args, **kwargs):
         """Maneja las redirecciones correctamente"""
@@ -304,12 +315,16 @@ class PostDetailView(DetailView):
         context = super().get_context_data(**kwargs)
         current_lang = get_language()
         post = self.object
+        # La página depende del post, de su categoría y de sus tags
+        add_cache_tags(self.request, f'post:{post.pk}')
+        if post.category_id:
+            add_cache_tags(self.request, f'category:{post.category_id}')
+        add_cache_tags(self.request, *(f'tag:{tag.pk}' for tag in post.tags.all()))
 
         # Cache de posts similares
         cache_key_similar = f'similar_posts_{post.pk}_{current_lang}'
-        similar_posts = cache.get(cache_key_similar)
 
-        if similar_posts is None:
+        def get_similar_posts():
             post_tags_ids = post.tags.values_list('id', flat=True)
             similar_posts = Post.published.filter(tags__in=post_tags_ids) \
                                 .exclude(id=post.id) \
@@ -317,18 +332,22 @@ class PostDetailView(DetailView):
                                 .order_by('-same_tags', '-publish')[:4] \
                                 .prefetch_related('translations', 'tags') \
                                 .select_related('author', 'category')
+            return list(similar_posts)  # Convertir a lista para cachear
 
-            similar_posts = list(similar_posts)  # Convertir a lista para cachear
-            cache.set(cache_key_similar, similar_posts, 60 * 60 * 2)  # 2 horas
+        similar_posts = get_or_compute(
+            cache_key_similar, get_similar_posts, 60 * 60 * 2,  # 2 horas
+            tags=lambda similar_posts: [f'post:{post.pk}', *(f'post:{similar.pk}' for similar in similar_posts)],
+        )
+        add_cache_tags(self.request, *(f'post:{similar.pk}' for similar in similar_posts))
 
         # Cache de tags populares
         cache_key_pop_tags = f'popular_tags_{current_lang}'
-        popular_tags = cache.get(cache_key_pop_tags)
-
-        if popular_tags is None:
-            # Usar el mismo approach que en tu vista original
-            popular_tags = list(Tag.objects.all()[:12])
-            cache.set(cache_key_pop_tags, popular_tags, 60 * 60 * 4)  # 4 horas
+        # Usar el mismo approach que en tu vista original
+        popular_tags = get_or_compute(
+            cache_key_pop_tags, lambda: list(Tag.objects.all()[:12]), 60 * 60 * 4,  # 4 horas
+            namespaces=['tags'],
+        )
+        add_cache_tags(self.request, 'list:tags')
 
         # Datos básicos del contexto
         context.update({
@@ -354,18 +373,21 @@ class PostDetailView(DetailView):
 
         # Posts anterior y siguiente (con cache)
         cache_key_nav = f'post_navigation_{post.pk}'
-        nav_posts = cache.get(cache_key_nav)
-
-        if nav_posts is None:
-            nav_posts = {
+        nav_posts = get_or_compute(
+            cache_key_nav,
+            lambda: {
                 'previous': Post.published.filter(
                     publish__lt=post.publish
                 ).order_by('-publish').first(),
                 'next': Post.published.filter(
                     publish__gt=post.publish
                 ).order_by('publish').first()
-            }
-            cache.set(cache_key_nav, nav_posts, 60 * 60)  # 1 hora
+            },
+            60 * 60,  # 1 hora
+            # Cambia si se publica o borra cualquier post
+            tags=[f'post:{post.pk}', 'list:news'],
+        )
+        add_cache_tags(self.request, *(f'post:{nav.pk}' for nav in nav_posts.values() if nav))
 
         context['previous_post'] = nav_posts['previous']
         context['next_post'] = nav_posts['next']
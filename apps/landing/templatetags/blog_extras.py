@@ -4,12 +4,13 @@ from django.db.models import Count, Q
 from django.utils.html import strip_tags
 from django.utils.translation import get_language
 from django.utils.safestring import mark_safe
-from django.core.cache import cache
 from django.conf import settings
 import re
 import markdown
 import html
 
+from apps.core.cache_compute import get_or_compute
+
 from ..models import Post, Category, Tag
 
 register = template.Library()
@@ -106,10 +107,8 @@ def get_categories_with_count():
     Obtiene todas las categorías con el conteo de posts publicados
     """
     current_lang = get_language()
-    cache_key = f'categories_with_count_{current_lang}'
 
-    categories = cache.get(cache_key)
-    if categories is None:
+    def count_categories():
         categories = Category.objects.annotate(
             post_count=Count(
                 'posts',
@@ -120,9 +119,12 @@ def get_categories_with_count():
                 distinct=True
             )
         ).filter(post_count__gt=0).order_by('-post_count')
-        cache.set(cache_key, list(categories), 60 * 60 * 2)  # Cache por 2 horas
+        return list(categories)
 
-    return categories
+    return get_or_compute(
+        f'categories_with_count_{current_lang}', count_categories, 60 * 60 * 2,  # Cache por 2 horas
+        namespaces=['categories', 'news_list'],
+    )
 
 
 @register.simple_tag
@@ -131,10 +133,8 @@ def get_popular_tags(count=15):
     Obtiene los tags más populares
     """
     current_lang = get_language()
-    cache_key = f'popular_tags_{current_lang}_{count}'
 
-    tags = cache.get(cache_key)
-    if tags is None:
+    def count_tags():
         tags = Tag.objects.annotate(
             post_count=Count(
                 'posts',
@@ -145,9 +145,12 @@ def get_popular_tags(count=15):
                 distinct=True
             )
         ).filter(post_count__gt=0).order_by('-post_count')[:count]
-        cache.set(cache_key, list(tags), 60 * 60 * 2)  # Cache por 2 horas
+        return list(tags)
 
-    return tags
+    return get_or_compute(
+        f'popular_tags_{current_lang}_{count}', count_tags, 60 * 60 * 2,  # Cache por 2 horas
+        namespaces=['tags', 'news_list'],
+    )
 
 
 @register.filter
@@ -0,0 +1,100 @@
+"""
+Feed de noticias scrapeadas con paginación por cursor y cache por generación
+
+Las páginas se recorren por (published_date, id) descendente: el cursor de
+la página siguiente codifica la última fila entregada y la consulta usa
+`WHERE (published_date, id) < cursor` sobre el índice, sin OFFSET, así que
+pedir la página 500 cuesta lo mismo que la primera.
+
+Cada página se cachea bajo una clave que incluye la generación del
+namespace 'news_feed:<ámbito>' (una fuente o 'all', ver
+apps.core.cache_generations). NewsWriter llama a invalidate_feed() cuando un
+lote guarda algo: las claves viejas dejan de usarse (expiran solas) y el
+ETag, derivado de la misma generación, cambia. Un cliente que consulta con
+If-None-Match recibe 304 con una sola lectura a Redis.
+"""
+import base64
+import hashlib
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+
+from apps.core.cache_generations import bump_generation, get_generations
+
+PAGE_KEY = 'news:feed:page:{scope}:g{generation}:{variant}'
+ALL_SOURCES = 'all'
+
+
+def feed_scope(source_id=None):
+    return str(source_id) if source_id else ALL_SOURCES
+
+
+def feed_namespace(scope):
+    return f'news_feed:{scope}'
+
+
+def get_generation(scope):
+    namespace = feed_namespace(scope)
+    return get_generations([namespace])[namespace]
+
+
+def invalidate_feed(source_id):
+    """Invalida las páginas del feed de la fuente y del feed general"""
+    bump_generation(feed_namespace(feed_scope(source_id)), feed_namespace(ALL_SOURCES))
+
+
+def encode_cursor(published_date, pk):
+    raw = f'{published_date.isoformat()}|{pk}'.encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """(published_date, id) del cursor, o None si no es válido"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode('utf-8')
+        published_date, pk = raw.rsplit('|', 1)
+        return datetime.fromisoformat(published_date), int(pk)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def page_variant(cursor, limit, include_duplicates):
+    raw = f'{cursor or "first"}:{limit}:{int(include_duplicates)}'
+    return hashlib.md5(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def page_etag(scope, generation, variant):
+    return f'W/"feed-{scope}-{generation}-{variant}"'
+
+
+def feed_page(queryset, cursor=None, limit=20):
+    """
+    Hasta `limit` noticias de `queryset` posteriores al cursor, más el
+    cursor de la página siguiente (None si no hay más).
+    """
+    queryset = queryset.filter(published_date__isnull=False)
+    if cursor:
+        published_date, pk = cursor
+        queryset = queryset.filter(
+            Q(published_date__lt=published_date) | Q(published_date=published_date, pk__lt=pk)
+        )
+
+    rows = list(queryset.order_by('-published_date', '-pk')[:limit + 1])
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].published_date, rows[-1].pk)
+    return rows, next_cursor
+
+
+def cached_feed_page(scope, variant, build):
+    """Página del feed desde cache, o construida con `build()` y guardada"""
+    generation = get_generation(scope)
+    key = PAGE_KEY.format(scope=scope, generation=generation, variant=variant)
+    payload = cache.get(key)
+    if payload is None:
+        payload = build()
+        cache.set(key, payload, settings.CACHE_TIMES.get('news_feed', 60 * 60))
+    return payload, page_etag(scope, generation, variant)
@@ -0,0 +1,97 @@
+"""
+Huellas SimHash para detectar noticias casi duplicadas
+
+La misma nota de agencia aparece en varios medios con cambios menores
+(título, firma, un párrafo extra). SimHash resume el texto en 64 bits de
+forma que textos parecidos difieren en pocos bits. La huella se divide en
+SIMHASH_BANDS bandas de 16 bits: si dos huellas difieren en menos de
+SIMHASH_BANDS bits, al menos una banda coincide exacta, así que la búsqueda
+de candidatos es una consulta por igualdad sobre columnas indexadas.
+"""
+import hashlib
+import re
+import unicodedata
+
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 4
+BAND_BITS = SIMHASH_BITS // SIMHASH_BANDS
+BAND_MASK = (1 << BAND_BITS) - 1
+
+# Palabras por shingle y mínimo de palabras para que la huella sea confiable
+SHINGLE_SIZE = 3
+MIN_WORDS = 40
+
+WORD_RE = re.compile(r'\w+')
+
+
+def normalize_words(text):
+    """Palabras en minúsculas y sin tildes"""
+    text = unicodedata.normalize('NFKD', text or '')
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    return WORD_RE.findall(text.lower())
+
+
+def simhash(text, min_words=MIN_WORDS):
+    """
+    Huella de 64 bits (sin signo) de `text`, o None si el texto es demasiado
+    corto para compararlo con otros.
+    """
+    words = normalize_words(text)
+    if len(words) < min_words:
+        return None
+
+    weights = {}
+    for index in range(len(words) - SHINGLE_SIZE + 1):
+        shingle = ' '.join(words[index:index + SHINGLE_SIZE])
+        weights[shingle] = weights.get(shingle, 0) + 1
+
+    vector = [0] * SIMHASH_BITS
+    for shingle, weight in weights.items():
+        value = int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(SIMHASH_BITS):
+            if value >> bit & 1:
+                vector[bit] += weight
+            else:
+                vector[bit] -= weight
+
+    fingerprint = 0
+    for bit, total in enumerate(vector):
+        if total > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a, b):
+    return bin((a ^ b) & ((1 << SIMHASH_BITS) - 1)).count('1')
+
+
+def bands(fingerprint):
+    """Las SIMHASH_BANDS bandas de 16 bits de la huella"""
+    return [(fingerprint >> (band * BAND_BITS)) & BAND_MASK for band in range(SIMHASH_BANDS)]
+
+
+def to_signed(fingerprint):
+    """Huella sin signo -> valor para un BigIntegerField (con signo)"""
+    if fingerprint is None:
+        return None
+    return fingerprint - (1 << SIMHASH_BITS) if fingerprint >= 1 << (SIMHASH_BITS - 1) else fingerprint
+
+
+def to_unsigned(value):
+    if value is None:
+        return None
+    return value & ((1 << SIMHASH_BITS) - 1)
+
+
+def news_fingerprint_fields(title, content):
+    """
+    Valores de los campos simhash* de News para un título y contenido.
+    Sin contenido suficiente todos quedan en None.
+    """
+    fingerprint = simhash(f"{title or ''} {content or ''}")
+    if fingerprint is None:
+        return {'simhash': None, **{f'simhash_band_{band}': None for band in range(SIMHASH_BANDS)}}
+    return {
+        'simhash': to_signed(fingerprint),
+        **{f'simhash_band_{band}': value for band, value in enumerate(bands(fingerprint))},
+    }
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from apps.news.models import News
+from apps.news.search import update_search_vectors
+
+
+class Command(BaseCommand):
+    help = 'Recalcula el índice de texto completo de las noticias (search_vector)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--missing',
+            action='store_true',
+            help='Solo las noticias que aún no tienen search_vector',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=2000,
+            help='Noticias por UPDATE',
+        )
+
+    def handle(self, *args, **options):
+        queryset = News.objects.all()
+        if options['missing']:
+            queryset = queryset.filter(search_vector__isnull=True)
+
+        ids = list(queryset.order_by('pk').values_list('pk', flat=True))
+        updated = 0
+        for start in range(0, len(ids), options['batch_size']):
+            batch = ids[start:start + options['batch_size']]
+            updated += update_search_vectors(News.objects.filter(pk__in=batch))
+            self.stdout.write(f"{updated}/{len(ids)} noticias indexadas")
+
+        self.stdout.write(self.style.SUCCESS(f"Índice de búsqueda actualizado: {updated} noticias"))
@@ -1,15 +1,50 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from apps.core.mixins import TimestampedModel
+from apps.news.fingerprints import SIMHASH_BANDS, news_fingerprint_fields
+from apps.news.search import SEARCH_FIELDS, SEARCH_VECTOR
 
 class NewsSource(TimestampedModel):
+    FETCH_AUTO = 'auto'
+    FETCH_STATIC = 'static'
+    FETCH_BROWSER = 'browser'
+    FETCH_MODE_CHOICES = [
+        (FETCH_AUTO, _('Automático')),
+        (FETCH_STATIC, _('HTTP sin navegador')),
+        (FETCH_BROWSER, _('Navegador')),
+    ]
+
     name = models.CharField(max_length=100, unique=True)
     base_url = models.URLField()
     is_active = models.BooleanField(default=True)
+    detail_fetch_mode = models.CharField(
+        max_length=10,
+        choices=FETCH_MODE_CHOICES,
+        default=FETCH_AUTO,
+        help_text=_("Cómo descargar el detalle de las noticias (se aprende en cada corrida)"),
+    )
+    scrape_interval = models.PositiveIntegerField(
+        default=60,
+        help_text=_("Minutos entre corridas programadas (se ajusta según las noticias que trae)"),
+    )
+    next_scrape_at = models.DateTimeField(null=True, blank=True)
+    # Circuit breaker (ver apps.scrapers.throttle)
+    consecutive_failures = models.PositiveIntegerField(default=0)
+    circuit_open_until = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text=_("Mientras no pase esta fecha las corridas se saltan por fallas repetidas"),
+    )
+    circuit_trips = models.PositiveIntegerField(default=0, help_text=_("Veces seguidas que se abrió el circuito"))
     
     def __str__(self):
         return self.name
+
+    def is_circuit_open(self, now=None):
+        return bool(self.circuit_open_until and self.circuit_open_until > (now or timezone.now()))
     
     class Meta:
         verbose_name = _("Fuente de Noticias")
@@ -26,9 +61,41 @@ class News(models.Model):
     image_url = models.URLField(blank=True, null=True)
     author = models.CharField(max_length=200, blank=True)
     is_pymemad_related = models.BooleanField(default=True)
+    # Huella SimHash del título + contenido y sus bandas de 16 bits (ver apps.news.fingerprints)
+    simhash = models.BigIntegerField(null=True, blank=True, editable=False)
+    simhash_band_0 = models.IntegerField(null=True, blank=True, editable=False)
+    simhash_band_1 = models.IntegerField(null=True, blank=True, editable=False)
+    simhash_band_2 = models.IntegerField(null=True, blank=True, editable=False)
+    simhash_band_3 = models.IntegerField(null=True, blank=True, editable=False)
+    duplicate_of = models.ForeignKey(
+        'self',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='duplicates',
+        help_text=_("Noticia representante de la misma historia (vacío si esta es la representante)"),
+    )
+    # Texto completo (ver apps.news.search); se calcula en la BD
+    search_vector = SearchVectorField(null=True, blank=True, editable=False)
     
     def __str__(self):
         return f"{self.source.name}: {self.title}"
+
+    def update_fingerprint(self):
+        for field, value in news_fingerprint_fields(self.title, self.content).items():
+            setattr(self, field, value)
+
+    def save(self, *args, **kwargs):
+        self.update_fingerprint()
+        super().save(*args, **kwargs)
+        update_fields = kwargs.get('update_fields')
+        # Sin cambios de texto (p. ej. solo is_pymemad_related) el vector sigue igual
+        if update_fields is None or set(update_fields) & set(SEARCH_FIELDS):
+            News.objects.filter(pk=self.pk).update(search_vector=SEARCH_VECTOR)
+
+    @property
+    def is_representative(self):
+        return self.duplicate_of_id is None
     
     class Meta:
         verbose_name = _("Noticia")
@@ -37,6 +104,9 @@ class News(models.Model):
         indexes = [
             models.Index(fields=['url']),
             models.Index(fields=['source', '-published_date']),
+            models.Index(fields=['-published_date', '-id']),  # Cursor del feed (apps.news.feed)
+            *[models.Index(fields=[f'simhash_band_{band}']) for band in range(SIMHASH_BANDS)],
+            GinIndex(fields=['search_vector'], name='news_search_vector_gin'),
         ]
 
 class ScrapingLog(TimestampedModel):
@@ -44,10 +114,21 @@ class ScrapingLog(TimestampedModel):
     finished_at = models.DateTimeField(null=True, blank=True)
     news_found = models.IntegerField(default=0)
     news_saved = models.IntegerField(default=0)
+    news_created = models.IntegerField(default=0)
+    news_updated = models.IntegerField(default=0)
+    news_duplicates = models.IntegerField(default=0, help_text=_("Noticias marcadas como copia de otra ya guardada"))
+    news_failed = models.IntegerField(default=0, help_text=_("Noticias de lotes que no se pudieron guardar"))
+    wait_seconds = models.FloatField(default=0, help_text=_("Segundos esperando cargas del navegador"))
+    metrics = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text=_("Segundos por fase, bytes y páginas de la corrida (ver apps.scrapers.metrics)"),
+    )
     status = models.CharField(max_length=20, choices=[
         ('running', _('En proceso')),
         ('completed', _('Completado')),
         ('failed', _('Fallido')),
+        ('skipped', _('Omitido')),
     ], default='running')
     error_message = models.TextField(blank=True)
     
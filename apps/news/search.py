@@ -0,0 +1,45 @@
+"""
+Búsqueda de texto completo sobre News (Postgres, configuración 'spanish')
+
+News.search_vector guarda el tsvector ponderado de título (A), bajada (B) y
+contenido (C) y tiene un índice GIN. Se actualiza en News.save() (salvo
+con update_fields que no incluyan SEARCH_FIELDS) y, para
+los lotes del scraper, con update_search_vectors() después del upsert.
+"""
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import F
+
+SEARCH_CONFIG = 'spanish'
+# Campos que entran en search_vector
+SEARCH_FIELDS = ('title', 'excerpt', 'content')
+
+SEARCH_VECTOR = (
+    SearchVector('title', weight='A', config=SEARCH_CONFIG)
+    + SearchVector('excerpt', weight='B', config=SEARCH_CONFIG)
+    + SearchVector('content', weight='C', config=SEARCH_CONFIG)
+)
+
+
+def update_search_vectors(queryset):
+    """Recalcula search_vector en la BD para las noticias de `queryset`"""
+    return queryset.update(search_vector=SEARCH_VECTOR)
+
+
+def search_news(queryset, text, source=None, date_from=None, date_to=None):
+    """
+    Noticias de `queryset` que calzan con `text` (sintaxis tipo buscador:
+    "frase exacta", -excluir, OR), ordenadas por relevancia y fecha.
+    """
+    query = SearchQuery(text, config=SEARCH_CONFIG, search_type='websearch')
+    queryset = queryset.filter(search_vector=query)
+
+    if source:
+        queryset = queryset.filter(source__name__iexact=source)
+    if date_from:
+        queryset = queryset.filter(published_date__gte=date_from)
+    if date_to:
+        queryset = queryset.filter(published_date__lt=date_to)
+
+    return queryset.annotate(
+        rank=SearchRank(F('search_vector'), query),
+    ).order_by('-rank', '-published_date')
@@ -0,0 +1,9 @@
+from django.urls import path
+from apps.news import views
+
+app_name = 'news'
+
+urlpatterns = [
+    path('search/', views.NewsSearchView.as_view(), name='search'),
+    path('feed/', views.NewsFeedView.as_view(), name='feed'),
+]
@@ -1,3 +1,158 @@
-from django.shortcuts import render
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.paginator import EmptyPage, Paginator
+from django.http import HttpResponseNotModified, JsonResponse
+from django.utils.cache import patch_cache_control
+from django.utils.dateparse import parse_date
+from django.views import View
 
-# Create your views here.
+from apps.news.feed import (
+    cached_feed_page, decode_cursor, feed_page, feed_scope, get_generation, page_etag, page_variant,
+)
+from apps.news.models import News, NewsSource
+from apps.news.search import search_news
+from apps.permissions.mixins import ACLPermissionMixin
+
+
+class NewsSearchView(ACLPermissionMixin, LoginRequiredMixin, View):
+    """
+    Búsqueda de texto completo en las noticias scrapeadas (JSON).
+
+    Parámetros GET:
+        q            texto a buscar (requerido; admite "frase", -palabra, OR)
+        source       nombre de la fuente
+        date_from    AAAA-MM-DD (inclusive)
+        date_to      AAAA-MM-DD (exclusive)
+        duplicates   1 para incluir las copias de una misma historia
+        page, page_size (máximo 100)
+    """
+    module_code = 'dashboard'
+    required_action = 'view'
+    max_page_size = 100
+
+    def get(self, request, *args, **kwargs):
+        text = request.GET.get('q', '').strip()
+        if not text:
+            return JsonResponse({'error': 'El parámetro q es requerido'}, status=400)
+
+        try:
+            page_size = min(self.max_page_size, max(1, int(request.GET.get('page_size', 20))))
+            page_number = max(1, int(request.GET.get('page', 1)))
+        except ValueError:
+            return JsonResponse({'error': 'page y page_size deben ser números'}, status=400)
+
+        queryset = News.objects.select_related('source').defer('content', 'search_vector')
+        if request.GET.get('duplicates') != '1':
+            queryset = queryset.filter(duplicate_of__isnull=True)
+
+        results = search_news(
+            queryset,
+            text,
+            source=request.GET.get('source'),
+            date_from=parse_date(request.GET.get('date_from', '')),
+            date_to=parse_date(request.GET.get('date_to', '')),
+        )
+
+        paginator = Paginator(results, page_size)
+        try:
+            page = paginator.page(page_number)
+        except EmptyPage:
+            page = None
+
+        return JsonResponse({
+            'query': text,
+            'count': paginator.count,
+            'page': page_number,
+            'num_pages': paginator.num_pages,
+            'results': [
+                {
+                    'id': news.pk,
+                    'title': news.title,
+                    'url': news.url,
+                    'source': news.source.name,
+                    'excerpt': news.excerpt,
+                    'published_date': news.published_date.isoformat() if news.published_date else None,
+                    'rank': round(news.rank, 4),
+                    'duplicate_of': news.duplicate_of_id,
+                }
+                for news in (page.object_list if page else [])
+            ],
+        })
+
+
+class NewsFeedView(ACLPermissionMixin, LoginRequiredMixin, View):
+    """
+    Feed JSON de noticias scrapeadas, de la más reciente a la más antigua,
+    paginado por cursor (ver apps.news.feed).
+
+    Parámetros GET:
+        source       nombre de la fuente (por defecto, todas)
+        cursor       valor 'next_cursor' de la página anterior
+        limit        noticias por página (máximo 100)
+        duplicates   1 para incluir las copias de una misma historia
+
+    Responde ETag; con If-None-Match vigente retorna 304 sin tocar la BD.
+    """
+    module_code = 'dashboard'
+    required_action = 'view'
+    max_limit = 100
+
+    def get(self, request, *args, **kwargs):
+        try:
+            limit = min(self.max_limit, max(1, int(request.GET.get('limit', 20))))
+        except ValueError:
+            return JsonResponse({'error': 'limit debe ser un número'}, status=400)
+
+        cursor_value = request.GET.get('cursor') or None
+        cursor = decode_cursor(cursor_value) if cursor_value else None
+        if cursor_value and cursor is None:
+            return JsonResponse({'error': 'cursor inválido'}, status=400)
+
+        source_id = None
+        source_name = request.GET.get('source')
+        if source_name:
+            source_id = NewsSource.objects.filter(name__iexact=source_name).values_list('pk', flat=True).first()
+            if source_id is None:
+                return JsonResponse({'error': f'Fuente no encontrada: {source_name}'}, status=404)
+
+        include_duplicates = request.GET.get('duplicates') == '1'
+        scope = feed_scope(source_id)
+        variant = page_variant(cursor_value, limit, include_duplicates)
+
+        etag = page_etag(scope, get_generation(scope), variant)
+        if etag in request.headers.get('If-None-Match', ''):
+            response = HttpResponseNotModified()
+        else:
+            payload, etag = cached_feed_page(
+                scope, variant,
+                lambda: self.build_page(source_id, cursor, limit, include_duplicates),
+            )
+            response = JsonResponse(payload)
+
+        response['ETag'] = etag
+        patch_cache_control(response, private=True, max_age=0, must_revalidate=True)
+        return response
+
+    def build_page(self, source_id, cursor, limit, include_duplicates):
+        queryset = News.objects.select_related('source').defer('content', 'search_vector')
+        if source_id:
+            queryset = queryset.filter(source_id=source_id)
+        if not include_duplicates:
+            queryset = queryset.filter(duplicate_of__isnull=True)
+
+        rows, next_cursor = feed_page(queryset, cursor=cursor, limit=limit)
+        return {
+            'results': [
+                {
+                    'id': news.pk,
+                    'title': news.title,
+                    'url': news.url,
+                    'source': news.source.name,
+                    'excerpt': news.excerpt,
+                    'image_url': news.image_url,
+                    'published_date': news.published_date.isoformat(),
+                    'duplicate_of': news.duplicate_of_id,
+                }
+                for news in rows
+            ],
+            'next_cursor': next_cursor,
+        }
@@ -1161,7 +1161,7 @@ class PostClearCacheView(ACLPermissionMixin, LoginRequiredMixin, View):
                 }, status=403)
 
             # Limpiar cache del post
-            deleted_count = clear_cache_for_post(post, deep_clean=True)
+            deleted_count = clear_cache_for_post(post, deep_clean=True, sync=True)
 
             # Limpiar cache del panel también
             panel_deleted = clear_panel_cache()
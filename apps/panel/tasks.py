@@ -88,7 +88,7 @@ def generate_post_translations_task(post_id, user_id):
         logger.info(f"Post {post_id} actualizado - Limpiando cache completamente...")
 
         # Limpiar cache del post con deep clean
-        deleted_post = clear_cache_for_post(post, deep_clean=True)
+        deleted_post = clear_cache_for_post(post, deep_clean=True, sync=True)
 
         # Limpiar cache del panel
         deleted_panel = clear_panel_cache()
@@ -18,15 +18,14 @@ from bs4 import BeautifulSoup
 # IMPORTACIONES DE DJANGO
 # =====================================================================
 from django.conf import settings
-from django.core.cache import cache
 from django.core.mail import EmailMessage
 from django_redis import get_redis_connection
-from parler.utils.context import switch_language
 from typing import Union, IO # para save_file_to_s3
 from datetime import datetime # para save_file_to_s3
 # =====================================================================
 # IMPORTACIONES LOCALES
 # =====================================================================
+from apps.core.cache_invalidation import invalidate_cache
 
 
 # =====================================================================
@@ -193,169 +192,73 @@ def send_translation_error_email(user_email, post_id, error_message):
 # =====================================================================
 # =====================================================================
 
-def clear_cache_for_post(post, deep_clean=True):
+def post_cache_tags(post, deep_clean=True):
     """
-    Limpia TODO el cache relacionado con un post, incluyendo:
-    - Cache de vistas
-    - Cache de traducciones
-    - Cache del middleware
-    - Cache de componentes
-    - Cache del panel de administración
-    
-    Args:
-        post: Instancia del post
-        deep_clean (bool): Si realizar limpieza profunda
-        
-    Returns:
-        int: Número de claves eliminadas
+    Tags de cache que dependen de un post (ver apps.core.cache_tags): su
+    detalle, los listados y las páginas de su categoría y tags.
     """
-    try:
-        deleted_count = 0
-        redis_conn = get_redis_connection("default")
-        prefix = settings.CACHES['default'].get('KEY_PREFIX', '')
+    tags = [f'post:{post.pk}', 'list:news']
+    if post.category_id:
+        tags.append(f'category:{post.category_id}')
+    tags.extend(f'tag:{tag_id}' for tag_id in post.tags.values_list('id', flat=True))
 
-        # 1. Limpiar cache específico del post por ID
-        patterns_to_clear = [
-            f"{prefix}:*post_{post.pk}*",
-            f"{prefix}:*post-{post.pk}*",
-            f"{prefix}:*post:{post.pk}*",
-            f"{prefix}:*post/{post.pk}*",
-            f"{prefix}:*post_{post.pk}_*",
-            f"{prefix}:*postdetail*{post.pk}*",
-            f"{prefix}:*detail*{post.pk}*",
-        ]
+    if deep_clean:
+        # Conteos por categoría/tag de la barra lateral
+        tags.extend(['list:categories', 'list:tags'])
+    return tags
 
-        # 2. Limpiar cache de las URLs del post en todos los idiomas
-        for lang_code, _ in settings.LANGUAGES:
-            try:
-                with switch_language(post, lang_code):
-                    if post.slug and post.publish:
-                        # URL patterns del post
-                        year = post.publish.year
-                        month = post.publish.month
-                        day = post.publish.day
-
-                        # Diferentes formatos de URL que podrían estar cacheados
-                        url_patterns = [
-                            f"*/{lang_code}/noticias/{year}/{month:02d}/{day:02d}/{post.slug}*",
-                            f"*/noticias/{year}/{month:02d}/{day:02d}/{post.slug}*",
-                            f"*/{lang_code}/news/{year}/{month:02d}/{day:02d}/{post.slug}*",
-                        ]
-
-                        for url_pattern in url_patterns:
-                            patterns_to_clear.append(f"{prefix}:{url_pattern}")
-                            patterns_to_clear.append(f"{prefix}:views.decorators.cache.cache_page{url_pattern}")
-                            patterns_to_clear.append(f"{prefix}:views.decorators.cache.cache_header{url_pattern}")
-                            patterns_to_clear.append(f"{prefix}:GET:{url_pattern}")
-                            patterns_to_clear.append(f"{prefix}:HEAD:{url_pattern}")
-            except Exception as e:
-                logger.warning(f"Error limpiando cache para idioma {lang_code}: {e}")
-
-        # 3. Limpiar cache del panel de administración
-        panel_patterns = [
-            f"{prefix}:*panel*post*{post.pk}*",
-            f"{prefix}:*update*{post.pk}*",
-            f"{prefix}:*update*",  
-            f"{prefix}:*panel/post/*",
-        ]
-        patterns_to_clear.extend(panel_patterns)
 
-        # 4. Limpiar cache de Parler (traducciones)
-        parler_patterns = [
-            f"{prefix}:*parler*post*{post.pk}*",
-            f"{prefix}:*translation*{post.pk}*",
-            f"{prefix}:*post_{post.pk}_translation*",
-        ]
-        patterns_to_clear.extend(parler_patterns)
-
-        # 5. Limpiar cache de componentes relacionados
-        component_patterns = [
-            f"{prefix}:*latest_posts*",
-            f"{prefix}:*recent_posts*",
-            f"{prefix}:*home*",
-            f"{prefix}:*sidebar*",
-            f"{prefix}:*category*{post.category.pk if post.category else ''}*",
-            f"{prefix}:*tag*",
-            f"{prefix}:*list*",
-            f"{prefix}:*page*",
-        ]
-        patterns_to_clear.extend(component_patterns)
+def post_cache_namespaces(post, deep_clean=True):
+    """
+    Namespaces de generación que dependen de un post (ver
+    apps.core.cache_generations): home, listados y su categoría y tags.
+    """
+    namespaces = ['home', 'news_list']
+    if post.category_id:
+        namespaces.append(f'category:{post.category.slug}')
+    namespaces.extend(f'tag:{slug}' for slug in post.tags.values_list('slug', flat=True))
 
-        # 6. Ejecutar limpieza con Redis SCAN
-        for pattern in patterns_to_clear:
-            cursor = 0
-            while True:
-                cursor, keys = redis_conn.scan(cursor, match=pattern, count=100)
-                if keys:
-                    deleted_count += len(keys)
-                    redis_conn.delete(*keys)
-                    logger.debug(f"Eliminadas {len(keys)} claves con patrón: {pattern}")
-                if cursor == 0:
-                    break
+    if deep_clean:
+        namespaces.extend(['categories', 'tags'])
+    return namespaces
+
+
+def clear_cache_for_post(post, deep_clean=True, sync=None):
+    """
+    Limpia el cache que depende de un post, sin SCAN sobre todo Redis:
+    - Páginas completas y cache de objetos (detalle, similares,
+      navegación): se borran las claves registradas bajo sus tags
+    - Home, listados y su categoría y tags: INCR de la generación de
+      cada namespace
+    - Con deep_clean, también los conteos de categorías y tags
+
+    Por defecto la purga se encola y se agrupa con las demás ediciones
+    (ver apps.core.cache_invalidation).
+
+    Args:
+        post: Instancia del post
+        deep_clean (bool): Si limpiar también categorías y tags
+        sync (bool): True para purgar ahora; None según CACHE_INVALIDATION_ASYNC
+
+    Returns:
+        int: Número de claves eliminadas (0 si se encoló)
+    """
+    try:
+        deleted_count = invalidate_cache(
+            post_cache_tags(post, deep_clean),
+            post_cache_namespaces(post, deep_clean),
+            sync=sync,
+        )
+        logger.info(f"✅ Cache limpiado para post {post.pk}: {deleted_count} claves eliminadas")
 
-        # 7. Limpiar cache adicional usando las claves directas de Django
-        django_keys_to_delete = []
-
-        # Claves específicas del post
-        django_keys_to_delete.extend([
-            f'post_{post.pk}',
-            f'post_detail_{post.pk}',
-            f'post-{post.pk}',
-        ])
-
-        # Claves por idioma
-        for lang_code, _ in settings.LANGUAGES:
-            django_keys_to_delete.extend([
-                f'post_{post.pk}_{lang_code}',
-                f'post_detail_{post.pk}_{lang_code}',
-                f'post_translations_{post.pk}_{lang_code}',
-            ])
-
-        # Eliminar claves directas
-        for key in django_keys_to_delete:
-            try:
-                cache.delete(key)
-                deleted_count += 1
-            except:
-                pass
-
-        # 8. Si deep_clean está activado, limpiar aún más agresivamente
-        if deep_clean:
-            # Limpiar todo el cache de listas y páginas
-            aggressive_patterns = [
-                f"{prefix}:*noticias*",
-                f"{prefix}:*news*",
-                f"{prefix}:*GET:*",  # Todo el cache del middleware GET
-                f"{prefix}:*HEAD:*",  # Todo el cache del middleware HEAD
-            ]
-
-            for pattern in aggressive_patterns:
-                cursor = 0
-                count = 0
-                while count < 1000:  # Limitar a 1000 claves por patrón
-                    cursor, keys = redis_conn.scan(cursor, match=pattern, count=50)
-                    if keys:
-                        deleted_count += len(keys)
-                        count += len(keys)
-                        redis_conn.delete(*keys)
-                    if cursor == 0:
-                        break
-
-        logger.info(f"✅ Cache limpiado completamente para post {post.pk}: {deleted_count} claves eliminadas")
-
-        # 9. Invalidar cache de sesión si es necesario
+        # Invalidar cache de sesión si es necesario
         _invalidate_session_cache_for_post(post)
 
         return deleted_count
 
     except Exception as e:
+        # Sin Redis no hay nada que limpiar: las claves expiran solas
         logger.error(f"❌ Error limpiando cache para post {post.pk}: {e}")
-        # En caso de error, intentar limpieza básica
-        try:
-            cache.clear()  # Nuclear option
-            logger.warning("Cache completamente limpiado debido a error")
-        except:
-            pass
         return 0
 
 
@@ -0,0 +1,160 @@
+"""
+Archivo del HTML crudo de los scrapers
+
+Con el archivo activo (SCRAPER_ARCHIVE_HTML o `scrape_news --archive`) cada
+página de listado y de detalle descargada se guarda comprimida con zstd en
+el storage, bajo una ruta derivada de su SHA-256:
+
+    scrapers/archive/ab/cd/abcd...ef.html.zst
+
+El mismo HTML se guarda una sola vez aunque se descargue en varias corridas;
+cada descarga distinta de una URL queda registrada en ArchivedPage. Así, si
+una fuente cambia su markup o se corrige un parser, `reparse_news` vuelve a
+extraer las noticias desde el archivo, sin red ni navegador.
+
+El storage es el de media por defecto (S3 en producción) o un directorio
+local si SCRAPER_ARCHIVE_LOCATION lo indica. Sin el paquete zstandard se
+comprime con gzip (.html.gz); la lectura reconoce ambos formatos.
+"""
+import gzip
+import hashlib
+import logging
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage, default_storage
+
+from apps.scrapers.models import ArchivedPage
+from apps.scrapers.replay import ReplayDriver
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+logger = logging.getLogger('scrapers.archive')
+
+ARCHIVE_PREFIX = 'scrapers/archive'
+
+
+def get_archive_storage():
+    location = getattr(settings, 'SCRAPER_ARCHIVE_LOCATION', '')
+    if location:
+        return FileSystemStorage(location=location)
+    return default_storage
+
+
+def content_hash(html):
+    return hashlib.sha256(html.encode('utf-8')).hexdigest()
+
+
+def compress(data):
+    """Retorna (bytes comprimidos, extensión)"""
+    if HAS_ZSTD:
+        level = getattr(settings, 'SCRAPER_ARCHIVE_LEVEL', 10)
+        return zstandard.ZstdCompressor(level=level).compress(data), '.zst'
+    return gzip.compress(data), '.gz'
+
+
+def decompress(data, path):
+    if path.endswith('.zst'):
+        if not HAS_ZSTD:
+            raise RuntimeError(f"Se necesita el paquete zstandard para leer {path}")
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    if path.endswith('.gz'):
+        return gzip.decompress(data)
+    return data
+
+
+def archive_path(digest, extension):
+    return f'{ARCHIVE_PREFIX}/{digest[:2]}/{digest[2:4]}/{digest}.html{extension}'
+
+
+class HtmlArchive:
+    """
+    Uso:
+        archive = HtmlArchive(source)
+        archive.store(url, html, ArchivedPage.KIND_DETAIL)
+        html = archive.load(archived_page)
+    """
+
+    def __init__(self, source, storage=None):
+        self.source = source
+        self.storage = storage or get_archive_storage()
+        self.stored = 0
+        self.stored_bytes = 0
+
+    def store(self, url, html, kind=ArchivedPage.KIND_DETAIL):
+        """Guarda `html` (si no estaba ya) y registra la descarga de `url`"""
+        if not html or not url:
+            return None
+
+        digest = content_hash(html)
+        existing = ArchivedPage.objects.filter(content_hash=digest).only('path', 'size', 'stored_size').first()
+        if existing:
+            path, size, stored_size = existing.path, existing.size, existing.stored_size
+        else:
+            raw = html.encode('utf-8')
+            data, extension = compress(raw)
+            path = archive_path(digest, extension)
+            if not self.storage.exists(path):
+                path = self.storage.save(path, ContentFile(data))
+                self.stored += 1
+                self.stored_bytes += len(data)
+            size, stored_size = len(raw), len(data)
+
+        page, _created = ArchivedPage.objects.get_or_create(
+            url=url[:1000],
+            content_hash=digest,
+            defaults={
+                'source': self.source,
+                'kind': kind,
+                'path': path,
+                'size': size,
+                'stored_size': stored_size,
+            },
+        )
+        return page
+
+    def load(self, archived_page):
+        return load_html(archived_page.path, self.storage)
+
+
+def load_html(path, storage=None):
+    storage = storage or get_archive_storage()
+    with storage.open(path, 'rb') as archived_file:
+        return decompress(archived_file.read(), path).decode('utf-8')
+
+
+def reparse_pages(source_key, pages):
+    """
+    Vuelve a extraer el detalle de las noticias de `pages` ([(url, path)])
+    desde el archivo. Retorna [(url, detalles o None, error)].
+    Corre dentro de los workers de `reparse_news`.
+    """
+    # Import diferido: las fuentes importan base, que importa este módulo
+    from apps.scrapers.sources import get_scraper
+
+    storage = get_archive_storage()
+    html_by_url = {}
+    results = []
+    for url, path in pages:
+        try:
+            html_by_url[url] = load_html(path, storage)
+        except Exception as e:
+            results.append((url, None, f"No se pudo leer {path}: {e}"))
+
+    scraper = get_scraper(source_key)
+    scraper.configure(wait_budget=0, archive=False, rate_limit=False)
+    # Si la fuente pide navegador, el "navegador" sirve las páginas archivadas
+    scraper.driver = ReplayDriver(html_by_url)
+    scraper._prefetched_html = dict(html_by_url)
+
+    for url in html_by_url:
+        try:
+            results.append((url, scraper.extract_news_details(url), ''))
+        except Exception as e:
+            results.append((url, None, str(e)))
+    scraper._soup_cache.clear()
+    return results
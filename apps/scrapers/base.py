@@ -1,22 +1,93 @@
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+import time
 import requests
+from celery.exceptions import SoftTimeLimitExceeded
 from apps.news.models import News, NewsSource, ScrapingLog
+from apps.scrapers.models import ArchivedPage
+from apps.scrapers.archive import HtmlArchive
+from apps.scrapers.browser import apply_request_blocking, blocked_url_patterns, quit_browser, start_browser
+from apps.scrapers.dates import parse_date
+from apps.scrapers.metrics import ScrapeMetrics
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+from apps.scrapers.detail_fetcher import ConcurrentDetailFetcher
+from apps.scrapers.fetch import fetch_static
+from apps.scrapers.parsing import SoupCache, parse_html
+from apps.scrapers.relevance import RelevanceClassifier
+from apps.scrapers.throttle import CircuitOpenError, SourceCircuitBreaker, get_rate_limiter
+from apps.scrapers.utils import BloomFilter, canonicalize_url, url_variants
+from apps.scrapers.writer import NewsWriter
+from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 
+# Firma del listado: si cambia, la página (o la sección AJAX) ya se actualizó.
+# Con selector se comparan los ítems; sin selector, URL y alto del documento.
+PAGE_SIGNATURE_JS = """
+const selector = arguments[0];
+if (!selector) {
+    return [location.href, document.body ? document.body.scrollHeight : 0];
+}
+const items = document.querySelectorAll(selector);
+const text = (el) => el ? el.textContent.trim().slice(0, 100) : '';
+return [location.href, items.length, text(items[0]), text(items[items.length - 1])];
+"""
+
+
+class DetailDeferred(Exception):
+    """El detalle necesita el navegador, que sigue ocupado con el listado"""
+
+
 class BaseScraper(ABC):
-    def __init__(self, source_name):
-        self.source_name = source_name
+    # Nombre del NewsSource; cada fuente lo define como atributo de clase
+    source_name = None
+
+    def __init__(self, source_name=None):
+        self.source_name = source_name or self.source_name
         self.source = self.get_or_create_source()
-        self.logger = logging.getLogger(f'scrapers.{source_name}')
+        self.logger = logging.getLogger(f'scrapers.{self.source_name}')
         self.driver = None
         self.scraping_log = None
+        self.browser_pool = None
+        self.incremental = False
+        self.refresh_days = None
+        self.use_bloom = False
+        self.wait_budget = None
+        self.archive = None
+        self.rate_limit = True
+        self.breaker = None
+        self.pages_visited = 0
+        self._lease_start_pages = 0
+        self._fetch_outcomes = {'static': 0, 'browser': 0}
+        self._prefetched_html = {}
+        # Mientras se pagina, el navegador queda en el listado (ver scrape)
+        self._listing_in_progress = False
+        self._deferred_urls = set()
+        self.current_item = None
+        self.news_found = 0
+        self.wait_seconds = 0.0
+        self.metrics = ScrapeMetrics()
+        self.relevance = RelevanceClassifier()
+        self._soup_cache = SoupCache()
+
+    def configure(self, browser_pool=None, incremental=False, refresh_days=None, use_bloom=False,
+                  wait_budget=None, archive=None, rate_limit=True):
+        """Opciones de ejecución inyectadas por el orquestador"""
+        self.browser_pool = browser_pool
+        self.incremental = incremental or refresh_days is not None
+        self.refresh_days = refresh_days
+        self.use_bloom = use_bloom
+        # Reemplaza el 'wait_budget' de la fuente (0 = no esperar, p. ej. al reproducir páginas grabadas)
+        self.wait_budget = wait_budget
+        # Guardar el HTML descargado (None = según SCRAPER_ARCHIVE_HTML)
+        if archive is None:
+            archive = getattr(settings, 'SCRAPER_ARCHIVE_HTML', False)
+        self.archive = HtmlArchive(self.source) if archive else None
+        # Turnos por host compartidos entre workers (False al trabajar sin red)
+        self.rate_limit = rate_limit
+        return self
         
     @abstractmethod
     def get_source_config(self):
@@ -25,7 +96,32 @@ class BaseScraper(ABC):
         {
             'base_url': 'https://...',
             'search_url': 'https://...',
-            'requires_selenium': True/False
+            'requires_selenium': True/False,
+            # Selectores que confirman que el detalle llegó renderizado
+            # (permite descargarlo sin navegador)
+            'detail_selectors': ['div.post-content', ...],
+            # Ítems del listado de resultados (esperas de carga/paginación)
+            'list_selector': 'article.post',
+            # Opcionales: segundos máximos por espera y en total por corrida
+            'wait_timeout': 10,
+            'wait_budget': 120,
+            # Opcionales: qué no descargar en el navegador. Por defecto se
+            # bloquean ['image', 'font', 'media'] y los trackers conocidos
+            'block_resources': ['image', 'font', 'media', 'stylesheet'],
+            'block_urls': ['*ads.example.com*', ...],
+            'block_trackers': True,
+            # Opcionales: SoupStrainer para parsear solo el listado/detalle
+            # (por clase, con apps.scrapers.parsing.class_strainer)
+            'list_strainer': class_strainer('div', 'results'),
+            'detail_strainer': None,
+            # Opcional: en modo incremental, dejar de paginar tras N URLs
+            # ya conocidas seguidas (por defecto SCRAPER_STOP_AFTER_KNOWN)
+            'stop_after_known': 20,
+            # Opcionales: qué hacer con los ítems del listado que no parecen
+            # del rubro ('defer', 'skip' o None) y cuántos diferidos se piden
+            # (por defecto SCRAPER_RELEVANCE_MODE y _DEFER_LIMIT)
+            'relevance_mode': 'defer',
+            'relevance_defer_limit': 10,
         }
         """
         pass
@@ -39,33 +135,431 @@ class BaseScraper(ABC):
         return source
     
     def setup_selenium(self):
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        
-        # Evitar detección de Selenium
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        
+        """Obtiene un navegador: prestado del pool si hay uno, o propio"""
+        with self.metrics.phase('browser_start'):
+            if self.browser_pool:
+                self.driver = self.browser_pool.acquire()
+            else:
+                self.driver = start_browser()
+            self._lease_start_pages = self.pages_visited
+
+            config = self.get_source_config()
+            patterns = blocked_url_patterns(
+                config.get('block_resources'),
+                config.get('block_urls', ()),
+                config.get('block_trackers', True),
+            )
+            if patterns:
+                apply_request_blocking(self.driver, patterns)
+
     def cleanup_selenium(self):
         if self.driver:
-            self.driver.quit()
+            if self.browser_pool:
+                self.browser_pool.release(
+                    self.driver,
+                    pages=self.pages_visited - self._lease_start_pages,
+                )
+            else:
+                quit_browser(self.driver)
             self.driver = None
-    
-    @abstractmethod
+
+    def navigate(self, url):
+        """Navega el navegador a `url` llevando la cuenta de páginas visitadas"""
+        if self.rate_limit:
+            get_rate_limiter().wait(url)
+        self.driver.get(url)
+        self.pages_visited += 1
+        self.metrics.pages_visited += 1
+
+    def wait_until(self, condition, timeout=None, poll=0.25, message=''):
+        """
+        Espera hasta que `condition()` sea verdadera, consultando cada `poll`
+        segundos. Retorna True si se cumplió y False si se agotó el tiempo.
+        El plazo se acota al presupuesto de espera restante de la fuente y el
+        tiempo esperado se acumula en `wait_seconds`.
+        """
+        config = self.get_source_config()
+        if timeout is None:
+            timeout = config.get('wait_timeout', settings.SCRAPER_WAIT_TIMEOUT)
+        budget = self.wait_budget
+        if budget is None:
+            budget = config.get('wait_budget', settings.SCRAPER_WAIT_BUDGET)
+        if budget is not None:
+            # Presupuesto agotado: solo se revisa la condición una vez
+            timeout = max(0, min(timeout, budget - self.wait_seconds))
+
+        started = time.monotonic()
+        try:
+            WebDriverWait(
+                self.driver, timeout,
+                poll_frequency=poll,
+                ignored_exceptions=(WebDriverException,),
+            ).until(lambda driver: condition())
+            return True
+        except TimeoutException:
+            if message:
+                self.logger.debug(f"Tiempo de espera agotado ({timeout:.0f}s): {message}")
+            return False
+        finally:
+            self.wait_seconds += time.monotonic() - started
+
+    def wait_for_ready(self, timeout=None):
+        """Espera a que el documento termine de cargar"""
+        return self.wait_until(
+            lambda: self.driver.execute_script("return document.readyState") == 'complete',
+            timeout=timeout,
+            message='document.readyState',
+        )
+
+    def wait_for_any(self, selectors, timeout=None):
+        """Espera a que aparezca al menos uno de los selectores CSS"""
+        script = "return arguments[0].some(s => document.querySelector(s) !== null)"
+        return self.wait_until(
+            lambda: self.driver.execute_script(script, list(selectors)),
+            timeout=timeout,
+            message=', '.join(selectors),
+        )
+
+    def wait_for_selector(self, selector=None, timeout=None):
+        """Espera los ítems del listado (por defecto `list_selector`)"""
+        selector = selector or self.get_source_config().get('list_selector')
+        if not selector:
+            return self.wait_for_ready(timeout=timeout)
+        return self.wait_for_any([selector], timeout=timeout)
+
+    def page_signature(self, selector=None):
+        """Estado actual del listado, para detectar cuándo cambia"""
+        selector = selector or self.get_source_config().get('list_selector')
+        try:
+            return self.driver.execute_script(PAGE_SIGNATURE_JS, selector or '')
+        except WebDriverException:
+            return None
+
+    def wait_for_change(self, signature, selector=None, timeout=None):
+        """
+        Espera a que el listado deje de coincidir con `signature` (tomada con
+        page_signature() antes de paginar, hacer clic o scroll) y que la
+        página esté cargada.
+        """
+        selector = selector or self.get_source_config().get('list_selector')
+
+        def changed():
+            current = self.page_signature(selector)
+            if current is None or current == signature:
+                return False
+            if selector and not current[1]:
+                return False
+            return self.driver.execute_script("return document.readyState") == 'complete'
+
+        return self.wait_until(changed, timeout=timeout, message='cambio del listado')
+
+    def click_and_wait(self, element, selector=None, timeout=None):
+        """Hace clic (vía JS) y espera a que el listado cambie"""
+        signature = self.page_signature(selector)
+        self.driver.execute_script("arguments[0].click();", element)
+        return self.wait_for_change(signature, selector=selector, timeout=timeout)
+
+    def scroll_and_wait(self, selector=None, timeout=None):
+        """Baja al final de la página y espera a que cargue más contenido"""
+        signature = self.page_signature(selector)
+        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        return self.wait_for_change(signature, selector=selector, timeout=timeout)
+
+    def fetch_detail_html(self, news_url):
+        """
+        Obtiene el HTML de una noticia: primero con HTTP plano y, si no
+        aparecen los `detail_selectors` de la fuente, con el navegador.
+        El resultado se registra en NewsSource.detail_fetch_mode para que
+        las siguientes corridas vayan directo por el camino correcto.
+        """
+        selectors = self.get_source_config().get('detail_selectors', [])
+
+        if selectors and self.source.detail_fetch_mode != NewsSource.FETCH_BROWSER:
+            if news_url in self._prefetched_html:
+                html = self._prefetched_html.pop(news_url)
+            else:
+                html = fetch_static(news_url, rate_limit=self.rate_limit)
+                self.metrics.pages_visited += 1
+            if html and self.has_selectors(html, selectors):
+                self._fetch_outcomes['static'] += 1
+                self.archive_page(news_url, html)
+                return html
+            self.logger.debug(f"Detalle sin selectores esperados vía HTTP, usando navegador: {news_url}")
+            if self._listing_in_progress and self.driver:
+                if html:
+                    self._prefetched_html[news_url] = html
+                self._deferred_urls.add(news_url)
+                raise DetailDeferred(news_url)
+
+        if self._listing_in_progress and self.driver:
+            # Navegar aquí perdería la página de resultados en curso
+            self._deferred_urls.add(news_url)
+            raise DetailDeferred(news_url)
+
+        if not self.driver:
+            self.setup_selenium()
+        self.navigate(news_url)
+        self.wait_for_ready()
+        if selectors:
+            self.wait_for_any(selectors)
+        self._fetch_outcomes['browser'] += 1
+        html = self.driver.page_source
+        self.archive_page(news_url, html)
+        return html
+
+    def archive_page(self, url, html, kind=ArchivedPage.KIND_DETAIL):
+        """Guarda el HTML en el archivo si está activo; un fallo no corta el scraping"""
+        if not self.archive:
+            return
+        with self.metrics.phase('archive'):
+            try:
+                self.archive.store(url, html, kind)
+            except Exception as e:
+                self.logger.warning(f"No se pudo archivar {url}: {e}")
+
+    def iter_news_to_process(self, news_list):
+        """
+        Recorre la lista de noticias. Si los detalles de la fuente se
+        descargan sin navegador, los pide en paralelo y entrega cada noticia
+        apenas su HTML está disponible para fetch_detail_html().
+        """
+        config = self.get_source_config()
+        if not config.get('detail_selectors') or self.source.detail_fetch_mode != NewsSource.FETCH_STATIC:
+            yield from news_list
+            return
+
+        fetched = ConcurrentDetailFetcher(rate_limit=self.rate_limit).iter_fetched(news_list)
+        while True:
+            # Lo que se espera aquí es la descarga en paralelo de los detalles
+            with self.metrics.phase('article_fetch'):
+                news_item, html = next(fetched, (None, None))
+            if news_item is None:
+                return
+            self.metrics.pages_visited += 1
+            if html:
+                self._prefetched_html[news_item['url']] = html
+            yield news_item
+
+    def iter_timed_pages(self, html_content):
+        """iter_news_pages midiendo solo la paginación, no lo que se hace entre páginas"""
+        pages = self.iter_news_pages(html_content)
+        try:
+            while True:
+                with self.metrics.phase('pagination'):
+                    page = next(pages, None)
+                if page is None:
+                    return
+                yield page
+        finally:
+            pages.close()
+
+    def iter_pending_pages(self, pages):
+        """
+        Recorre las páginas del listado entregando, por página, las noticias
+        que hay que procesar: sin URLs repetidas entre páginas y, en modo
+        incremental, sin las ya conocidas. En ese modo deja de pedir
+        páginas tras `stop_after_known` URLs conocidas seguidas: los
+        resultados vienen del más nuevo al más antiguo, así que lo que sigue
+        ya se scrapeó en corridas anteriores.
+        """
+        config = self.get_source_config()
+        stop_after = config.get('stop_after_known', settings.SCRAPER_STOP_AFTER_KNOWN) if self.incremental else 0
+        seen = set()
+        known_streak = 0
+
+        for page in pages:
+            news_list = []
+            for news_item in page:
+                canonical = canonicalize_url(news_item.get('url'))
+                if canonical and canonical not in seen:
+                    seen.add(canonical)
+                    news_list.append(news_item)
+            self.news_found += len(news_list)
+            if not self.incremental:
+                yield news_list
+                continue
+
+            pending = {id(news_item) for news_item in self.filter_known_news(news_list)}
+            to_process = []
+            for news_item in news_list:
+                if id(news_item) in pending:
+                    known_streak = 0
+                    to_process.append(news_item)
+                    continue
+                known_streak += 1
+                if stop_after and known_streak >= stop_after:
+                    self.logger.info(f"Incremental: {known_streak} noticias conocidas seguidas, no se pagina más")
+                    yield to_process
+                    return
+            yield to_process
+
+    def filter_relevant(self, news_list, mode, low_relevance):
+        """
+        Separa los ítems cuyo título/extracto no parece del rubro (ver
+        apps.scrapers.relevance): con mode='defer' quedan en `low_relevance`
+        con su puntaje, para el final de la corrida; con 'skip' se descartan
+        sin pedir su detalle.
+        """
+        relevant = []
+        for news_item in news_list:
+            score = self.relevance.list_score(news_item)
+            if score >= self.relevance.list_threshold:
+                relevant.append(news_item)
+            elif mode == 'defer':
+                low_relevance.append((score, news_item))
+                self.metrics.relevance['deferred'] += 1
+            else:
+                self.logger.debug(f"Omitida por relevancia ({score:.2f}): {news_item.get('title', '')[:60]}")
+                self.metrics.relevance['skipped'] += 1
+        return relevant
+
+    def filter_known_news(self, news_list):
+        """
+        Modo incremental: descarta, antes de pedir su detalle, las noticias
+        que ya están en News (comparando URLs canónicas, en una sola
+        consulta). Con `refresh_days` se vuelven a procesar las conocidas
+        cuyo scraped_date es más antiguo que esa ventana.
+        """
+        pending = {}
+        for news_item in news_list:
+            canonical = canonicalize_url(news_item.get('url'))
+            if canonical and canonical not in pending:
+                pending[canonical] = news_item
+
+        candidates = pending
+        if self.use_bloom:
+            # Lo que el filtro descarta es seguro nuevo: no hace falta consultarlo
+            known_filter = self.get_known_urls_filter()
+            candidates = {canonical: item for canonical, item in pending.items() if canonical in known_filter}
+
+        lookup_urls = set()
+        for news_item in candidates.values():
+            lookup_urls |= url_variants(news_item['url'])
+
+        known = {}
+        if lookup_urls:
+            for url, scraped_date in News.objects.filter(url__in=lookup_urls).values_list('url', 'scraped_date'):
+                known[canonicalize_url(url)] = scraped_date
+
+        refresh_before = None
+        if self.refresh_days is not None:
+            refresh_before = timezone.now() - timedelta(days=self.refresh_days)
+
+        to_process = []
+        for canonical, news_item in pending.items():
+            scraped_date = known.get(canonical)
+            if scraped_date is None or (refresh_before and scraped_date < refresh_before):
+                to_process.append(news_item)
+
+        self.logger.info(
+            f"Incremental: {len(to_process)} de {len(news_list)} noticias requieren detalle "
+            f"({len(known)} ya conocidas)"
+        )
+        return to_process
+
+    def get_known_urls_filter(self):
+        """Filtro de Bloom con las URLs canónicas ya guardadas de la fuente"""
+        cache_key = f'scrapers:known_urls:{self.source.pk}'
+        known_filter = cache.get(cache_key)
+        if known_filter is None:
+            urls = News.objects.filter(source=self.source).values_list('url', flat=True)
+            known_filter = BloomFilter(capacity=max(10000, 2 * urls.count()))
+            for url in urls.iterator():
+                known_filter.add(canonicalize_url(url))
+            cache.set(cache_key, known_filter, 60 * 60 * 24)
+        return known_filter
+
+    def add_known_urls(self, urls):
+        """Agrega URLs recién guardadas al filtro de Bloom de la fuente"""
+        if not self.use_bloom or not urls:
+            return
+        known_filter = self.get_known_urls_filter()
+        for url in urls:
+            known_filter.add(canonicalize_url(url))
+        cache.set(f'scrapers:known_urls:{self.source.pk}', known_filter, 60 * 60 * 24)
+
+    def parse_html(self, html, only=None):
+        """
+        Parsea HTML con el backend configurado (ver apps.scrapers.parsing),
+        reutilizando el árbol si ya se parseó el mismo HTML. Con
+        only='list' u only='detail' se aplica el 'list_strainer' o
+        'detail_strainer' de la fuente.
+        """
+        strainer = self.get_source_config().get(f'{only}_strainer') if only else None
+
+        def build():
+            with self.metrics.phase('parse'):
+                self.metrics.add_bytes(html)
+                return parse_html(html, parse_only=strainer)
+
+        return self._soup_cache.get(html or '', only if strainer else None, build)
+
+    def parse_date(self, text):
+        """Fecha de publicación a partir de texto (ver apps.scrapers.dates)"""
+        return parse_date(text)
+
+    def parse_list(self, html):
+        """Parsea una página de resultados (solo el contenedor, si hay strainer)"""
+        return self.parse_html(html, only='list')
+
+    def has_selectors(self, html, selectors):
+        soup = self.parse_html(html)
+        return any(soup.select_one(selector) for selector in selectors)
+
+    def record_fetch_mode(self):
+        """Aprende si los detalles de la fuente pueden descargarse sin navegador"""
+        static_hits = self._fetch_outcomes['static']
+        browser_hits = self._fetch_outcomes['browser']
+        if not static_hits and not browser_hits:
+            return
+
+        current_mode = self.source.detail_fetch_mode
+        new_mode = current_mode
+
+        if current_mode == NewsSource.FETCH_AUTO:
+            if not static_hits:
+                new_mode = NewsSource.FETCH_BROWSER
+            elif static_hits >= 4 * browser_hits:
+                new_mode = NewsSource.FETCH_STATIC
+        elif current_mode == NewsSource.FETCH_STATIC and browser_hits > static_hits:
+            # La fuente cambió su markup: volver a sondear
+            new_mode = NewsSource.FETCH_AUTO
+
+        if new_mode != current_mode:
+            self.logger.info(f"Modo de descarga de detalles: {current_mode} → {new_mode}")
+            self.source.detail_fetch_mode = new_mode
+            self.source.save(update_fields=['detail_fetch_mode', 'updated_at'])
+
+    def iter_news_pages(self, html_content):
+        """
+        Entrega el listado página por página (cada una, lista de diccionarios
+        con al menos: title, url). Las fuentes que paginan lo implementan
+        para que scrape() pida detalles y guarde mientras sigue paginando;
+        por defecto todo el listado es una sola página.
+        """
+        yield self.extract_news_list(html_content)
+
     def extract_news_list(self, html_content):
         """
-        Extrae lista de noticias del HTML
+        Extrae lista de noticias del HTML (todas las páginas)
         Retorna lista de diccionarios con al menos: title, url
         """
-        pass
+        if type(self).iter_news_pages is BaseScraper.iter_news_pages:
+            raise NotImplementedError(f"{type(self).__name__} debe implementar extract_news_list o iter_news_pages")
+
+        news_list = []
+        seen = set()
+        for page in self.iter_news_pages(html_content):
+            for news_item in page:
+                if news_item.get('url') not in seen:
+                    seen.add(news_item.get('url'))
+                    news_list.append(news_item)
+        return news_list
+
+    def list_item_for(self, news_url):
+        """Datos del listado (fecha, extracto...) de la noticia en proceso"""
+        news_item = self.current_item or {}
+        return news_item if news_item.get('url') == news_url else {}
     
     @abstractmethod
     def extract_news_details(self, news_url):
@@ -75,29 +569,75 @@ class BaseScraper(ABC):
         """
         pass
     
-    def save_news(self, news_data):
-        """Guarda noticia en la base de datos"""
+    def prepare_news_data(self, news_data):
+        """Hook para ajustar los datos de una noticia antes de guardarla"""
+        return news_data
+
+    def process_news_item(self, news_item, writer):
+        """
+        Pide el detalle de una noticia del listado y la entrega al writer.
+        Retorna False si quedó diferida (necesita el navegador, que sigue en
+        el listado) y hay que procesarla al terminar de paginar.
+        """
+        news_url = news_item['url']
+        self.current_item = news_item
         try:
-            news, created = News.objects.get_or_create(
-                url=news_data['url'],
-                defaults={
-                    'source': self.source,
-                    'title': news_data.get('title', ''),
-                    'content': news_data.get('content', ''),
-                    'excerpt': news_data.get('excerpt', ''),
-                    'published_date': news_data.get('published_date'),
-                    'image_url': news_data.get('image_url', ''),
-                    'author': news_data.get('author', ''),
-                }
-            )
-            return created
-        except Exception as e:
-            self.logger.error(f"Error guardando noticia: {e}")
+            # Obtener detalles
+            with self.metrics.article(), self.metrics.phase('article_fetch'):
+                details = self.extract_news_details(news_url)
+            if news_url in self._deferred_urls:
+                # La fuente pudo atrapar DetailDeferred dentro de extract_news_details
+                return False
+
+            # Combinar datos, clasificar con el texto completo y guardar
+            news_data = {**news_item, **details}
+            news_data['is_pymemad_related'] = self.relevance.is_related(news_data)
+            self.metrics.relevance['related' if news_data['is_pymemad_related'] else 'unrelated'] += 1
+            with self.metrics.phase('db_save'):
+                writer.add(self.prepare_news_data(news_data))
+
+        except DetailDeferred:
             return False
+        except SoftTimeLimitExceeded:
+            # Límite de la tarea de Celery: cortar la corrida, no solo esta noticia
+            raise
+        except Exception as e:
+            self.logger.error(f"Error procesando noticia {news_url}: {e}")
+            self.breaker.record_failure()
+            return True
+        finally:
+            self.current_item = None
+
+        # Sin contenido = la página no cargó o cambió el markup
+        if details.get('content'):
+            self.breaker.record_success()
+        else:
+            self.breaker.record_failure()
+        return True
+
+    def save_news(self, news_data):
+        """Guarda una noticia suelta. Retorna True si se creó o actualizó"""
+        writer = NewsWriter(self.source, logger=self.logger)
+        writer.add(self.prepare_news_data(news_data))
+        writer.flush()
+        return bool(writer.created or writer.updated)
     
     def scrape(self):
         """Método principal de scraping"""
+        self.breaker = SourceCircuitBreaker(self.source)
+        if not self.breaker.allow_run():
+            open_until = timezone.localtime(self.source.circuit_open_until)
+            self.scraping_log = ScrapingLog.objects.create(
+                source=self.source,
+                status='skipped',
+                error_message=f"Circuito abierto hasta {open_until:%Y-%m-%d %H:%M}",
+                finished_at=timezone.now(),
+            )
+            self.logger.warning(f"{self.source_name}: {self.scraping_log.error_message}, se omite la corrida")
+            return
+
         self.scraping_log = ScrapingLog.objects.create(source=self.source)
+        self.metrics = ScrapeMetrics()
         
         try:
             config = self.get_source_config()
@@ -108,45 +648,114 @@ class BaseScraper(ABC):
             self.logger.info(f"Iniciando scraping de {self.source_name}")
             
             # Obtener lista de noticias
-            if config.get('requires_selenium', False):
-                self.driver.get(config['search_url'])
-                html_content = self.driver.page_source
-            else:
-                response = requests.get(config['search_url'])
-                html_content = response.text
-            
-            news_list = self.extract_news_list(html_content)
-            self.scraping_log.news_found = len(news_list)
+            with self.metrics.phase('list_fetch'):
+                if config.get('requires_selenium', False):
+                    self.navigate(config['search_url'])
+                    self.wait_for_selector()
+                    html_content = self.driver.page_source
+                else:
+                    if self.rate_limit:
+                        get_rate_limiter().wait(config['search_url'])
+                    response = requests.get(config['search_url'])
+                    self.metrics.pages_visited += 1
+                    html_content = response.text
             
-            # Procesar cada noticia
-            news_saved = 0
-            for news_item in news_list:
-                try:
-                    # Obtener detalles
-                    details = self.extract_news_details(news_item['url'])
-                    
-                    # Combinar datos
-                    news_data = {**news_item, **details}
-                    
-                    # Guardar
-                    if self.save_news(news_data):
-                        news_saved += 1
-                        
-                except Exception as e:
-                    self.logger.error(f"Error procesando noticia {news_item.get('url', '')}: {e}")
+            self.archive_page(config['search_url'], html_content, ArchivedPage.KIND_LIST)
+
+            # Listado → detalles → writer, página por página: el detalle y el
+            # guardado (por lotes) empiezan antes de terminar de paginar
+            writer = NewsWriter(self.source, logger=self.logger)
+            circuit_error = None
+            deferred = []
+            low_relevance = []
+            relevance_mode = config.get('relevance_mode', settings.SCRAPER_RELEVANCE_MODE)
+            self.news_found = 0
+            self._deferred_urls = set()
+            pages = self.iter_timed_pages(html_content)
+            self._listing_in_progress = self.driver is not None
+            try:
+                for news_list in self.iter_pending_pages(pages):
+                    if self.news_found and not self.scraping_log.news_found:
+                        # La fuente responde: cierra el circuito si estaba a prueba
+                        self.breaker.record_success()
+                    self.scraping_log.news_found = self.news_found
+                    if relevance_mode:
+                        news_list = self.filter_relevant(news_list, relevance_mode, low_relevance)
+
+                    for news_item in self.iter_news_to_process(news_list):
+                        if not self.process_news_item(news_item, writer):
+                            deferred.append(news_item)
+
+                pages.close()
+                self._listing_in_progress = False
+                if deferred:
+                    self.logger.info(f"Procesando {len(deferred)} noticias que esperaban al navegador")
+                for news_item in deferred:
+                    self._deferred_urls.discard(news_item['url'])
+                    self.process_news_item(news_item, writer)
+
+                # Poco relevantes por el listado: solo las de mejor puntaje
+                limit = config.get('relevance_defer_limit', settings.SCRAPER_RELEVANCE_DEFER_LIMIT)
+                low_relevance.sort(key=lambda pair: pair[0], reverse=True)
+                if len(low_relevance) > limit:
+                    self.logger.info(f"Relevancia: se omiten {len(low_relevance) - limit} noticias poco relevantes")
+                    self.metrics.relevance['skipped'] += len(low_relevance) - limit
+                for _score, news_item in low_relevance[:limit]:
+                    self.process_news_item(news_item, writer)
+            except CircuitOpenError as e:
+                # Cortar el resto de la corrida; lo ya extraído se guarda igual
+                circuit_error = e
+                self.logger.warning(f"Corrida cortada: {e}")
+            finally:
+                self._listing_in_progress = False
+                pages.close()
             
+            with self.metrics.phase('db_save'):
+                writer.flush()
+            news_saved = writer.created + writer.updated
+            self.scraping_log.news_created = writer.created
+            self.scraping_log.news_updated = writer.updated
+            self.scraping_log.news_duplicates = writer.duplicates
+            self.scraping_log.news_failed = writer.failed
+            if writer.failed:
+                self.logger.warning(f"{writer.failed} noticias no se pudieron guardar")
             self.scraping_log.news_saved = news_saved
-            self.scraping_log.status = 'completed'
-            self.logger.info(f"Scraping completado: {news_saved}/{len(news_list)} noticias guardadas")
+            self.scraping_log.status = 'failed' if circuit_error else 'completed'
+            if circuit_error:
+                self.scraping_log.error_message = str(circuit_error)
+            self.record_fetch_mode()
+            self.add_known_urls(writer.saved_urls)
+            self.logger.info(
+                f"Scraping completado: {news_saved}/{self.news_found} noticias guardadas "
+                f"({self.wait_seconds:.1f}s esperando al navegador)"
+            )
+            self.logger.debug(
+                f"Parseo HTML: {self._soup_cache.misses} páginas en {self._soup_cache.parse_seconds:.2f}s, "
+                f"{self._soup_cache.hits} reutilizadas"
+            )
             
+        except SoftTimeLimitExceeded:
+            self.logger.error("Límite de tiempo de la tarea alcanzado, se corta la corrida")
+            self.scraping_log.status = 'failed'
+            self.scraping_log.error_message = 'Límite de tiempo de la tarea alcanzado'
+            raise
+
         except Exception as e:
             self.logger.error(f"Error en scraping: {e}")
             self.scraping_log.status = 'failed'
             self.scraping_log.error_message = str(e)
+            try:
+                self.breaker.record_failure()
+            except CircuitOpenError as circuit_error:
+                self.logger.warning(str(circuit_error))
             
         finally:
             self.scraping_log.finished_at = timezone.now()
+            self.scraping_log.wait_seconds = round(self.wait_seconds, 2)
+            self.scraping_log.metrics = self.metrics.as_dict()
             self.scraping_log.save()
-            
-            if config.get('requires_selenium', False):
+            self._soup_cache.clear()
+
+            # También si una fuente estática abrió el navegador como respaldo (fetch_detail_html)
+            if self.driver:
                 self.cleanup_selenium()
\ No newline at end of file
@@ -0,0 +1,250 @@
+"""
+Pool de navegadores Chrome headless para los scrapers
+
+Resolver el chromedriver y levantar Chrome es un costo fijo alto, así que el
+pool arranca los navegadores una sola vez y los presta (lease) a cada
+scraper. Entre préstamos se limpian cookies y pestañas, y un navegador se
+recicla después de `max_pages` páginas o si deja de responder.
+
+Como solo se parsea texto (la imagen se toma de og:image), cada fuente puede
+bloquear vía DevTools imágenes, fuentes, media y trackers con
+apply_request_blocking(); ver 'block_resources', 'block_urls' y
+'block_trackers' en BaseScraper.get_source_config().
+"""
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+logger = logging.getLogger('scrapers.browser')
+
+# Patrones de Network.setBlockedURLs por tipo de recurso ('*' es comodín;
+# el '*' final cubre query strings como ?w=300)
+RESOURCE_TYPE_PATTERNS = {
+    'image': ['*.jpg*', '*.jpeg*', '*.png*', '*.gif*', '*.webp*', '*.avif*', '*.svg*', '*.ico*', '*.bmp*'],
+    'font': ['*.woff*', '*.woff2*', '*.ttf*', '*.otf*', '*.eot*'],
+    'media': ['*.mp4*', '*.webm*', '*.m3u8*', '*.mp3*', '*.ogg*', '*.wav*'],
+    'stylesheet': ['*.css*'],
+}
+
+# Publicidad, analítica y widgets de terceros
+TRACKER_URL_PATTERNS = [
+    '*google-analytics.com*', '*googletagmanager.com*', '*googlesyndication.com*',
+    '*doubleclick.net*', '*googleadservices.com*', '*adservice.google.*',
+    '*connect.facebook.net*', '*facebook.com/tr*', '*platform.twitter.com*',
+    '*hotjar.com*', '*scorecardresearch.com*', '*chartbeat.com*', '*chartbeat.net*',
+    '*taboola.com*', '*outbrain.com*', '*criteo.com*', '*criteo.net*',
+    '*amazon-adsystem.com*', '*adnxs.com*', '*pubmatic.com*', '*rubiconproject.com*',
+    '*quantserve.com*', '*newrelic.com*', '*nr-data.net*', '*onesignal.com*',
+]
+
+DEFAULT_BLOCKED_RESOURCES = ['image', 'font', 'media']
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+def get_driver_path():
+    """Resuelve la ruta del chromedriver una sola vez por proceso"""
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            _driver_path = ChromeDriverManager().install()
+    return _driver_path
+
+
+def build_chrome_options():
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    return chrome_options
+
+
+def start_browser(driver_path=None):
+    """Levanta un Chrome headless nuevo"""
+    service = Service(driver_path or get_driver_path())
+    driver = webdriver.Chrome(service=service, options=build_chrome_options())
+
+    # Evitar detección de Selenium
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    return driver
+
+
+def blocked_url_patterns(resource_types=None, url_patterns=(), block_trackers=True):
+    """
+    Patrones a bloquear para una fuente: los de cada tipo de recurso
+    (`None` usa DEFAULT_BLOCKED_RESOURCES, `[]` no bloquea ninguno), los
+    trackers conocidos y los patrones propios de la fuente.
+    """
+    if resource_types is None:
+        resource_types = DEFAULT_BLOCKED_RESOURCES
+
+    patterns = list(url_patterns)
+    if block_trackers:
+        patterns.extend(TRACKER_URL_PATTERNS)
+    for resource_type in resource_types:
+        if resource_type not in RESOURCE_TYPE_PATTERNS:
+            logger.warning(f"Tipo de recurso desconocido para bloquear: {resource_type}")
+            continue
+        patterns.extend(RESOURCE_TYPE_PATTERNS[resource_type])
+    return patterns
+
+
+def apply_request_blocking(driver, patterns):
+    """Bloquea (vía DevTools) las peticiones que calcen con `patterns`"""
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(patterns)})
+        return True
+    except WebDriverException as e:
+        logger.warning(f"No se pudo configurar el bloqueo de peticiones: {e}")
+        return False
+
+
+def quit_browser(driver):
+    try:
+        driver.quit()
+    except Exception as e:
+        logger.debug(f"Error cerrando navegador: {e}")
+
+
+class BrowserPool:
+    """
+    Pool acotado de navegadores reutilizables.
+
+    Uso:
+        pool = BrowserPool(size=2)
+        with pool.lease() as driver:
+            driver.get(url)
+        pool.close()
+    """
+
+    def __init__(self, size=1, max_pages=None, driver_path=None):
+        self.size = size
+        self.max_pages = max_pages or getattr(settings, 'SCRAPER_BROWSER_MAX_PAGES', 50)
+        self.driver_path = driver_path
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._pages = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def acquire(self, timeout=None):
+        """Presta un navegador; lo crea si todavía hay cupo en el pool"""
+        if self._closed:
+            raise RuntimeError("El pool de navegadores está cerrado")
+
+        try:
+            driver = self._idle.get_nowait()
+        except queue.Empty:
+            if self._slots.acquire(blocking=False):
+                try:
+                    return self._spawn()
+                except Exception:
+                    self._slots.release()
+                    raise
+            driver = self._idle.get(timeout=timeout)
+
+        if not self._is_alive(driver):
+            logger.warning("Navegador caído, reemplazándolo")
+            driver = self._replace(driver)
+        return driver
+
+    def release(self, driver, pages=0, broken=False):
+        """Devuelve un navegador al pool, reciclándolo si corresponde"""
+        if driver is None:
+            return
+
+        with self._lock:
+            self._pages[id(driver)] = self._pages.get(id(driver), 0) + pages
+            total_pages = self._pages[id(driver)]
+
+        if self._closed:
+            self._discard(driver)
+            return
+
+        try:
+            if broken or total_pages >= self.max_pages or not self._reset(driver):
+                logger.info(f"Reciclando navegador tras {total_pages} páginas")
+                driver = self._replace(driver)
+        except Exception as e:
+            # No se pudo levantar el reemplazo: liberar el cupo
+            logger.error(f"No se pudo reciclar el navegador: {e}")
+            self._slots.release()
+            return
+
+        self._idle.put(driver)
+
+    @contextmanager
+    def lease(self, timeout=None):
+        driver = self.acquire(timeout=timeout)
+        broken = False
+        try:
+            yield driver
+        except WebDriverException:
+            broken = True
+            raise
+        finally:
+            self.release(driver, broken=broken)
+
+    def close(self):
+        """Cierra todos los navegadores ociosos"""
+        self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+
+    def _spawn(self):
+        driver = start_browser(self.driver_path)
+        with self._lock:
+            self._pages[id(driver)] = 0
+        return driver
+
+    def _discard(self, driver):
+        with self._lock:
+            self._pages.pop(id(driver), None)
+        quit_browser(driver)
+
+    def _replace(self, driver):
+        self._discard(driver)
+        return self._spawn()
+
+    def _is_alive(self, driver):
+        try:
+            driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    def _reset(self, driver):
+        """Deja el navegador limpio para el próximo préstamo"""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            # delete_all_cookies() solo borra las del dominio actual
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            # El bloqueo lo configura cada fuente al recibir el navegador
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': []})
+            driver.get('about:blank')
+            return True
+        except WebDriverException as e:
+            logger.warning(f"No se pudo limpiar el navegador: {e}")
+            return False
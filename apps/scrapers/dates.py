@@ -0,0 +1,175 @@
+"""
+Parseo de fechas en español para los scrapers
+
+Un solo parser compartido por todas las fuentes, con los patrones compilados
+una vez y memoización por texto (los listados repiten las mismas fechas
+muchas veces). Entiende:
+
+- ISO 8601: "2022-09-12T17:55:46-03:00", "2025-06-02"
+- numéricas día primero: "12/09/2022", "18-07-2022", y año primero: "2022-7-18"
+- texto: "Martes 4 de Agosto de 2015", "24 enero, 2019", "30 September 2024",
+  "junio 2, 2025", "13 de Septiembre de 2023 | 00:10"
+- relativas: "hace 3 horas", "hace un día", "ayer", "hoy"
+
+Siempre retorna datetimes con zona horaria (America/Santiago si el texto no
+trae una) o None.
+"""
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+from django.utils import timezone
+
+CHILE_TZ = ZoneInfo('America/Santiago')
+
+MONTHS = {
+    'enero': 1, 'febrero': 2, 'marzo': 3, 'abril': 4, 'mayo': 5, 'junio': 6,
+    'julio': 7, 'agosto': 8, 'septiembre': 9, 'setiembre': 9, 'octubre': 10,
+    'noviembre': 11, 'diciembre': 12,
+    'ene': 1, 'feb': 2, 'mar': 3, 'abr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'ago': 8, 'sep': 9, 'sept': 9, 'set': 9, 'oct': 10, 'nov': 11, 'dic': 12,
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'june': 6, 'july': 7,
+    'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
+    'jan': 1, 'apr': 4, 'aug': 8, 'dec': 12,
+}
+
+RELATIVE_UNITS = {
+    'segundo': timedelta(seconds=1),
+    'minuto': timedelta(minutes=1),
+    'min': timedelta(minutes=1),
+    'hora': timedelta(hours=1),
+    'hr': timedelta(hours=1),
+    'dia': timedelta(days=1),
+    'día': timedelta(days=1),
+    'semana': timedelta(weeks=1),
+    'mes': timedelta(days=30),
+    'año': timedelta(days=365),
+}
+
+_WORD = r'[a-záéíóúñ]+'
+
+ISO_RE = re.compile(
+    r'(\d{4})-(\d{1,2})-(\d{1,2})'
+    r'(?:[t ](\d{1,2}):(\d{2})(?::(\d{2})(?:\.\d+)?)?)?'
+    r'\s*(z|[+-]\d{2}:?\d{2})?'
+)
+NUMERIC_DMY_RE = re.compile(r'\b(\d{1,2})[/.-](\d{1,2})[/.-](\d{4})\b')
+TEXT_DMY_RE = re.compile(rf'\b(\d{{1,2}})\s+(?:de\s+)?({_WORD})\.?,?\s+(?:de\s+|del\s+)?(\d{{4}})\b')
+TEXT_MDY_RE = re.compile(rf'\b({_WORD})\.?\s+(\d{{1,2}}),?\s+(?:de\s+)?(\d{{4}})\b')
+TIME_RE = re.compile(r'\b(\d{1,2}):(\d{2})(?::(\d{2}))?\s*(am|pm|a\.\s?m\.|p\.\s?m\.)?')
+RELATIVE_RE = re.compile(rf'hace\s+(\d+|un|una|unos|unas)\s+({_WORD})')
+DAY_WORDS_RE = re.compile(r'\b(anteayer|ayer|hoy)\b')
+SPACES_RE = re.compile(r'\s+')
+
+
+def parse_date(text, now=None):
+    """
+    Convierte un texto de fecha a datetime con zona horaria, o None.
+    `now` es la referencia para fechas relativas (por defecto, ahora).
+    """
+    if not text:
+        return None
+
+    normalized = normalize_text(text)
+    result = _parse_absolute(normalized)
+    if result is not None:
+        return result
+
+    delta = _parse_relative(normalized)
+    if delta is not None:
+        return (now or timezone.now()).astimezone(CHILE_TZ) - delta
+    return None
+
+
+def normalize_text(text):
+    return SPACES_RE.sub(' ', str(text).strip().lower())
+
+
+def month_number(name):
+    """Número de mes para un nombre completo, abreviado o truncado ("septiem")"""
+    name = name.strip('.,').lower()
+    if name in MONTHS:
+        return MONTHS[name]
+    if len(name) >= 3:
+        for full_name, number in MONTHS.items():
+            if len(full_name) > 4 and full_name.startswith(name):
+                return number
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_absolute(text):
+    """Fechas explícitas (no dependen del momento actual: se memoizan)"""
+    match = ISO_RE.search(text)
+    if match:
+        year, month, day, hour, minute, second, offset = match.groups()
+        return _build(year, month, day, hour, minute, second, offset=offset)
+
+    match = TEXT_DMY_RE.search(text)
+    if match and month_number(match.group(2)):
+        day, month_name, year = match.groups()
+        return _build(year, month_number(month_name), day, *_find_time(text, match.end()))
+
+    match = TEXT_MDY_RE.search(text)
+    if match and month_number(match.group(1)):
+        month_name, day, year = match.groups()
+        return _build(year, month_number(month_name), day, *_find_time(text, match.end()))
+
+    match = NUMERIC_DMY_RE.search(text)
+    if match:
+        day, month, year = match.groups()
+        return _build(year, month, day, *_find_time(text, match.end()))
+
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _parse_relative(text):
+    """Intervalo a restar a la hora actual para "hace N ...", "ayer", "hoy"""
+    match = RELATIVE_RE.search(text)
+    if match:
+        amount, unit = match.groups()
+        amount = int(amount) if amount.isdigit() else 1
+        unit = unit.rstrip('s')
+        if unit == 'mese':
+            unit = 'mes'
+        for name, step in RELATIVE_UNITS.items():
+            if unit.startswith(name):
+                return step * amount
+        return None
+
+    match = DAY_WORDS_RE.search(text)
+    if match:
+        return {'hoy': timedelta(0), 'ayer': timedelta(days=1), 'anteayer': timedelta(days=2)}[match.group(1)]
+    return None
+
+
+def _find_time(text, start):
+    """Hora (HH:MM[:SS] [am/pm]) que sigue a la fecha, si la hay"""
+    match = TIME_RE.search(text, start)
+    if not match:
+        return None, None, None
+    hour, minute, second, meridian = match.groups()
+    hour = int(hour)
+    if meridian and meridian.startswith('p') and hour < 12:
+        hour += 12
+    elif meridian and meridian.startswith('a') and hour == 12:
+        hour = 0
+    return hour, minute, second
+
+
+def _build(year, month, day, hour=None, minute=None, second=None, offset=None):
+    try:
+        value = datetime(int(year), int(month), int(day), int(hour or 0), int(minute or 0), int(second or 0))
+    except ValueError:
+        return None
+
+    if offset:
+        if offset == 'z':
+            offset = '+00:00'
+        elif ':' not in offset:
+            offset = f'{offset[:3]}:{offset[3:]}'
+        value = datetime.fromisoformat(f'{value.isoformat()}{offset}')
+        return value.astimezone(CHILE_TZ)
+    return value.replace(tzinfo=CHILE_TZ)
@@ -0,0 +1,55 @@
+"""
+Descarga HTTP estática para los scrapers
+
+Sesión `requests` compartida por proceso, con pool de conexiones keep-alive
+y reintentos, para las páginas que no necesitan un navegador.
+"""
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from apps.scrapers.throttle import get_rate_limiter
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+DEFAULT_TIMEOUT = 15
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_http_session():
+    """Sesión HTTP reutilizable (una por proceso)"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            retry = Retry(total=2, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+            adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=retry)
+
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers.update({
+                'User-Agent': USER_AGENT,
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                'Accept-Language': 'es-CL,es;q=0.9',
+            })
+            _session = session
+    return _session
+
+
+def fetch_static(url, timeout=DEFAULT_TIMEOUT, rate_limit=True):
+    """
+    Descarga `url` sin navegador. Devuelve el HTML o None si falla.
+    Con `rate_limit` espera antes su turno en el límite por host.
+    """
+    if rate_limit:
+        get_rate_limiter().wait(url)
+    try:
+        response = get_http_session().get(url, timeout=timeout)
+    except requests.RequestException:
+        return None
+    if response.status_code != 200:
+        return None
+    return response.text
@@ -0,0 +1,115 @@
+from django.core.management.base import BaseCommand, CommandError
+from pathlib import Path
+import statistics
+import time
+
+from apps.scrapers.fetch import fetch_static
+from apps.scrapers.metrics import percentile
+from apps.scrapers.parsing import available_parsers, default_parser, parse_html
+from apps.scrapers.replay import FIXTURES_DIR
+from apps.scrapers.sources import SCRAPERS
+
+
+class Command(BaseCommand):
+    help = 'Compara los backends de parseo HTML sobre páginas grabadas de las fuentes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--source',
+            type=str,
+            help='Fuente específica (por defecto, todas las que tengan páginas grabadas)',
+        )
+        parser.add_argument(
+            '--pages-dir',
+            type=str,
+            default=str(FIXTURES_DIR),
+            help='Directorio con las páginas grabadas: <fuente>/list*.html y <fuente>/detail*.html',
+        )
+        parser.add_argument(
+            '--url',
+            action='append',
+            default=[],
+            help='Descargar y medir esta URL (se puede repetir; requiere --source)',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Repeticiones por página y backend',
+        )
+
+    def handle(self, *args, **options):
+        source_keys = list(SCRAPERS.keys())
+        if options['source']:
+            if options['source'].lower() not in SCRAPERS:
+                raise CommandError(f"Fuente no encontrada: {options['source']}")
+            source_keys = [options['source'].lower()]
+        elif options['url']:
+            raise CommandError('--url requiere --source')
+
+        pages = self.collect_pages(source_keys, Path(options['pages_dir']), options['url'])
+        if not pages:
+            # Sin páginas la comparación saldría vacía: no reportar nada como si se hubiera medido
+            raise CommandError(
+                f"No hay páginas grabadas en {options['pages_dir']}; grábalas con "
+                f"`replay_scrapers --source X --record N` o usa --source y --url para medir en vivo"
+            )
+        without_pages = sorted(set(source_keys) - {source_key for source_key, _label, _kind, _html in pages})
+        if without_pages:
+            self.stdout.write(self.style.WARNING(f"Sin páginas grabadas: {', '.join(without_pages)}"))
+
+        parsers = available_parsers()
+        self.stdout.write(f"Backends: {', '.join(parsers)} (por defecto: {default_parser()})")
+        totals = {}
+
+        for source_key, label, kind, html in pages:
+            config = SCRAPERS[source_key]().get_source_config()
+            strainer = config.get(f'{kind}_strainer')
+            self.stdout.write(f"\n{source_key} · {label} ({len(html) / 1024:.0f} KB)")
+
+            for parser in parsers:
+                variants = [('completo', None)]
+                if strainer is not None:
+                    variants.append(('parcial', strainer))
+
+                for variant, parse_only in variants:
+                    timings = self.measure(html, parser, parse_only, options['repeat'])
+                    median = statistics.median(timings)
+                    totals.setdefault((parser, variant), []).append(median)
+                    self.stdout.write(
+                        f"  {parser:<12} {variant:<9} mediana {median:8.1f} ms   "
+                        f"p95 {percentile(timings, 95):8.1f} ms"
+                    )
+
+        self.stdout.write("\nTotal (suma de medianas):")
+        for (parser, variant), medians in sorted(totals.items(), key=lambda item: sum(item[1])):
+            self.stdout.write(f"  {parser:<12} {variant:<9} {sum(medians):9.1f} ms")
+
+    def collect_pages(self, source_keys, pages_dir, urls):
+        """Lista de (fuente, etiqueta, 'list'|'detail', html)"""
+        pages = []
+
+        for url in urls:
+            html = fetch_static(url)
+            if html is None:
+                self.stdout.write(self.style.ERROR(f"No se pudo descargar {url}"))
+                continue
+            pages.append((source_keys[0], url, 'detail', html))
+
+        for source_key in source_keys:
+            source_dir = pages_dir / source_key
+            if not source_dir.is_dir():
+                continue
+            for path in sorted(source_dir.glob('*.html')):
+                kind = 'list' if path.name.startswith('list') else 'detail'
+                pages.append((source_key, path.name, kind, path.read_text(encoding='utf-8')))
+
+        return pages
+
+    def measure(self, html, parser, parse_only, repeat):
+        timings = []
+        for _ in range(max(1, repeat)):
+            started = time.perf_counter()
+            parse_html(html, parser=parser, parse_only=parse_only)
+            timings.append((time.perf_counter() - started) * 1000)
+        return timings
@@ -0,0 +1,154 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.utils import timezone
+from datetime import timedelta
+import multiprocessing
+
+from apps.news.feed import invalidate_feed
+from apps.news.models import News
+from apps.news.search import update_search_vectors
+from apps.scrapers.archive import reparse_pages
+from apps.scrapers.models import ArchivedPage
+from apps.scrapers.sources import SCRAPERS, get_scraper
+from apps.scrapers.writer import FINGERPRINT_FIELDS, NEWS_FIELDS, NewsWriter
+
+# Campos que se reemplazan con lo re-extraído (el título viene del listado)
+REPARSE_FIELDS = [field for field in NEWS_FIELDS if field != 'title']
+
+
+def _init_worker():
+    connections.close_all()
+
+
+def _reparse_chunk(args):
+    source_key, pages = args
+    return source_key, reparse_pages(source_key, pages)
+
+
+class Command(BaseCommand):
+    help = 'Vuelve a extraer el detalle de las noticias desde el HTML archivado, sin red ni navegador'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--source',
+            type=str,
+            help='Fuente específica (por defecto, todas)',
+        )
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=None,
+            help='Solo páginas archivadas en los últimos N días',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=max(1, multiprocessing.cpu_count() - 1),
+            help='Procesos en paralelo',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=50,
+            help='Páginas por tarea de cada proceso',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Mostrar qué cambiaría sin guardar',
+        )
+
+    def handle(self, *args, **options):
+        source_keys = list(SCRAPERS.keys())
+        if options['source']:
+            if options['source'].lower() not in SCRAPERS:
+                raise CommandError(f"Fuente no encontrada: {options['source']}")
+            source_keys = [options['source'].lower()]
+
+        chunks = []
+        for source_key in source_keys:
+            pages = self.latest_pages(get_scraper(source_key).source, options['days'])
+            for start in range(0, len(pages), options['chunk_size']):
+                chunks.append((source_key, pages[start:start + options['chunk_size']]))
+
+        total_pages = sum(len(pages) for _source_key, pages in chunks)
+        if not total_pages:
+            self.stdout.write(self.style.WARNING("No hay páginas archivadas para re-extraer"))
+            return
+        self.stdout.write(f"Re-extrayendo {total_pages} páginas con {options['workers']} procesos")
+
+        totals = {'changed': 0, 'unchanged': 0, 'errors': 0, 'missing': 0}
+        field_changes = {field: 0 for field in REPARSE_FIELDS}
+
+        connections.close_all()
+        context = multiprocessing.get_context('fork')
+        with context.Pool(processes=max(1, options['workers']), initializer=_init_worker) as pool:
+            for source_key, results in pool.imap_unordered(_reparse_chunk, chunks):
+                for url, details, error in results:
+                    if error:
+                        totals['errors'] += 1
+                        self.stdout.write(self.style.ERROR(f"{source_key} {url}: {error}"))
+                stats = self.apply(results, options['dry_run'], field_changes)
+                for key, value in stats.items():
+                    totals[key] += value
+
+        self.stdout.write(
+            f"\n{totals['changed']} noticias con cambios, {totals['unchanged']} sin cambios, "
+            f"{totals['missing']} sin noticia guardada, {totals['errors']} errores"
+        )
+        for field, count in field_changes.items():
+            if count:
+                self.stdout.write(f"  {field:<15} {count}")
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING("Modo --dry-run: no se guardó nada"))
+
+    def latest_pages(self, source, days):
+        """[(url, ruta)] de la última versión archivada de cada detalle"""
+        pages = ArchivedPage.objects.filter(source=source, kind=ArchivedPage.KIND_DETAIL)
+        if days is not None:
+            pages = pages.filter(created_at__gte=timezone.now() - timedelta(days=days))
+        return list(
+            pages.order_by('url', '-created_at').distinct('url').values_list('url', 'path')
+        )
+
+    def apply(self, results, dry_run, field_changes):
+        """Reemplaza en News los campos que cambiaron con la nueva extracción"""
+        extracted = {url: details for url, details, error in results if details}
+        news_by_url = {
+            news.url: news
+            for news in News.objects.filter(url__in=list(extracted)).select_related('source')
+        }
+        stats = {'changed': 0, 'unchanged': 0, 'missing': 0}
+        to_update = []
+
+        for url, details in extracted.items():
+            news = news_by_url.get(url)
+            if news is None:
+                stats['missing'] += 1
+                continue
+
+            details = NewsWriter(news.source).normalize(details)
+            if details is None:
+                stats['unchanged'] += 1
+                continue
+            changed = False
+            for field in REPARSE_FIELDS:
+                value = details.get(field)
+                if value and getattr(news, field) != value:
+                    setattr(news, field, value)
+                    field_changes[field] += 1
+                    changed = True
+
+            if changed:
+                news.update_fingerprint()
+                to_update.append(news)
+                stats['changed'] += 1
+            else:
+                stats['unchanged'] += 1
+
+        if to_update and not dry_run:
+            News.objects.bulk_update(to_update, REPARSE_FIELDS + FINGERPRINT_FIELDS)
+            update_search_vectors(News.objects.filter(pk__in=[news.pk for news in to_update]))
+            for source_id in {news.source_id for news in to_update}:
+                invalidate_feed(source_id)
+        return stats
@@ -0,0 +1,157 @@
+from django.core.management.base import BaseCommand, CommandError
+import json
+
+from apps.scrapers.replay import (
+    FIXTURES_DIR, GOLDEN_FILE, Fixture, ReplayRunner, build_golden,
+)
+from apps.scrapers.sources import SCRAPERS, get_scraper
+
+
+class Command(BaseCommand):
+    help = 'Reproduce páginas grabadas de los scrapers (sin red ni navegador) y mide velocidad y precisión'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--source',
+            type=str,
+            help='Fuente específica (por defecto, todas; falla si alguna no tiene grabación)',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=3,
+            help='Veces que se reproduce cada fuente para medir latencias',
+        )
+        parser.add_argument(
+            '--fail-under',
+            type=float,
+            default=None,
+            help='Terminar con error si algún campo queda bajo esta precisión (0 a 1)',
+        )
+        parser.add_argument(
+            '--record',
+            type=int,
+            default=None,
+            metavar='N',
+            help='Grabar la página de resultados y N detalles en vivo, y generar el golden (requiere --source)',
+        )
+        parser.add_argument(
+            '--json',
+            action='store_true',
+            help='Imprimir el reporte en JSON',
+        )
+
+    def handle(self, *args, **options):
+        if options['source'] and options['source'].lower() not in SCRAPERS:
+            raise CommandError(f"Fuente no encontrada: {options['source']}")
+
+        if options['record'] is not None:
+            if not options['source']:
+                raise CommandError('--record requiere --source')
+            self.record(options['source'].lower(), options['record'])
+            return
+
+        source_keys = [options['source'].lower()] if options['source'] else list(SCRAPERS)
+
+        reports = []
+        incomplete = {}
+        for source_key in source_keys:
+            fixture = Fixture(source_key)
+            missing = fixture.missing()
+            if missing:
+                # Una fuente sin casos no puede pasar la regresión en silencio
+                incomplete[source_key] = missing
+                self.stdout.write(self.style.ERROR(f"{source_key}: falta {', '.join(missing)}"))
+            if not fixture.exists:
+                continue
+            report = ReplayRunner(get_scraper(source_key), fixture).run(repeat=options['repeat'])
+            reports.append(report)
+
+        if options['json']:
+            summary = [
+                {key: value for key, value in report.items() if key not in ('news_list', 'details', 'dates')}
+                for report in reports
+            ]
+            self.stdout.write(json.dumps(summary, indent=2, ensure_ascii=False))
+        else:
+            for report in reports:
+                self.print_report(report)
+
+        if options['fail_under'] is not None:
+            failures = [
+                f"{report['source']}.{field} = {score:.2f}"
+                for report in reports
+                for field, score in report['accuracy'].items()
+                if score < options['fail_under']
+            ]
+            if failures:
+                raise CommandError(f"Precisión bajo {options['fail_under']}: {', '.join(failures)}")
+
+        if incomplete:
+            raise CommandError(
+                f"{len(incomplete)} fuentes sin grabación completa en {FIXTURES_DIR}: "
+                f"{', '.join(incomplete)}. Créalas con --source X --record N"
+            )
+
+    def print_report(self, report):
+        latency = report['latency_ms']
+        self.stdout.write(
+            f"\n{report['source']}: {report['items']} ítems en {report['seconds']:.2f}s "
+            f"({report['items_per_second']:.1f} ítems/s)"
+        )
+        for phase in ('list', 'detail', 'date'):
+            stats = latency[phase]
+            if stats['count']:
+                self.stdout.write(
+                    f"  {phase:<7} n={stats['count']:<4} p50 {stats['p50']:8.2f} ms  "
+                    f"p95 {stats['p95']:8.2f} ms  máx {stats['max']:8.2f} ms"
+                )
+
+        if not report['accuracy']:
+            self.stdout.write("  (sin golden para comparar)")
+        for field, score in report['accuracy'].items():
+            line = f"  {field:<15} {score * 100:6.1f}%"
+            self.stdout.write(self.style.SUCCESS(line) if score == 1 else self.style.ERROR(line))
+
+    def record(self, source_key, detail_count):
+        """Graba páginas en vivo y genera un golden a partir de la reproducción"""
+        scraper = get_scraper(source_key)
+        config = scraper.get_source_config()
+        fixture_dir = FIXTURES_DIR / source_key
+        fixture_dir.mkdir(parents=True, exist_ok=True)
+        pages = {}
+
+        try:
+            scraper.setup_selenium()
+            scraper.navigate(config['search_url'])
+            scraper.wait_for_selector()
+            (fixture_dir / 'list.html').write_text(scraper.driver.page_source, encoding='utf-8')
+            pages['list.html'] = config['search_url']
+
+            # Las URLs del detalle salen de la página recién grabada
+            self.write_golden(fixture_dir, pages)
+            news_list = ReplayRunner(get_scraper(source_key), Fixture(source_key)).run()['news_list']
+
+            for index, news_item in enumerate(news_list[:detail_count], start=1):
+                name = f'detail-{index}.html'
+                (fixture_dir / name).write_text(scraper.fetch_detail_html(news_item['url']), encoding='utf-8')
+                pages[name] = news_item['url']
+        finally:
+            scraper.cleanup_selenium()
+
+        self.write_golden(fixture_dir, pages)
+        report = ReplayRunner(get_scraper(source_key), Fixture(source_key)).run()
+        golden = build_golden(pages, report['news_list'], report['details'])
+        self.write_golden(fixture_dir, golden=golden)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Grabadas {len(pages)} páginas en {fixture_dir}. Revisa {GOLDEN_FILE} y agrega "
+            f"casos de fechas en 'dates' antes de versionarlo."
+        ))
+
+    def write_golden(self, fixture_dir, pages=None, golden=None):
+        golden = golden or {'pages': pages}
+        (fixture_dir / GOLDEN_FILE).write_text(
+            json.dumps(golden, indent=2, ensure_ascii=False) + '\n',
+            encoding='utf-8',
+        )
@@ -2,7 +2,8 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 import logging
 
-from apps.scrapers.sources import SCRAPERS, get_scraper
+from apps.scrapers.orchestrator import run_parallel, run_sequential
+from apps.scrapers.sources import SCRAPERS
 
 logger = logging.getLogger('scrapers')
 
@@ -20,6 +21,40 @@ class Command(BaseCommand):
             action='store_true',
             help='Ejecutar todos los scrapers',
         )
+        parser.add_argument(
+            '--parallel',
+            type=int,
+            default=1,
+            help='Cantidad de fuentes a ejecutar en paralelo (procesos)',
+        )
+        parser.add_argument(
+            '--timeout',
+            type=int,
+            default=None,
+            help='Timeout global en segundos para toda la corrida (solo con --parallel)',
+        )
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            help='Pedir el detalle solo de noticias que aún no están guardadas',
+        )
+        parser.add_argument(
+            '--refresh-days',
+            type=int,
+            default=None,
+            help='Modo incremental que además refresca noticias guardadas hace más de N días',
+        )
+        parser.add_argument(
+            '--bloom',
+            action='store_true',
+            help='Usar un filtro de Bloom en cache para descartar URLs nuevas sin consultar la BD',
+        )
+        parser.add_argument(
+            '--archive',
+            action='store_true',
+            default=None,
+            help='Guardar el HTML descargado para poder re-extraerlo con reparse_news',
+        )
         
     def handle(self, *args, **options):
         sources_to_scrape = []
@@ -41,14 +76,52 @@ class Command(BaseCommand):
         
         self.stdout.write(f"Iniciando scraping a las {timezone.now()}")
         
-        for source in sources_to_scrape:
-            try:
-                self.stdout.write(f"\nProcesando {source}...")
-                scraper = get_scraper(source)
-                scraper.scrape()
-                self.stdout.write(self.style.SUCCESS(f"✓ {source} completado"))
-            except Exception as e:
-                logger.error(f"Error en {source}: {e}")
-                self.stdout.write(self.style.ERROR(f"✗ {source} falló: {e}"))
-        
+        scraper_options = {
+            'incremental': options['incremental'],
+            'refresh_days': options['refresh_days'],
+            'use_bloom': options['bloom'],
+            'archive': options['archive'],
+        }
+
+        if options['parallel'] > 1:
+            self.stdout.write(f"Ejecutando {len(sources_to_scrape)} fuentes con {options['parallel']} procesos")
+            results = run_parallel(
+                sources_to_scrape,
+                options['parallel'],
+                timeout=options['timeout'],
+                options=scraper_options,
+            )
+        else:
+            results = run_sequential(sources_to_scrape, options=scraper_options)
+
+        self.print_summary(results)
+
         self.stdout.write(self.style.SUCCESS("\nScraping completado"))
+
+    def print_summary(self, results):
+        """Muestra el resumen combinado de todas las fuentes"""
+        self.stdout.write("\nResumen:")
+        total_found = 0
+        total_saved = 0
+        total_wait = 0.0
+
+        for result in results:
+            total_found += result['news_found']
+            total_saved += result['news_saved']
+            total_wait += result['wait_seconds']
+            line = (
+                f"{result['source']:<18} {result['status']:<10} "
+                f"{result['news_saved']:>4}/{result['news_found']:<4} {result['duration']:>7.1f}s "
+                f"(espera {result['wait_seconds']:.1f}s)"
+            )
+            if result['status'] == 'completed':
+                self.stdout.write(self.style.SUCCESS(f"✓ {line}"))
+            elif result['status'] in ('locked', 'skipped'):
+                self.stdout.write(self.style.WARNING(f"- {line} {result['error']}"))
+            else:
+                self.stdout.write(self.style.ERROR(f"✗ {line} {result['error']}"))
+
+        self.stdout.write(
+            f"Total: {total_saved}/{total_found} noticias guardadas, "
+            f"{total_wait:.1f}s esperando al navegador"
+        )
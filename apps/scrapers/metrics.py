@@ -0,0 +1,153 @@
+"""
+Métricas por fase de una corrida de scraping
+
+BaseScraper envuelve cada etapa en `metrics.phase(nombre)`:
+
+- browser_start: obtener y preparar Chrome
+- list_fetch: cargar la primera página de resultados
+- pagination: el resto de iter_news_pages (siguientes páginas, clics, scroll)
+- article_fetch: descargar y extraer el detalle de cada noticia
+- parse: construir árboles de BeautifulSoup (en cualquier etapa)
+- db_save: escribir en la BD
+- archive: guardar el HTML crudo (solo con el archivo activo)
+
+Las fases se anidan (el parseo ocurre dentro de la paginación o del
+detalle) y cada una acumula solo su tiempo propio, sin el de las fases
+internas, de modo que ningún segundo se cuenta dos veces. Los bytes son los
+del HTML de cada página parseada.
+
+El resultado (ScrapeMetrics.as_dict) se guarda en ScrapingLog.metrics:
+
+    {
+        "total_seconds": 84.2,
+        "phases": {"browser_start": {"seconds": 3.1, "count": 1}, ...},
+        "articles": {"count": 20, "p50_ms": 950.0, "p95_ms": 3100.0},
+        "bytes_transferred": 4812331,
+        "pages_visited": 23,
+        "relevance": {"deferred": 6, "skipped": 2, "related": 15, "unrelated": 5}
+    }
+"""
+import statistics
+import time
+from contextlib import contextmanager
+
+from django.utils import timezone
+
+PHASES = ['browser_start', 'list_fetch', 'pagination', 'article_fetch', 'parse', 'db_save', 'archive']
+
+
+def percentile(values, percent):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(percent / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+class ScrapeMetrics:
+    def __init__(self):
+        self.seconds = {phase: 0.0 for phase in PHASES}
+        self.counts = {phase: 0 for phase in PHASES}
+        self.bytes_transferred = 0
+        self.pages_visited = 0
+        # Ítems del listado dejados para el final u omitidos y resultado del detalle (ver relevance)
+        self.relevance = {'deferred': 0, 'skipped': 0, 'related': 0, 'unrelated': 0}
+        self.article_seconds = []
+        self._seen_pages = set()
+        self._stack = []
+        self._started = time.monotonic()
+
+    @contextmanager
+    def phase(self, name):
+        started = time.monotonic()
+        # Tiempo de las fases internas, que no se cuenta en esta
+        self._stack.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - started
+            nested = self._stack.pop()
+            self.seconds[name] = self.seconds.get(name, 0.0) + elapsed - nested
+            self.counts[name] = self.counts.get(name, 0) + 1
+            if self._stack:
+                self._stack[-1] += elapsed
+
+    @contextmanager
+    def article(self):
+        """Tiempo total (descarga + parseo) de una noticia"""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.article_seconds.append(time.monotonic() - started)
+
+    def add_bytes(self, content):
+        """Suma el tamaño de una página (una sola vez aunque se parsee de nuevo)"""
+        if not content or hash(content) in self._seen_pages:
+            return
+        self._seen_pages.add(hash(content))
+        self.bytes_transferred += len(content.encode('utf-8')) if isinstance(content, str) else len(content)
+
+    def as_dict(self):
+        articles_ms = [value * 1000 for value in self.article_seconds]
+        return {
+            'total_seconds': round(time.monotonic() - self._started, 3),
+            'phases': {
+                name: {'seconds': round(self.seconds[name], 3), 'count': self.counts[name]}
+                for name in self.seconds
+            },
+            'articles': {
+                'count': len(articles_ms),
+                'p50_ms': round(statistics.median(articles_ms), 1) if articles_ms else 0.0,
+                'p95_ms': round(percentile(articles_ms, 95), 1),
+            },
+            'bytes_transferred': self.bytes_transferred,
+            'pages_visited': self.pages_visited,
+            'relevance': dict(self.relevance),
+        }
+
+
+def _spread(values):
+    return {
+        'p50': round(statistics.median(values), 3) if values else 0.0,
+        'p95': round(percentile(values, 95), 3),
+    }
+
+
+def summarize_logs(logs):
+    """
+    p50/p95 por fuente de cada fase, del total, de los bytes y de las páginas,
+    más la serie diaria del total. `logs` son ScrapingLog con `metrics`.
+    """
+    by_source = {}
+    for log in logs:
+        if not log.metrics:
+            continue
+        by_source.setdefault(log.source.name, []).append(log)
+
+    summary = []
+    for source_name, source_logs in sorted(by_source.items()):
+        phases = {
+            phase: _spread([log.metrics.get('phases', {}).get(phase, {}).get('seconds', 0.0) for log in source_logs])
+            for phase in PHASES
+        }
+
+        daily = {}
+        for log in source_logs:
+            day = timezone.localtime(log.created_at).date().isoformat()
+            daily.setdefault(day, []).append(log.metrics.get('total_seconds', 0.0))
+
+        summary.append({
+            'source': source_name,
+            'runs': len(source_logs),
+            'total_seconds': _spread([log.metrics.get('total_seconds', 0.0) for log in source_logs]),
+            'phases': phases,
+            'article_p95_ms': _spread([log.metrics.get('articles', {}).get('p95_ms', 0.0) for log in source_logs]),
+            'bytes_transferred': _spread([log.metrics.get('bytes_transferred', 0) for log in source_logs]),
+            'pages_visited': _spread([log.metrics.get('pages_visited', 0) for log in source_logs]),
+            'daily': [
+                {'date': day, 'runs': len(totals), 'total_seconds': _spread(totals)}
+                for day, totals in sorted(daily.items())
+            ],
+        })
+    return summary
@@ -1,3 +1,41 @@
 from django.db import models
+from django.utils.translation import gettext_lazy as _
+from apps.core.mixins import TimestampedModel
+from apps.news.models import NewsSource
 
-# Create your models here.
+
+class ArchivedPage(TimestampedModel):
+    """
+    HTML crudo descargado por un scraper, guardado comprimido y
+    direccionado por contenido (ver apps.scrapers.archive). Una misma página
+    sin cambios entre corridas ocupa un solo archivo.
+    """
+    KIND_LIST = 'list'
+    KIND_DETAIL = 'detail'
+    KIND_CHOICES = [
+        (KIND_LIST, _('Listado')),
+        (KIND_DETAIL, _('Detalle')),
+    ]
+
+    source = models.ForeignKey(NewsSource, on_delete=models.CASCADE, related_name='archived_pages')
+    url = models.URLField(max_length=1000)
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES, default=KIND_DETAIL)
+    content_hash = models.CharField(max_length=64, db_index=True, help_text=_("SHA-256 del HTML sin comprimir"))
+    path = models.CharField(max_length=255, help_text=_("Ruta del archivo comprimido en el storage"))
+    size = models.PositiveIntegerField(default=0, help_text=_("Bytes del HTML sin comprimir"))
+    stored_size = models.PositiveIntegerField(default=0, help_text=_("Bytes guardados (comprimido)"))
+
+    def __str__(self):
+        return f"{self.source.name}: {self.url}"
+
+    class Meta:
+        verbose_name = _("Página archivada")
+        verbose_name_plural = _("Páginas archivadas")
+        ordering = ['-created_at']
+        constraints = [
+            models.UniqueConstraint(fields=['url', 'content_hash'], name='archivedpage_url_content_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['source', 'kind', '-created_at']),
+            models.Index(fields=['url', '-created_at']),
+        ]
@@ -0,0 +1,188 @@
+"""
+Orquestador de scrapers
+
+Ejecuta varias fuentes en un pool acotado de procesos. Las fuentes quedan
+aisladas entre sí (un fallo o un cuelgue de Chrome no afecta al resto), con
+un timeout global para toda la corrida. Cada worker sigue
+escribiendo su propio ScrapingLog a través de BaseScraper.scrape().
+
+Cada proceso mantiene su propio BrowserPool, de modo que Chrome se levanta
+una vez por worker y se reutiliza entre las fuentes que le toquen.
+"""
+import logging
+import multiprocessing
+import signal
+import sys
+import time
+from multiprocessing.util import Finalize
+
+from celery.exceptions import SoftTimeLimitExceeded
+from django.db import connections
+from django.utils import timezone
+
+from apps.news.models import ScrapingLog
+from apps.scrapers.browser import BrowserPool, get_driver_path
+from apps.scrapers.scheduling import source_lock
+from apps.scrapers.sources import SCRAPERS, get_scraper
+
+logger = logging.getLogger('scrapers')
+
+# Pool de navegadores propio de cada proceso worker
+_worker_browser_pool = None
+
+
+def _init_worker(driver_path):
+    """Prepara un worker: conexiones a BD propias y un navegador reutilizable"""
+    global _worker_browser_pool
+    connections.close_all()
+
+    _worker_browser_pool = BrowserPool(size=1, driver_path=driver_path)
+    # Cerrar Chrome al salir del worker, incluso si el pool lo termina (SIGTERM)
+    Finalize(None, _worker_browser_pool.close, exitpriority=10)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(1))
+
+
+def _scrape_in_worker(source_key, options):
+    return scrape_source(source_key, browser_pool=_worker_browser_pool, options=options)
+
+
+def _empty_result(source_key, status='failed', error=''):
+    return {
+        'source': source_key,
+        'status': status,
+        'news_found': 0,
+        'news_saved': 0,
+        'duration': 0.0,
+        'wait_seconds': 0.0,
+        'error': error,
+    }
+
+
+def scrape_source(source_key, browser_pool=None, options=None):
+    """
+    Ejecuta una fuente y devuelve un resumen serializable.
+    Se usa en modo secuencial, dentro de los workers y desde Celery.
+    `options` se pasa a BaseScraper.configure() (incremental, refresh_days...).
+    Si la fuente ya está corriendo en otro lado retorna status 'locked'.
+    """
+    started = time.monotonic()
+    result = _empty_result(source_key)
+
+    try:
+        with source_lock(source_key) as acquired:
+            if not acquired:
+                result.update({'status': 'locked', 'error': 'La fuente ya se está ejecutando'})
+                return result
+
+            scraper = get_scraper(source_key)
+            scraper.configure(browser_pool=browser_pool, **(options or {}))
+            scraper.scrape()
+
+        scraping_log = scraper.scraping_log
+        if scraping_log:
+            result.update({
+                'status': scraping_log.status,
+                'news_found': scraping_log.news_found,
+                'news_saved': scraping_log.news_saved,
+                'wait_seconds': scraping_log.wait_seconds,
+                'error': scraping_log.error_message,
+            })
+    except SoftTimeLimitExceeded:
+        # Que llegue a scrape_source_task (y el candado se libere al salir del with)
+        raise
+    except Exception as e:
+        logger.error(f"Error en {source_key}: {e}")
+        result['error'] = str(e)
+    finally:
+        result['duration'] = time.monotonic() - started
+        connections.close_all()
+
+    return result
+
+
+def run_sequential(source_keys, options=None):
+    """Ejecuta las fuentes una tras otra compartiendo un mismo navegador"""
+    browser_pool = BrowserPool(size=1)
+    try:
+        return [
+            scrape_source(source_key, browser_pool=browser_pool, options=options)
+            for source_key in source_keys
+        ]
+    finally:
+        browser_pool.close()
+
+
+def run_parallel(source_keys, processes, timeout=None, options=None):
+    """
+    Ejecuta las fuentes en un pool de `processes` procesos.
+
+    Los workers reutilizan su navegador entre fuentes; el BrowserPool lo
+    recicla cada cierta cantidad de páginas para acotar la memoria de Chrome.
+    Si se supera `timeout`
+    (segundos, para toda la corrida) los workers pendientes se terminan y sus
+    ScrapingLog se marcan como fallidos.
+    """
+    source_keys = list(source_keys)
+    if not source_keys:
+        return []
+
+    run_started_at = timezone.now()
+    deadline = time.monotonic() + timeout if timeout else None
+
+    # Resolver el chromedriver una sola vez para todos los workers
+    driver_path = get_driver_path()
+
+    # Las conexiones abiertas no deben compartirse entre procesos
+    connections.close_all()
+
+    context = multiprocessing.get_context('fork')
+    pool = context.Pool(
+        processes=max(1, min(processes, len(source_keys))),
+        initializer=_init_worker,
+        initargs=(driver_path,),
+    )
+
+    pending = {
+        source_key: pool.apply_async(_scrape_in_worker, (source_key, options))
+        for source_key in source_keys
+    }
+    pool.close()
+
+    results = []
+    timed_out = []
+    try:
+        for source_key, async_result in pending.items():
+            remaining = None if deadline is None else max(0, deadline - time.monotonic())
+            try:
+                results.append(async_result.get(remaining))
+            except multiprocessing.TimeoutError:
+                timed_out.append(source_key)
+                results.append(_empty_result(source_key, 'timeout', 'Timeout global de la corrida'))
+            except Exception as e:
+                # El worker murió sin devolver resultado
+                logger.error(f"Worker de {source_key} terminó inesperadamente: {e}")
+                results.append(_empty_result(source_key, error=str(e)))
+    finally:
+        if timed_out:
+            pool.terminate()
+        pool.join()
+
+    if timed_out:
+        _fail_running_logs(timed_out, run_started_at)
+
+    return results
+
+
+def _fail_running_logs(source_keys, run_started_at):
+    """Cierra los ScrapingLog que quedaron 'running' por workers terminados"""
+    source_names = [SCRAPERS[key].source_name for key in source_keys]
+    updated = ScrapingLog.objects.filter(
+        source__name__in=source_names,
+        status='running',
+        created_at__gte=run_started_at,
+    ).update(
+        status='failed',
+        error_message='Timeout global de la corrida',
+        finished_at=timezone.now(),
+    )
+    logger.warning(f"{updated} logs de scraping marcados como fallidos por timeout")
@@ -0,0 +1,96 @@
+"""
+Parseo de HTML para los scrapers
+
+Todas las fuentes usan la API de BeautifulSoup; lo que cambia aquí es el
+backend (lxml si está instalado, mucho más rápido que 'html.parser') y la
+posibilidad de parsear solo una parte de la página con un SoupStrainer
+(p. ej. el contenedor de resultados), además de reutilizar el mismo árbol
+cuando el HTML no cambió entre extract_news_list y la paginación.
+"""
+import time
+from collections import OrderedDict
+
+from bs4 import BeautifulSoup, SoupStrainer
+from django.conf import settings
+
+try:
+    import lxml  # noqa: F401
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+try:
+    import html5lib  # noqa: F401
+    HAS_HTML5LIB = True
+except ImportError:
+    HAS_HTML5LIB = False
+
+
+def available_parsers():
+    """Backends de BeautifulSoup instalados, del más rápido al más lento"""
+    parsers = []
+    if HAS_LXML:
+        parsers.append('lxml')
+    parsers.append('html.parser')
+    if HAS_HTML5LIB:
+        parsers.append('html5lib')
+    return parsers
+
+
+def default_parser():
+    parser = getattr(settings, 'SCRAPER_HTML_PARSER', '') or ('lxml' if HAS_LXML else 'html.parser')
+    if parser not in available_parsers():
+        return 'html.parser'
+    return parser
+
+
+def parse_html(html, parser=None, parse_only=None):
+    """
+    Parsea `html` con el backend configurado. `parse_only` es un
+    SoupStrainer opcional que restringe el árbol a los elementos que calzan.
+    """
+    return BeautifulSoup(html or '', parser or default_parser(), parse_only=parse_only)
+
+
+def class_strainer(name, css_class):
+    """
+    SoupStrainer de los `name` que tienen `css_class` entre sus clases.
+    Al filtrar durante el parseo, bs4 compara {'class': ...} contra el
+    atributo completo: 'w-grid-item' no calzaría con class="w-grid-item post".
+    """
+    return SoupStrainer(name, class_=lambda value: bool(value) and css_class in value.split())
+
+
+class SoupCache:
+    """
+    Memo de los últimos árboles parseados, por (HTML, variante). Evita
+    volver a parsear page_source cuando la página no cambió.
+    """
+
+    def __init__(self, size=4):
+        self.size = size
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.parse_seconds = 0.0
+
+    def get(self, html, key, build):
+        cache_key = (key, html)
+        soup = self._entries.get(cache_key)
+        if soup is not None:
+            self._entries.move_to_end(cache_key)
+            self.hits += 1
+            return soup
+
+        started = time.perf_counter()
+        soup = build()
+        self.parse_seconds += time.perf_counter() - started
+        self.misses += 1
+
+        self._entries[cache_key] = soup
+        while len(self._entries) > self.size:
+            self._entries.popitem(last=False)
+        return soup
+
+    def clear(self):
+        self._entries.clear()
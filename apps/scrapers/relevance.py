@@ -0,0 +1,125 @@
+"""
+Clasificador local de relevancia para PYMEMAD
+
+Las búsquedas por términos genéricos devuelven muchos resultados que no
+tienen que ver con la industria de la madera, y cada uno cuesta una carga
+de página. Este modelo puntúa un texto sin servicios externos:
+
+- el texto se pasa a palabras en minúsculas y sin tildes;
+- cada término del léxico es un prefijo (o una frase de prefijos, p. ej.
+  'pymes madereras'), así 'maderer' cubre maderero, madereras, etc. Los
+  de menos de MIN_PREFIX letras calzan solo completos o en plural, para
+  que 'pino' no cuente en 'Pinochet' ni 'infor' en 'informe';
+- el puntaje suma peso × (1 + log tf) de los términos presentes (tf
+  sublineal: repetir una palabra suma cada vez menos) y se lleva a [0, 1)
+  con 1 - exp(-suma / RELEVANCE_SCALE).
+
+Se usa dos veces por noticia:
+
+- listado (título + extracto): bajo SCRAPER_RELEVANCE_LIST_THRESHOLD la
+  noticia se deja para el final de la corrida, con tope
+  (SCRAPER_RELEVANCE_DEFER_LIMIT), o se omite, según 'relevance_mode';
+- detalle (título + extracto + contenido): fija News.is_pymemad_related
+  con SCRAPER_RELEVANCE_CONTENT_THRESHOLD.
+"""
+import math
+
+from django.conf import settings
+
+from apps.news.fingerprints import normalize_words
+
+# Prefijos sin tildes y su peso; las frases suman además de sus palabras
+DEFAULT_TERMS = {
+    'pymemad': 6.0,
+    'pymes madereras': 4.0,
+    'construccion en madera': 3.0,
+    'industria de la madera': 3.0,
+    'maderer': 2.5,
+    'aserrader': 2.5,
+    'remanufactur': 2.0,
+    'madera': 2.0,
+    'forestal': 1.5,
+    'corma': 1.5,
+    'incendio forestal': 1.5,
+    'infor': 1.0,
+    'bosque': 1.0,
+    'plantacion': 1.0,
+    'celulosa': 1.0,
+    'tablero': 1.0,
+    'eucalipto': 1.0,
+    'pino': 1.0,
+    'lena': 1.0,
+    'pyme': 1.0,
+}
+
+RELEVANCE_SCALE = 3.0
+MIN_PREFIX = 6
+
+
+def matches(word, prefix):
+    if len(prefix) >= MIN_PREFIX:
+        return word.startswith(prefix)
+    return word in (prefix, prefix + 's', prefix + 'es')
+
+
+class RelevanceClassifier:
+    """
+    Uso:
+        classifier = RelevanceClassifier()
+        classifier.score('Aserraderos del Biobío ...')   # 0.0 a 1.0
+        classifier.is_related(news_data)
+    """
+
+    def __init__(self, terms=None, list_threshold=None, content_threshold=None):
+        terms = dict(terms or DEFAULT_TERMS)
+        terms.update(getattr(settings, 'SCRAPER_RELEVANCE_TERMS', {}))
+        # Cada término como tupla de prefijos ya normalizados
+        self.terms = {
+            tuple(normalize_words(term)): float(weight)
+            for term, weight in terms.items()
+            if normalize_words(term)
+        }
+        self.list_threshold = list_threshold if list_threshold is not None else getattr(
+            settings, 'SCRAPER_RELEVANCE_LIST_THRESHOLD', 0.3
+        )
+        self.content_threshold = content_threshold if content_threshold is not None else getattr(
+            settings, 'SCRAPER_RELEVANCE_CONTENT_THRESHOLD', 0.6
+        )
+        self._first_words = {}
+        for prefixes in self.terms:
+            self._first_words.setdefault(prefixes[0], []).append(prefixes)
+
+    def term_frequencies(self, text):
+        """{término: veces que aparece} de los términos del léxico en `text`"""
+        words = normalize_words(text)
+        frequencies = {}
+        # Prefijos que calzan con cada palabra distinta, calculados una vez
+        word_matches = {}
+        for word in set(words):
+            word_matches[word] = [first for first in self._first_words if matches(word, first)]
+
+        for index, word in enumerate(words):
+            for first in word_matches[word]:
+                for prefixes in self._first_words[first]:
+                    following = words[index + 1:index + len(prefixes)]
+                    if len(following) != len(prefixes) - 1:
+                        continue
+                    if all(matches(candidate, prefix) for candidate, prefix in zip(following, prefixes[1:])):
+                        frequencies[prefixes] = frequencies.get(prefixes, 0) + 1
+        return frequencies
+
+    def score(self, text):
+        total = sum(
+            self.terms[prefixes] * (1 + math.log(count))
+            for prefixes, count in self.term_frequencies(text).items()
+        )
+        return 1 - math.exp(-total / RELEVANCE_SCALE)
+
+    def list_score(self, news_item):
+        """Puntaje de un ítem del listado (título y extracto, si lo trae)"""
+        return self.score(' '.join(filter(None, [news_item.get('title'), news_item.get('excerpt')])))
+
+    def is_related(self, news_data):
+        """Si la noticia completa (título, extracto y contenido) es del rubro"""
+        text = ' '.join(filter(None, [news_data.get('title'), news_data.get('excerpt'), news_data.get('content')]))
+        return self.score(text) >= self.content_threshold
@@ -0,0 +1,357 @@
+"""
+Reproducción de páginas grabadas de los scrapers
+
+Permite correr extract_news_list, extract_news_details y los normalizadores
+de fecha de cada fuente sobre HTML guardado, sin red ni navegador, para
+medir su velocidad y comparar lo extraído contra un archivo golden.
+
+Estructura de apps/scrapers/fixtures/<fuente>/:
+
+    list.html, list-2.html ...   páginas de resultados (en orden)
+    detail-1.html ...            páginas de detalle
+    golden.json                  {
+        "pages": {"list.html": "https://...", "detail-1.html": "https://..."},
+        "list": [{"title": "...", "url": "..."}],
+        "details": {"https://...": {"published_date": "...", "content": "inicio del texto", ...}},
+        "dates": {"parse_date": {"texto crudo": "2025-01-31T10:00:00-03:00"}}
+    }
+
+Los archivos se generan con `replay_scrapers --record` (o se arman a mano
+con el markup que esperan los selectores de la fuente) y el golden se
+revisa a mano antes de versionarlo. Cada fuente de SCRAPERS debe tener al
+menos una página de listado, una de detalle y el golden con 'list' y
+'details': `replay_scrapers` termina con error si a alguna le falta algo, y
+apps/scrapers/tests.py reproduce todas con cada backend de parseo.
+"""
+import json
+import statistics
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from apps.scrapers.metrics import percentile
+from apps.scrapers.parsing import parse_html
+
+FIXTURES_DIR = Path(__file__).resolve().parent / 'fixtures'
+GOLDEN_FILE = 'golden.json'
+
+# Campos del detalle que se comparan; 'content' se compara por prefijo
+DETAIL_FIELDS = ['content', 'excerpt', 'published_date', 'image_url', 'author']
+CONTENT_PREFIX = 200
+
+EMPTY_PAGE = '<html><head></head><body></body></html>'
+
+
+class ReplayElement:
+    """Elemento de solo lectura sobre un tag de BeautifulSoup"""
+
+    def __init__(self, tag):
+        self.tag = tag
+
+    @property
+    def text(self):
+        return self.tag.get_text(' ', strip=True)
+
+    def get_attribute(self, name):
+        value = self.tag.get(name)
+        if isinstance(value, list):
+            return ' '.join(value)
+        return value
+
+    def is_displayed(self):
+        # Sin navegador no hay clics: la paginación solo avanza por URL
+        return False
+
+    def is_enabled(self):
+        return False
+
+    def click(self):
+        pass
+
+    def find_element(self, by=By.ID, value=None):
+        return _find_element(self.tag, by, value)
+
+    def find_elements(self, by=By.ID, value=None):
+        return _find_elements(self.tag, by, value)
+
+
+def _find_elements(root, by, value):
+    if by == By.CSS_SELECTOR:
+        tags = root.select(value)
+    elif by == By.ID:
+        tags = root.find_all(id=value)
+    elif by == By.CLASS_NAME:
+        tags = root.find_all(class_=value)
+    elif by == By.TAG_NAME:
+        tags = root.find_all(value)
+    elif by == By.NAME:
+        tags = root.find_all(attrs={'name': value})
+    else:
+        tags = []
+    return [ReplayElement(tag) for tag in tags]
+
+
+def _find_element(root, by, value):
+    elements = _find_elements(root, by, value)
+    if not elements:
+        raise NoSuchElementException(f"{by}={value} no está en la página grabada")
+    return elements[0]
+
+
+class ReplayDriver:
+    """
+    Sustituto de WebDriver que sirve páginas grabadas por URL. Las URLs sin
+    grabación devuelven una página vacía.
+    """
+
+    def __init__(self, pages, start_url=None):
+        self.pages = pages
+        self.current_url = start_url or 'about:blank'
+        self.requested_urls = []
+        self._soup = None
+
+    @property
+    def page_source(self):
+        return self.pages.get(self.current_url, EMPTY_PAGE)
+
+    def get(self, url):
+        self.requested_urls.append(url)
+        self.current_url = url
+        self._soup = None
+
+    def _root(self):
+        if self._soup is None:
+            self._soup = parse_html(self.page_source)
+        return self._soup
+
+    def find_element(self, by=By.ID, value=None):
+        return _find_element(self._root(), by, value)
+
+    def find_elements(self, by=By.ID, value=None):
+        return _find_elements(self._root(), by, value)
+
+    def execute_script(self, script, *args):
+        if 'readyState' in script:
+            return 'complete'
+        if 'querySelector' in script and args and isinstance(args[0], list):
+            return any(self._root().select_one(selector) for selector in args[0])
+        if 'items.length' in script:
+            # Firma de listado (apps.scrapers.base.PAGE_SIGNATURE_JS): nunca cambia
+            return [self.current_url, 0, '', '']
+        return None
+
+    def execute_cdp_cmd(self, cmd, params):
+        return {}
+
+    def quit(self):
+        pass
+
+
+class Fixture:
+    """Páginas grabadas y golden de una fuente"""
+
+    def __init__(self, source_key, base_dir=FIXTURES_DIR):
+        self.source_key = source_key
+        self.dir = Path(base_dir) / source_key
+        golden_path = self.dir / GOLDEN_FILE
+        self.golden = json.loads(golden_path.read_text(encoding='utf-8')) if golden_path.exists() else {}
+
+        self.urls = self.golden.get('pages', {})
+        self.list_pages = []
+        self.detail_pages = []
+        # Por nombre sin extensión: list.html va antes que list-2.html
+        for path in sorted(self.dir.glob('*.html'), key=lambda path: path.stem):
+            url = self.urls.get(path.name, f'file://{path}')
+            html = path.read_text(encoding='utf-8')
+            if path.name.startswith('list'):
+                self.list_pages.append((url, html))
+            else:
+                self.detail_pages.append((url, html))
+
+    @property
+    def exists(self):
+        return bool(self.list_pages or self.detail_pages)
+
+    def missing(self):
+        """Lo que le falta a la grabación para servir de caso de regresión"""
+        missing = []
+        if not self.list_pages:
+            missing.append('list.html')
+        if not self.detail_pages:
+            missing.append('detail-N.html')
+        if not self.golden:
+            missing.append(GOLDEN_FILE)
+        else:
+            missing.extend(f"{GOLDEN_FILE}:'{key}'" for key in ('list', 'details') if not self.golden.get(key))
+        return missing
+
+    def pages_by_url(self):
+        return dict(self.list_pages + self.detail_pages)
+
+
+def serialize_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _field_matches(field, expected, actual):
+    actual = serialize_value(actual)
+    if field == 'content':
+        return (actual or '').startswith(expected or '')
+    if field == 'published_date' and expected and actual:
+        # Tolerar diferencias de zona horaria en la representación
+        return actual[:19] == expected[:19]
+    return (actual or '') == (expected or '')
+
+
+class ReplayRunner:
+    """
+    Uso:
+        runner = ReplayRunner(scraper, Fixture('emol'))
+        report = runner.run(repeat=3)
+    """
+
+    def __init__(self, scraper, fixture):
+        self.scraper = scraper
+        self.fixture = fixture
+
+    def _prepare(self):
+        """Deja el scraper leyendo solo de las páginas grabadas"""
+        pages = self.fixture.pages_by_url()
+        start_url = self.fixture.list_pages[0][0] if self.fixture.list_pages else None
+        # Sin archivar: el HTML grabado no debe terminar en ArchivedPage
+        self.scraper.configure(wait_budget=0, archive=False, rate_limit=False)
+        self.scraper.driver = ReplayDriver(pages, start_url=start_url)
+        # fetch_detail_html usa el HTML precargado antes de ir a la red
+        self.scraper._prefetched_html = dict(pages)
+        self.scraper._soup_cache.clear()
+
+    def run(self, repeat=1):
+        list_timings = []
+        detail_timings = []
+        date_timings = []
+        items = 0
+        news_list = []
+        details = {}
+
+        started = time.perf_counter()
+        for _ in range(max(1, repeat)):
+            self._prepare()
+
+            if self.fixture.list_pages:
+                page_started = time.perf_counter()
+                news_list = self.scraper.extract_news_list(self.fixture.list_pages[0][1])
+                list_timings.append(time.perf_counter() - page_started)
+                items += len(news_list)
+
+            list_items = {item.get('url'): item for item in news_list}
+            for url, _html in self.fixture.detail_pages:
+                # Como en process_news_item: el detalle ve los datos de su fila del listado
+                self.scraper.current_item = list_items.get(url)
+                detail_started = time.perf_counter()
+                details[url] = self.scraper.extract_news_details(url)
+                detail_timings.append(time.perf_counter() - detail_started)
+                items += 1
+            self.scraper.current_item = None
+
+            date_results, elapsed = self.run_date_normalizers()
+            date_timings.extend(elapsed)
+        total = time.perf_counter() - started
+
+        return {
+            'source': self.fixture.source_key,
+            'items': items,
+            'seconds': total,
+            'items_per_second': items / total if total else 0.0,
+            'latency_ms': {
+                'list': self.latency_summary(list_timings),
+                'detail': self.latency_summary(detail_timings),
+                'date': self.latency_summary(date_timings),
+            },
+            'accuracy': self.accuracy(news_list, details, date_results),
+            'news_list': news_list,
+            'details': details,
+            'dates': date_results,
+        }
+
+    def run_date_normalizers(self):
+        results = {}
+        elapsed = []
+        for method_name, cases in self.fixture.golden.get('dates', {}).items():
+            normalizer = getattr(self.scraper, method_name, None)
+            if normalizer is None:
+                continue
+            results[method_name] = {}
+            for raw in cases:
+                started = time.perf_counter()
+                value = normalizer(raw)
+                elapsed.append(time.perf_counter() - started)
+                results[method_name][raw] = serialize_value(value)
+        return results, elapsed
+
+    def latency_summary(self, timings):
+        timings_ms = [value * 1000 for value in timings]
+        return {
+            'count': len(timings_ms),
+            'p50': statistics.median(timings_ms) if timings_ms else 0.0,
+            'p95': percentile(timings_ms, 95),
+            'max': max(timings_ms, default=0.0),
+        }
+
+    def accuracy(self, news_list, details, date_results):
+        """Proporción de aciertos por campo contra el golden (None si no hay golden)"""
+        golden = self.fixture.golden
+        scores = {}
+
+        expected_list = golden.get('list')
+        if expected_list is not None:
+            expected_urls = {item['url'] for item in expected_list}
+            actual = {item.get('url'): item for item in news_list}
+            found = expected_urls & set(actual)
+            scores['list_recall'] = len(found) / len(expected_urls) if expected_urls else 1.0
+            scores['list_precision'] = len(found) / len(actual) if actual else float(not expected_urls)
+            titles_ok = sum(
+                1 for item in expected_list
+                if item['url'] in actual and actual[item['url']].get('title', '').strip() == item.get('title', '').strip()
+            )
+            scores['title'] = titles_ok / len(expected_list) if expected_list else 1.0
+
+        expected_details = golden.get('details', {})
+        for field in DETAIL_FIELDS:
+            checked = [
+                _field_matches(field, expected[field], details.get(url, {}).get(field))
+                for url, expected in expected_details.items()
+                if field in expected
+            ]
+            if checked:
+                scores[field] = sum(checked) / len(checked)
+
+        date_checks = [
+            date_results.get(method_name, {}).get(raw) == expected
+            for method_name, cases in golden.get('dates', {}).items()
+            for raw, expected in cases.items()
+        ]
+        if date_checks:
+            scores['dates'] = sum(date_checks) / len(date_checks)
+
+        return scores
+
+
+def build_golden(fixture_urls, news_list, details, dates=None):
+    """Golden inicial a partir de lo que extrae hoy el scraper (revisar a mano)"""
+    golden_details = {}
+    for url, detail in details.items():
+        entry = {field: serialize_value(detail.get(field)) for field in DETAIL_FIELDS if field != 'content'}
+        entry['content'] = (detail.get('content') or '')[:CONTENT_PREFIX]
+        golden_details[url] = entry
+
+    return {
+        'pages': fixture_urls,
+        'list': [{'title': item.get('title', ''), 'url': item.get('url', '')} for item in news_list],
+        'details': golden_details,
+        'dates': dates or {},
+    }
@@ -0,0 +1,99 @@
+"""
+Programación adaptativa de las fuentes
+
+Cada NewsSource tiene su propio intervalo entre corridas (scrape_interval,
+en minutos) que se ajusta tras cada corrida según lo que guardaron las
+últimas (ScrapingLog.news_saved): las fuentes con movimiento se consultan
+más seguido y las que no traen nada se espacian, dentro de
+[SCRAPER_MIN_INTERVAL, SCRAPER_MAX_INTERVAL].
+
+El candado por fuente (Redis) evita que una misma fuente corra dos veces a
+la vez, ya sea desde Celery o desde el comando scrape_news.
+"""
+import logging
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.news.models import ScrapingLog
+
+logger = logging.getLogger('scrapers')
+
+LOCK_KEY = 'scrapers:lock:{source_key}'
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+@contextmanager
+def source_lock(source_key):
+    """
+    Candado distribuido de una fuente. Entrega True si se obtuvo y False si
+    otra corrida lo tiene tomado (no espera).
+    """
+    timeout = _setting('SCRAPER_LOCK_TIMEOUT', 3600)
+    lock = cache.lock(LOCK_KEY.format(source_key=source_key), timeout=timeout)
+    acquired = lock.acquire(blocking=False)
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            try:
+                lock.release()
+            except Exception as e:
+                # Expiró antes de terminar: otra corrida pudo haberlo tomado
+                logger.warning(f"Candado de {source_key} expirado antes de liberarse: {e}")
+
+
+def adaptive_interval(source):
+    """Nuevo intervalo (minutos) de `source` según el rendimiento reciente"""
+    min_interval = _setting('SCRAPER_MIN_INTERVAL', 15)
+    max_interval = _setting('SCRAPER_MAX_INTERVAL', 720)
+    busy_threshold = _setting('SCRAPER_BUSY_THRESHOLD', 5)
+
+    recent = list(
+        ScrapingLog.objects.filter(source=source)
+        .exclude(status='running')
+        .order_by('-created_at')
+        .values_list('status', 'news_saved')[:_setting('SCRAPER_YIELD_WINDOW', 5)]
+    )
+    interval = source.scrape_interval
+    if not recent:
+        return interval
+
+    saved = [news_saved for status, news_saved in recent if status == 'completed']
+    average = sum(saved) / len(saved) if saved else 0
+
+    if average >= busy_threshold:
+        interval = interval / 2
+    elif not any(saved):
+        # Nada nuevo (o solo fallos) en las últimas corridas
+        interval = interval * 1.5
+    elif recent[0][1] >= busy_threshold:
+        interval = interval * 0.75
+
+    return int(min(max_interval, max(min_interval, round(interval))))
+
+
+def schedule_next(source, now=None):
+    """Ajusta el intervalo de `source` y fija su próxima corrida"""
+    now = now or timezone.now()
+    interval = adaptive_interval(source)
+    if interval != source.scrape_interval:
+        logger.info(f"{source.name}: intervalo {source.scrape_interval} -> {interval} min")
+
+    source.scrape_interval = interval
+    source.next_scrape_at = now + timedelta(minutes=interval)
+    source.save(update_fields=['scrape_interval', 'next_scrape_at', 'updated_at'])
+    return source.next_scrape_at
+
+
+def is_due(source, now=None):
+    now = now or timezone.now()
+    if not source.is_active or source.is_circuit_open(now):
+        return False
+    return source.next_scrape_at is None or source.next_scrape_at <= now
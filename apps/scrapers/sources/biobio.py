@@ -1,101 +1,28 @@
-from bs4 import BeautifulSoup
-from datetime import datetime
 import re
-import time
 from urllib.parse import urljoin
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
 from apps.scrapers.base import BaseScraper
 
 
 class BioBioScraper(BaseScraper):
-    def __init__(self):
-        super().__init__('Radio Bio Bio')
-        self._news_list_cache = []
+    source_name = 'Radio Bio Bio'
 
     def get_source_config(self):
         return {
             'base_url': 'https://www.biobiochile.cl',
             'search_url': 'https://www.biobiochile.cl/buscador.shtml?s=pymemad',
-            'requires_selenium': True
+            'requires_selenium': True,
+            'detail_selectors': ['div.post-content'],
+            'list_selector': '.section-buscador article.article',
         }
 
-    def save_news(self, news_data):
-        """Override para actualizar noticias existentes"""
-        try:
-            from apps.news.models import News
-
-            # Verificar qué datos estamos intentando guardar
-            print(f"Procesando: {news_data.get('title', 'Sin título')[:50]}...")
-
-            # Buscar si ya existe
-            try:
-                news = News.objects.get(url=news_data['url'])
-                # Ya existe - actualizar
-                updated = False
-
-                # Actualizar fecha si tenemos una nueva y es diferente
-                if news_data.get('published_date') and news.published_date != news_data['published_date']:
-                    news.published_date = news_data['published_date']
-                    updated = True
-                    print(f"Fecha actualizada: {news_data['published_date']}")
-
-                # Actualizar contenido si es más largo o si no teníamos
-                if news_data.get('content'):
-                    if not news.content or len(news_data['content']) > len(news.content):
-                        news.content = news_data['content']
-                        news.excerpt = news_data.get('excerpt', '')
-                        updated = True
-                        print(f"Contenido actualizado: {len(news_data['content'])} caracteres")
-
-                # Actualizar imagen si es diferente
-                if news_data.get('image_url') and news.image_url != news_data['image_url']:
-                    news.image_url = news_data['image_url']
-                    updated = True
-                    print(f"Imagen actualizada: {news_data['image_url']}")
-
-                if updated:
-                    news.save()
-                    print(f"✅ Actualizada: {news_data['title'][:50]}...")
-                    return True
-                else:
-                    print(f"Sin cambios: {news_data['title'][:50]}...")
-                    return False
-
-            except News.DoesNotExist:
-                # No existe - crear nueva
-                news = News.objects.create(
-                    source=self.source,
-                    title=news_data.get('title', ''),
-                    url=news_data['url'],
-                    content=news_data.get('content', ''),
-                    excerpt=news_data.get('excerpt', ''),
-                    published_date=news_data.get('published_date'),
-                    image_url=news_data.get('image_url', ''),
-                    author=news_data.get('author', ''),
-                )
-                print(f"✅ Nueva noticia guardada: {news_data['title'][:50]}...")
-                return True
-
-        except Exception as e:
-            print(f"Error guardando/actualizando noticia: {e}")
-            print(f"Datos problemáticos: {news_data}")
-            import traceback
-            print(traceback.format_exc())
-            return False
-
-    def extract_news_list(self, html_content):
-        """Extrae solo la lista básica de noticias con título, URL y fecha"""
-        soup = BeautifulSoup(html_content, 'html.parser')
-        news_list = []
+    def iter_news_pages(self, html_content):
+        """Entrega, por cada página de resultados, la lista básica de noticias con título, URL y fecha"""
+        soup = self.parse_list(html_content)
 
         try:
             if self.driver:
-                wait = WebDriverWait(self.driver, 20)
-                time.sleep(8)
-
                 # Procesar hasta 3 páginas de resultados
                 max_paginas = 3
                 pagina_actual = 1
@@ -103,15 +30,14 @@ class BioBioScraper(BaseScraper):
                 while pagina_actual <= max_paginas:
                     print(f"Procesando página {pagina_actual}...")
 
-                    try:
-                        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".results-container")))
+                    if self.wait_for_selector('.results-container'):
                         print("Contenedor de resultados cargado")
-                    except:
+                    else:
                         self.logger.warning("Timeout esperando resultados")
 
                     # Obtener HTML actualizado
                     html_content = self.driver.page_source
-                    soup = BeautifulSoup(html_content, 'html.parser')
+                    soup = self.parse_list(html_content)
 
                     # Buscar elementos de noticias
                     elementos_encontrados = []
@@ -151,15 +77,18 @@ class BioBioScraper(BaseScraper):
                                     if link_padre and '/noticias/' in link_padre.get('href', ''):
                                         elementos_encontrados.append(link_padre)
 
-                    # Procesar elementos encontrados
+                    # Procesar elementos encontrados (las páginas ya vistas
+                    # siguen en el DOM; BaseScraper descarta las repetidas)
+                    news_list = []
                     if elementos_encontrados:
                         print(f"Procesando {len(elementos_encontrados)} elementos...")
 
                         for elemento in elementos_encontrados:
                             noticia = self.extraer_datos_basicos(elemento)
-                            if noticia and not any(n['url'] == noticia['url'] for n in news_list):
+                            if noticia:
                                 news_list.append(noticia)
                                 print(f"Noticia encontrada: {noticia['title'][:60]}...")
+                    yield news_list
 
                     # Intentar cargar más resultados
                     if pagina_actual < max_paginas:
@@ -167,8 +96,9 @@ class BioBioScraper(BaseScraper):
                             boton_mas = self.driver.find_element(By.CSS_SELECTOR, ".fetch-btn")
                             if boton_mas.is_displayed() and boton_mas.is_enabled():
                                 print("Cargando más resultados...")
-                                self.driver.execute_script("arguments[0].click();", boton_mas)
-                                time.sleep(5)
+                                if not self.click_and_wait(boton_mas):
+                                    print("No cargaron más resultados")
+                                    break
                                 pagina_actual += 1
                             else:
                                 break
@@ -183,10 +113,6 @@ class BioBioScraper(BaseScraper):
             import traceback
             print(traceback.format_exc())
 
-        # Guardar en cache para acceso posterior
-        self._news_list_cache = news_list
-        return news_list
-
     def extraer_datos_basicos(self, elemento):
         """Extraer solo datos básicos de la lista (título, URL, fecha)"""
         try:
@@ -219,7 +145,7 @@ class BioBioScraper(BaseScraper):
                 fecha_texto = fecha_elem.get_text()
                 fecha_texto = ' '.join(fecha_texto.split()).strip()
                 print(f"Fecha encontrada: {fecha_texto}")
-                fecha_parseada = self.parsear_fecha_desde_texto(fecha_texto)
+                fecha_parseada = self.parse_date(fecha_texto)
 
             if titulo and url and 'biobiochile.cl' in url:
                 return {
@@ -246,26 +172,21 @@ class BioBioScraper(BaseScraper):
         try:
             print(f"Obteniendo contenido de: {news_url}")
 
-            # Primero buscar si ya tenemos la fecha en el cache
-            for item in self._news_list_cache:
-                if item.get('url') == news_url and item.get('published_date'):
-                    details['published_date'] = item['published_date']
-                    print(f"Fecha recuperada del cache: {details['published_date']}")
-                    break
+            # Primero usar la fecha del listado, si la trae
+            item = self.list_item_for(news_url)
+            if item.get('published_date'):
+                details['published_date'] = item['published_date']
+                print(f"Fecha recuperada del listado: {details['published_date']}")
 
-            # Navegar a la página
-            self.driver.get(news_url)
-            time.sleep(3)  # Esperar menos tiempo
-
-            # Obtener el HTML
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            # Obtener el HTML (sin navegador si la página viene renderizada)
+            soup = self.parse_html(self.fetch_detail_html(news_url))
 
             # Si no tenemos fecha, buscarla en la página
             if not details['published_date']:
                 fecha_elem = soup.find('div', class_='article-date-hour')
                 if fecha_elem:
                     fecha_texto = ' '.join(fecha_elem.get_text().split()).strip()
-                    details['published_date'] = self.parsear_fecha_desde_texto(fecha_texto)
+                    details['published_date'] = self.parse_date(fecha_texto)
 
             # Buscar contenido principal
             contenido = ""
@@ -348,57 +269,3 @@ class BioBioScraper(BaseScraper):
                 print("Devolviendo al menos la fecha")
 
         return details
-
-    def parsear_fecha_desde_texto(self, fecha_texto):
-        """Parsear fecha desde el texto"""
-        try:
-            if '|' in fecha_texto:
-                partes = fecha_texto.split('|')
-                fecha_str = partes[0].strip()
-                hora_str = partes[1].strip() if len(partes) > 1 else ""
-
-                fecha_normalizada = self.normalizar_fecha_biobio(fecha_str)
-                if fecha_normalizada and hora_str:
-                    try:
-                        hora_partes = hora_str.split(':')
-                        if len(hora_partes) == 2:
-                            hora = int(hora_partes[0])
-                            minuto = int(hora_partes[1])
-                            fecha_normalizada = fecha_normalizada.replace(hour=hora, minute=minuto)
-                    except:
-                        pass
-
-                return fecha_normalizada
-            else:
-                return self.normalizar_fecha_biobio(fecha_texto)
-        except Exception as e:
-            print(f"Error parseando fecha {fecha_texto}: {e}")
-
-        return None
-
-    def normalizar_fecha_biobio(self, fecha_texto):
-        """Normalizar formato de fecha de Bio Bio"""
-        meses = {
-            'enero': 1, 'febrero': 2, 'marzo': 3, 'abril': 4,
-            'mayo': 5, 'junio': 6, 'julio': 7, 'agosto': 8,
-            'septiembre': 9, 'octubre': 10, 'noviembre': 11, 'diciembre': 12
-        }
-
-        try:
-            # Remover día de la semana y comas
-            fecha_limpia = re.sub(r'^[a-záéíóú]+\s+', '', fecha_texto.lower(), flags=re.IGNORECASE)
-            fecha_limpia = fecha_limpia.replace(',', '')
-
-            partes = fecha_limpia.strip().split()
-            if len(partes) >= 3:
-                dia = int(partes[0])
-                mes_nombre = partes[1].lower()
-                año = int(partes[2])
-
-                for mes_key, mes_num in meses.items():
-                    if mes_key in mes_nombre:
-                        return datetime(año, mes_num, dia)
-        except Exception as e:
-            print(f"Error normalizando fecha {fecha_texto}: {e}")
-
-        return None
@@ -1,124 +1,50 @@
 from apps.scrapers.base import BaseScraper
-from bs4 import BeautifulSoup
-from datetime import datetime
+from bs4 import SoupStrainer
 import re
-import time
 from urllib.parse import urljoin
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from django.utils import timezone as django_timezone
 
 
 class Canal9Scraper(BaseScraper):
-    def __init__(self):
-        super().__init__('Canal 9')
+    source_name = 'Canal 9'
 
-    def save_news(self, news_data):
-        """Override para actualizar noticias existentes"""
-        try:
-            from apps.news.models import News
-
-            # Verificar qué datos estamos intentando guardar
-            print(f"Procesando: {news_data.get('title', 'Sin título')[:50]}...")
-
-            # Si hay video_url, guardarlo como imagen o crear una URL corta
-            if news_data.get('video_url'):
-                # Opción 1: Guardar solo una referencia corta
-                news_data['image_url'] = 'VIDEO_CANAL9'
-                # O puedes extraer el ID del video si es posible
-                video_match = re.search(r'/vod/([^?]+)', news_data['video_url'])
-                if video_match:
-                    video_id = video_match.group(1)
-                    news_data['image_url'] = f'https://rudo.video/vod/{video_id}'
-
-            # Buscar si ya existe
-            try:
-                news = News.objects.get(url=news_data['url'])
-                # Ya existe - actualizar
-                updated = False
-
-                # Actualizar fecha si tenemos una nueva y es diferente
-                if news_data.get('published_date') and news.published_date != news_data['published_date']:
-                    news.published_date = news_data['published_date']
-                    updated = True
-                    print(f"Fecha actualizada: {news_data['published_date']}")
-
-                # Actualizar contenido si es más largo o si no teníamos
-                if news_data.get('content'):
-                    if not news.content or len(news_data['content']) > len(news.content):
-                        news.content = news_data['content']
-                        news.excerpt = news_data.get('excerpt', '')
-                        updated = True
-                        print(f"Contenido actualizado: {len(news_data['content'])} caracteres")
-
-                # Actualizar imagen si es diferente
-                if news_data.get('image_url') and news.image_url != news_data['image_url']:
-                    # Truncar si es muy larga
-                    if len(news_data['image_url']) > 200:
-                        news_data['image_url'] = news_data['image_url'][:200]
-                    news.image_url = news_data['image_url']
-                    updated = True
-                    print(f"Media actualizado: {news_data['image_url'][:50]}...")
-
-                if updated:
-                    news.save()
-                    print(f"✅ Actualizada: {news_data['title'][:50]}...")
-                    return True
-                else:
-                    print(f"Sin cambios: {news_data['title'][:50]}...")
-                    return False
-
-            except News.DoesNotExist:
-                # No existe - crear nueva
-                # Truncar campos si son muy largos
-                if news_data.get('image_url') and len(news_data['image_url']) > 200:
-                    news_data['image_url'] = news_data['image_url'][:200]
-
-                news = News.objects.create(
-                    source=self.source,
-                    title=news_data.get('title', ''),
-                    url=news_data['url'],
-                    content=news_data.get('content', ''),
-                    excerpt=news_data.get('excerpt', ''),
-                    published_date=news_data.get('published_date'),
-                    image_url=news_data.get('image_url', ''),
-                    author=news_data.get('author', ''),
-                )
-                print(f"✅ Nueva noticia guardada: {news_data['title'][:50]}...")
-                return True
-
-        except Exception as e:
-            print(f"Error guardando/actualizando noticia: {e}")
-            print(f"Datos problemáticos: {news_data}")
-            import traceback
-            print(traceback.format_exc())
-            return False
+    def prepare_news_data(self, news_data):
+        """Guardar el video como una referencia corta en image_url"""
+        if news_data.get('video_url'):
+            news_data['image_url'] = 'VIDEO_CANAL9'
+            video_match = re.search(r'/vod/([^?]+)', news_data['video_url'])
+            if video_match:
+                news_data['image_url'] = f'https://rudo.video/vod/{video_match.group(1)}'
+        return news_data
 
     def get_source_config(self):
         return {
             'base_url': 'https://www.canal9.cl',
             'search_url': 'https://www.canal9.cl/buscador/Pymemad',
-            'requires_selenium': True
+            'requires_selenium': True,
+            'detail_selectors': ['p[class*="border-l-3px"]', 'div[class*="md:px-45px"] p'],
+            'list_selector': 'article',
+            'list_strainer': SoupStrainer('article'),
+            # Basta el src del iframe del reproductor; no cargar el video
+            'block_urls': ['*rudo.video*', '*youtube.com/embed*', '*player.vimeo.com*'],
         }
 
     def extract_news_list(self, html_content):
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = self.parse_list(html_content)
         news_list = []
 
         try:
-            # Dar tiempo para que cargue el contenido dinámico
             if self.driver:
-                time.sleep(8)
-
-                # Hacer scroll para cargar más contenido
+                # Hacer scroll para cargar más contenido mientras siga apareciendo
                 for _ in range(3):
-                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(4)
+                    if not self.scroll_and_wait():
+                        break
 
                 # Obtener el HTML actualizado después del scroll
                 html_content = self.driver.page_source
-                soup = BeautifulSoup(html_content, 'html.parser')
+                soup = self.parse_list(html_content)
 
             # Buscar artículos (estructura moderna de Canal 9)
             articulos = soup.find_all('article')
@@ -184,16 +110,9 @@ class Canal9Scraper(BaseScraper):
         }
 
         try:
-            if self.driver:
-                self.driver.get(news_url)
-                time.sleep(5)  # Más tiempo para cargar el contenido
-                html = self.driver.page_source
-            else:
-                import requests
-                response = requests.get(news_url)
-                html = response.text
+            html = self.fetch_detail_html(news_url)
 
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.parse_html(html)
 
             # EXTRAER FECHA - Buscar el formato específico de Canal 9
             # Formato: "30 September 2024 | 14:00 hrs"
@@ -208,7 +127,7 @@ class Canal9Scraper(BaseScraper):
                 else:
                     fecha_parte = fecha_texto.strip()
 
-                fecha_normalizada = self.normalizar_fecha_canal9(fecha_parte)
+                fecha_normalizada = self.parse_date(fecha_parte)
                 if fecha_normalizada:
                     details['published_date'] = fecha_normalizada
                     print(f"Fecha parseada: {fecha_normalizada}")
@@ -332,64 +251,3 @@ class Canal9Scraper(BaseScraper):
             print(traceback.format_exc())
 
         return details
-
-    def normalizar_fecha_canal9(self, fecha_texto):
-        """Normalizar formato de fecha de Canal 9"""
-        # Meses en inglés y español
-        meses = {
-            # Español
-            'enero': 1, 'febrero': 2, 'marzo': 3, 'abril': 4,
-            'mayo': 5, 'junio': 6, 'julio': 7, 'agosto': 8,
-            'septiembre': 9, 'octubre': 10, 'noviembre': 11, 'diciembre': 12,
-            # Español abreviado
-            'ene': 1, 'feb': 2, 'mar': 3, 'abr': 4,
-            'may': 5, 'jun': 6, 'jul': 7, 'ago': 8,
-            'sep': 9, 'sept': 9, 'oct': 10, 'nov': 11, 'dic': 12,
-            # Inglés
-            'january': 1, 'february': 2, 'march': 3, 'april': 4,
-            'may': 5, 'june': 6, 'july': 7, 'august': 8,
-            'september': 9, 'october': 10, 'november': 11, 'december': 12,
-            # Inglés abreviado
-            'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4,
-            'jun': 6, 'jul': 7, 'aug': 8,
-            'sep': 9, 'sept': 9, 'oct': 10, 'nov': 11, 'dec': 12
-        }
-
-        try:
-            # Limpiar y normalizar el texto
-            fecha_limpia = fecha_texto.strip().lower()
-
-            # Remover "hrs" si existe
-            fecha_limpia = fecha_limpia.replace(' hrs', '').strip()
-
-            # Dividir en partes
-            partes = fecha_limpia.split()
-
-            if len(partes) >= 3:
-                # Formato esperado: "30 September 2024"
-                dia = int(partes[0])
-                mes_nombre = partes[1].lower()
-                año = int(partes[2])
-
-                # Buscar el mes en el diccionario
-                mes_num = None
-                for mes_key, mes_valor in meses.items():
-                    if mes_key == mes_nombre or mes_nombre.startswith(mes_key):
-                        mes_num = mes_valor
-                        break
-
-                if mes_num:
-                    # Crear fecha con timezone awareness
-                    fecha_resultado = datetime(año, mes_num, dia)
-                    # Hacer la fecha timezone-aware
-                    fecha_resultado = django_timezone.make_aware(fecha_resultado)
-                    print(f"Fecha parseada correctamente: {fecha_texto} -> {fecha_resultado}")
-                    return fecha_resultado
-                else:
-                    print(f"No se pudo encontrar el mes '{mes_nombre}' en el diccionario")
-
-        except Exception as e:
-            self.logger.error(f"Error normalizando fecha '{fecha_texto}': {e}")
-            print(f"Error parseando fecha: {e}")
-
-        return None
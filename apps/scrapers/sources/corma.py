@@ -1,120 +1,41 @@
 from apps.scrapers.base import BaseScraper
-from bs4 import BeautifulSoup
-from datetime import datetime
+from apps.scrapers.parsing import class_strainer
 import re
-import time
 from urllib.parse import urljoin
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from django.utils import timezone as django_timezone
 
 
 class CormaScraper(BaseScraper):
-    def __init__(self):
-        super().__init__('CORMA')
-
-    def save_news(self, news_data):
-        """Override para actualizar noticias existentes"""
-        try:
-            from apps.news.models import News
-
-            # Verificar qué datos estamos intentando guardar
-            print(f"Procesando: {news_data.get('title', 'Sin título')[:50]}...")
-
-            # Buscar si ya existe
-            try:
-                news = News.objects.get(url=news_data['url'])
-                # Ya existe - actualizar
-                updated = False
-
-                # Actualizar fecha si tenemos una nueva y es diferente
-                if news_data.get('published_date') and news.published_date != news_data['published_date']:
-                    news.published_date = news_data['published_date']
-                    updated = True
-                    print(f"Fecha actualizada: {news_data['published_date']}")
-
-                # Actualizar contenido si es más largo o si no teníamos
-                if news_data.get('content'):
-                    if not news.content or len(news_data['content']) > len(news.content):
-                        news.content = news_data['content']
-                        news.excerpt = news_data.get('excerpt', '')
-                        updated = True
-                        print(f"Contenido actualizado: {len(news_data['content'])} caracteres")
-
-                # Actualizar imagen si es diferente o no teníamos
-                if news_data.get('image_url') and news.image_url != news_data['image_url']:
-                    news.image_url = news_data['image_url']
-                    updated = True
-                    print(f"Imagen actualizada: {news_data['image_url'][:80]}...")
-
-                # Actualizar categoría/autor si no teníamos
-                if news_data.get('author') and not news.author:
-                    news.author = news_data['author']
-                    updated = True
-                    print(f"Categoría actualizada: {news_data['author']}")
-
-                if updated:
-                    news.save()
-                    print(f"✅ Actualizada: {news_data['title'][:50]}...")
-                    return True
-                else:
-                    print(f"Sin cambios: {news_data['title'][:50]}...")
-                    return False
-
-            except News.DoesNotExist:
-                # No existe - crear nueva
-                news = News.objects.create(
-                    source=self.source,
-                    title=news_data.get('title', ''),
-                    url=news_data['url'],
-                    content=news_data.get('content', ''),
-                    excerpt=news_data.get('excerpt', ''),
-                    published_date=news_data.get('published_date'),
-                    image_url=news_data.get('image_url', ''),
-                    author=news_data.get('author', ''),
-                )
-                print(f"✅ Nueva noticia guardada: {news_data['title'][:50]}...")
-                return True
-
-        except Exception as e:
-            print(f"Error guardando/actualizando noticia: {e}")
-            print(f"Datos problemáticos: {news_data}")
-            import traceback
-            print(traceback.format_exc())
-            return False
+    source_name = 'CORMA'
 
     def get_source_config(self):
         return {
             'base_url': 'https://www.corma.cl',
             'search_url': 'https://www.corma.cl/?s=PYMEMAD',
-            'requires_selenium': True
+            'requires_selenium': True,
+            'detail_selectors': ['div.dslc-tp-content', 'div.dslc-tp-excerpt'],
+            'list_selector': '.dslc-posts .dslc-blog-post',
+            'list_strainer': class_strainer('div', 'dslc-posts'),
         }
 
     def extract_news_list(self, html_content):
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = self.parse_list(html_content)
         news_list = []
 
         try:
             if self.driver:
-                wait = WebDriverWait(self.driver, 30)
-
-                # Esperar que cargue la página
-                self.logger.info("Esperando que carguen los resultados...")
-                time.sleep(5)
-
                 # Esperar a que aparezca el contenedor de posts
-                wait.until(EC.presence_of_element_located((By.CLASS_NAME, "dslc-posts")))
+                if not self.wait_for_selector('.dslc-posts'):
+                    self.logger.warning("No se encontró contenedor de posts")
+                    return news_list
 
                 noticias_procesadas = set()
                 scroll_count = 0
                 max_scroll = 5
-                altura_anterior = 0
 
                 while scroll_count < max_scroll:
                     # Obtener HTML actualizado
                     html_content = self.driver.page_source
-                    soup = BeautifulSoup(html_content, 'html.parser')
+                    soup = self.parse_list(html_content)
 
                     # Buscar el contenedor de posts
                     posts_container = soup.find('div', class_='dslc-posts')
@@ -141,16 +62,10 @@ class CormaScraper(BaseScraper):
 
                     # Si no hay noticias nuevas, intentar scroll
                     if noticias_nuevas == 0:
-                        # Hacer scroll hacia abajo
-                        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                        time.sleep(3)
-
-                        # Verificar si la altura cambió
-                        altura_actual = self.driver.execute_script("return document.body.scrollHeight")
-                        if altura_actual == altura_anterior:
+                        # Hacer scroll hacia abajo y esperar nuevos posts
+                        if not self.scroll_and_wait():
                             self.logger.info("No hay más contenido para cargar")
                             break
-                        altura_anterior = altura_actual
 
                     scroll_count += 1
 
@@ -204,16 +119,9 @@ class CormaScraper(BaseScraper):
         }
 
         try:
-            if self.driver:
-                self.driver.get(news_url)
-                time.sleep(4)
-                html = self.driver.page_source
-            else:
-                import requests
-                response = requests.get(news_url)
-                html = response.text
+            html = self.fetch_detail_html(news_url)
 
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.parse_html(html)
 
             # EXTRAER IMAGEN PRINCIPAL - Buscar en diferentes lugares
             # Primero buscar la imagen principal del post
@@ -260,7 +168,7 @@ class CormaScraper(BaseScraper):
                             if primer_li and not primer_li.find('a'):
                                 texto = primer_li.get_text().strip()
                                 print(f"Fecha encontrada (método 1): {texto}")
-                                fecha_normalizada = self.normalizar_fecha_corma(texto)
+                                fecha_normalizada = self.parse_date(texto)
                                 if fecha_normalizada:
                                     details['published_date'] = fecha_normalizada
                                     fecha_encontrada = True
@@ -277,7 +185,7 @@ class CormaScraper(BaseScraper):
                         # Verificar si parece una fecha
                         if re.search(r'\d{1,2}.*\d{4}', texto) and len(texto) < 50:
                             print(f"Fecha encontrada (método 2): {texto}")
-                            fecha_normalizada = self.normalizar_fecha_corma(texto)
+                            fecha_normalizada = self.parse_date(texto)
                             if fecha_normalizada:
                                 details['published_date'] = fecha_normalizada
                                 fecha_encontrada = True
@@ -343,63 +251,3 @@ class CormaScraper(BaseScraper):
             print(traceback.format_exc())
 
         return details
-
-    def normalizar_fecha_corma(self, fecha_texto):
-        """Normalizar formato de fecha de CORMA"""
-        meses = {
-            'enero': 1, 'febrero': 2, 'marzo': 3, 'abril': 4,
-            'mayo': 5, 'junio': 6, 'julio': 7, 'agosto': 8,
-            'septiembre': 9, 'octubre': 10, 'noviembre': 11, 'diciembre': 12,
-            'ene': 1, 'feb': 2, 'mar': 3, 'abr': 4,
-            'may': 5, 'jun': 6, 'jul': 7, 'ago': 8,
-            'sep': 9, 'sept': 9, 'oct': 10, 'nov': 11, 'dic': 12
-        }
-
-        try:
-            # Si es formato ISO datetime
-            if 'T' in fecha_texto or (fecha_texto.count('-') == 2 and len(fecha_texto) >= 10):
-                try:
-                    fecha_dt = datetime.fromisoformat(fecha_texto.replace('Z', '+00:00'))
-                    return django_timezone.make_aware(fecha_dt)
-                except:
-                    pass
-
-            # Limpiar el texto
-            fecha_limpia = fecha_texto.strip().lower()
-            # Remover comas
-            fecha_limpia = fecha_limpia.replace(',', '')
-
-            # Buscar patrón día mes año (ej: "2 junio 2025")
-            for mes_esp, mes_num in meses.items():
-                if mes_esp in fecha_limpia:
-                    # Buscar el patrón con el mes
-                    pattern = r'(\d{1,2})\s+' + mes_esp + r'\s+(\d{4})'
-                    match = re.search(pattern, fecha_limpia)
-                    if match:
-                        dia = int(match.group(1))
-                        año = int(match.group(2))
-                        fecha_dt = datetime(año, mes_num, dia)
-                        # Hacer timezone-aware
-                        fecha_dt = django_timezone.make_aware(fecha_dt)
-                        print(f"Fecha parseada correctamente: {fecha_texto} -> {fecha_dt}")
-                        return fecha_dt
-
-            # Intentar otro formato: mes día, año
-            match = re.search(r'(\w+)\s+(\d{1,2}),?\s+(\d{4})', fecha_limpia)
-            if match:
-                mes_nombre = match.group(1)
-                dia = int(match.group(2))
-                año = int(match.group(3))
-
-                for mes_key, mes_num in meses.items():
-                    if mes_key == mes_nombre or mes_nombre.startswith(mes_key):
-                        fecha_dt = datetime(año, mes_num, dia)
-                        fecha_dt = django_timezone.make_aware(fecha_dt)
-                        print(f"Fecha parseada (formato 2): {fecha_texto} -> {fecha_dt}")
-                        return fecha_dt
-
-        except Exception as e:
-            self.logger.error(f"Error normalizando fecha '{fecha_texto}': {e}")
-            print(f"Error parseando fecha: {e}")
-
-        return None
@@ -1,131 +1,29 @@
 from apps.scrapers.base import BaseScraper
-from bs4 import BeautifulSoup
-from datetime import datetime
+from apps.scrapers.parsing import class_strainer
 import re
-import time
 from urllib.parse import urljoin
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
 
 class DiarioConcepcionScraper(BaseScraper):
-    def __init__(self):
-        super().__init__('Diario Concepción')
-        self._news_list_cache = []
+    source_name = 'Diario Concepción'
 
     def get_source_config(self):
         return {
             'base_url': 'https://www.diarioconcepcion.cl',
             'search_url': 'https://www.diarioconcepcion.cl/search?s=pymemad',
-            'requires_selenium': True
+            'requires_selenium': True,
+            'detail_selectors': ['div.the-single__text'],
+            'list_selector': 'div.l-list__item.main-headline',
+            'list_strainer': class_strainer('div', 'l-list'),
         }
 
-    def save_news(self, news_data):
-        """Override para actualizar noticias existentes con mejor logging"""
-        try:
-            from apps.news.models import News
-
-            # Logging detallado de entrada
-            print("=" * 60)
-            print(f"📰 Procesando noticia:")
-            print(f"   Título: {news_data.get('title', 'Sin título')}")
-            print(f"   URL: {news_data.get('url', 'Sin URL')}")
-            print(f"   Fecha: {news_data.get('published_date', 'Sin fecha')}")
-            print(f"   Contenido: {len(news_data.get('content', ''))} caracteres")
-            print(f"   Imagen: {'Sí' if news_data.get('image_url') else 'No'}")
-
-            # Buscar si ya existe
-            try:
-                news = News.objects.get(url=news_data['url'])
-                print(f"⚠️  Noticia YA EXISTE en BD")
-
-                # Ya existe - verificar qué campos actualizar
-                updated = False
-                updates = []
-
-                # Comparar y actualizar fecha
-                if news_data.get('published_date'):
-                    if news.published_date != news_data['published_date']:
-                        old_date = news.published_date
-                        news.published_date = news_data['published_date']
-                        updated = True
-                        updates.append(f"Fecha: {old_date} → {news_data['published_date']}")
-                    else:
-                        print(f"   Fecha sin cambios: {news.published_date}")
-
-                # Comparar y actualizar contenido
-                if news_data.get('content'):
-                    old_len = len(news.content) if news.content else 0
-                    new_len = len(news_data['content'])
-
-                    if not news.content or new_len > old_len:
-                        news.content = news_data['content']
-                        news.excerpt = news_data.get('excerpt', '')
-                        updated = True
-                        updates.append(f"Contenido: {old_len} → {new_len} caracteres")
-                    else:
-                        print(f"   Contenido sin cambios: {old_len} caracteres")
-
-                # Comparar y actualizar imagen
-                if news_data.get('image_url'):
-                    if news.image_url != news_data['image_url']:
-                        old_img = news.image_url or 'Sin imagen'
-                        news.image_url = news_data['image_url']
-                        updated = True
-                        updates.append(f"Imagen actualizada")
-                    else:
-                        print(f"   Imagen sin cambios")
-
-                if updated:
-                    news.save()
-                    print(f"✅ ACTUALIZADA - Cambios realizados:")
-                    for update in updates:
-                        print(f"   - {update}")
-                    return True
-                else:
-                    print(f"ℹ️  SIN CAMBIOS - Noticia ya está actualizada")
-                    return False
-
-            except News.DoesNotExist:
-                # No existe - crear nueva
-                news = News.objects.create(
-                    source=self.source,
-                    title=news_data.get('title', ''),
-                    url=news_data['url'],
-                    content=news_data.get('content', ''),
-                    excerpt=news_data.get('excerpt', ''),
-                    published_date=news_data.get('published_date'),
-                    image_url=news_data.get('image_url', ''),
-                    author=news_data.get('author', ''),
-                )
-                print(f"✅ NUEVA NOTICIA CREADA")
-                print(f"   ID: {news.id}")
-                print(f"   Guardada con {len(news.content)} caracteres de contenido")
-                return True
-
-        except Exception as e:
-            self.logger.error(f"❌ ERROR guardando/actualizando noticia:")
-            self.logger.error(f"   Error: {e}")
-            self.logger.error(f"   URL: {news_data.get('url', 'Sin URL')}")
-            import traceback
-            self.logger.error(traceback.format_exc())
-            return False
-        finally:
-            print("=" * 60)
-
-    def extract_news_list(self, html_content):
-        soup = BeautifulSoup(html_content, 'html.parser')
-        news_list = []
+    def iter_news_pages(self, html_content):
+        soup = self.parse_list(html_content)
+        total_noticias = 0
 
         try:
             if self.driver:
-                wait = WebDriverWait(self.driver, 30)
-
-                # Esperar que cargue la página
-                print("Esperando que carguen los resultados...")
-                time.sleep(5)
-
                 # Configuración de paginación
                 max_paginas = 50
                 pagina_actual = 1
@@ -135,9 +33,7 @@ class DiarioConcepcionScraper(BaseScraper):
                     print(f"Procesando página {pagina_actual}...")
 
                     # Esperar la lista principal
-                    try:
-                        wait.until(EC.presence_of_element_located((By.CLASS_NAME, "l-list")))
-                    except:
+                    if not self.wait_for_selector('.l-list'):
                         self.logger.warning("No se encontró la lista de noticias")
                         paginas_sin_resultados += 1
                         if paginas_sin_resultados >= 3:
@@ -151,7 +47,7 @@ class DiarioConcepcionScraper(BaseScraper):
 
                     # Obtener HTML actualizado
                     html_content = self.driver.page_source
-                    soup = BeautifulSoup(html_content, 'html.parser')
+                    soup = self.parse_list(html_content)
 
                     # Extraer noticias de la página actual
                     noticias_pagina = self.extraer_noticias_de_pagina(soup)
@@ -161,8 +57,9 @@ class DiarioConcepcionScraper(BaseScraper):
                         paginas_sin_resultados += 1
                     else:
                         print(f"Página {pagina_actual}: {len(noticias_pagina)} noticias encontradas")
-                        news_list.extend(noticias_pagina)
+                        total_noticias += len(noticias_pagina)
                         paginas_sin_resultados = 0  # Resetear contador si encontramos noticias
+                        yield noticias_pagina
 
                     # Intentar ir a la siguiente página
                     if not self.navegar_siguiente_pagina():
@@ -170,11 +67,8 @@ class DiarioConcepcionScraper(BaseScraper):
                         break
 
                     pagina_actual += 1
-                    time.sleep(3)
 
-                # Guardar en cache
-                self._news_list_cache = news_list
-                print(f"Total de noticias extraídas: {len(news_list)}")
+                print(f"Total de noticias extraídas: {total_noticias}")
                 print(f"Páginas procesadas: {pagina_actual}")
 
         except Exception as e:
@@ -182,8 +76,6 @@ class DiarioConcepcionScraper(BaseScraper):
             import traceback
             self.logger.error(traceback.format_exc())
 
-        return news_list
-
     def extraer_noticias_de_pagina(self, soup):
         """Extraer noticias de la página actual"""
         noticias = []
@@ -230,11 +122,11 @@ class DiarioConcepcionScraper(BaseScraper):
                     next_page = current_page + 1
                     next_url = re.sub(r'page=\d+', f'page={next_page}', current_url)
                     print(f"Navegando a página {next_page} mediante URL")
-                    self.driver.get(next_url)
-                    time.sleep(4)
+                    self.navigate(next_url)
+                    self.wait_for_selector()
 
                     # Verificar si hay resultados en la nueva página
-                    soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+                    soup = self.parse_list(self.driver.page_source)
                     if self.hay_resultados_en_pagina(soup):
                         return True
                     else:
@@ -245,11 +137,11 @@ class DiarioConcepcionScraper(BaseScraper):
                 separator = '&' if '?' in current_url else '?'
                 next_url = f"{current_url}{separator}page=2"
                 print("Agregando parámetro page=2 a la URL")
-                self.driver.get(next_url)
-                time.sleep(4)
+                self.navigate(next_url)
+                self.wait_for_selector()
 
                 # Verificar si hay resultados
-                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+                soup = self.parse_list(self.driver.page_source)
                 if self.hay_resultados_en_pagina(soup):
                     return True
 
@@ -276,9 +168,7 @@ class DiarioConcepcionScraper(BaseScraper):
                                 'page=' in href or any(x in texto for x in ['siguiente', 'next', '»', '→', 'sig'])):
                             if elem.is_displayed() and elem.is_enabled():
                                 print(f"Clic en enlace de paginación: {texto or href}")
-                                self.driver.execute_script("arguments[0].click();", elem)
-                                time.sleep(4)
-                                return True
+                                return self.click_and_wait(elem)
                 except Exception as e:
                     self.logger.debug(f"Error con selector {selector}: {str(e)}")
                     continue
@@ -296,9 +186,7 @@ class DiarioConcepcionScraper(BaseScraper):
                             page_num = int(page_text)
                             if page_num == current_page_num + 1:
                                 print(f"Navegando a página {page_num}")
-                                self.driver.execute_script("arguments[0].click();", elem)
-                                time.sleep(4)
-                                return True
+                                return self.click_and_wait(elem)
                     except:
                         continue
             except:
@@ -307,12 +195,7 @@ class DiarioConcepcionScraper(BaseScraper):
             # Método 4: Scroll infinito
             print("Intentando scroll infinito...")
             for i in range(3):  # Intentar scroll varias veces
-                old_height = self.driver.execute_script("return document.body.scrollHeight")
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(3)
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-
-                if new_height > old_height:
+                if self.scroll_and_wait():
                     print("Cargadas más noticias mediante scroll")
                     return True
 
@@ -377,7 +260,7 @@ class DiarioConcepcionScraper(BaseScraper):
             if fecha_elem:
                 fecha_texto = fecha_elem.get_text().strip()
                 print(f"Fecha encontrada: {fecha_texto}")
-                fecha_parseada = self.normalizar_fecha(fecha_texto)
+                fecha_parseada = self.parse_date(fecha_texto)
                 if fecha_parseada:
                     print(f"Fecha parseada: {fecha_parseada}")
 
@@ -436,32 +319,27 @@ class DiarioConcepcionScraper(BaseScraper):
             print(f"🔍 Extrayendo detalles de noticia:")
             print(f"   URL: {news_url}")
 
-            # Primero buscar si ya tenemos datos en el cache
+            # Primero usar los datos que ya trae el listado
             cached_data = False
-            for item in self._news_list_cache:
-                if item.get('url') == news_url:
-                    if item.get('published_date'):
-                        details['published_date'] = item['published_date']
-                        print(f"   📅 Fecha del cache: {details['published_date']}")
-                        cached_data = True
-                    if item.get('excerpt'):
-                        details['excerpt'] = item['excerpt']
-                        print(f"   📝 Excerpt del cache: {len(item['excerpt'])} caracteres")
-                        cached_data = True
-                    if item.get('image_url'):
-                        details['image_url'] = item['image_url']
-                        print(f"   🖼️  Imagen del cache: {item['image_url'][:50]}...")
-                        cached_data = True
-                    break
+            item = self.list_item_for(news_url)
+            if item.get('published_date'):
+                details['published_date'] = item['published_date']
+                print(f"   📅 Fecha del listado: {details['published_date']}")
+                cached_data = True
+            if item.get('excerpt'):
+                details['excerpt'] = item['excerpt']
+                print(f"   📝 Excerpt del listado: {len(item['excerpt'])} caracteres")
+                cached_data = True
+            if item.get('image_url'):
+                details['image_url'] = item['image_url']
+                print(f"   🖼️  Imagen del listado: {item['image_url'][:50]}...")
+                cached_data = True
 
             if not cached_data:
-                print("   ℹ️  No hay datos en cache para esta noticia")
+                print("   ℹ️  El listado no trae datos de esta noticia")
 
-            print(f"   🌐 Navegando a la página...")
-            self.driver.get(news_url)
-            time.sleep(3)
-
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            print(f"   🌐 Descargando la página...")
+            soup = self.parse_html(self.fetch_detail_html(news_url))
 
             # Buscar contenido principal - estructura específica de Diario Concepción
             contenido = ""
@@ -572,7 +450,7 @@ class DiarioConcepcionScraper(BaseScraper):
                 fecha_elem = soup.find('span', class_='the-single__date')
                 if fecha_elem:
                     fecha_texto = fecha_elem.get_text().strip()
-                    fecha_parseada = self.normalizar_fecha(fecha_texto)
+                    fecha_parseada = self.parse_date(fecha_texto)
                     if fecha_parseada:
                         details['published_date'] = fecha_parseada
                 else:
@@ -580,7 +458,7 @@ class DiarioConcepcionScraper(BaseScraper):
                     fecha_elem = soup.find('small', class_='main-headline__category')
                     if fecha_elem:
                         fecha_texto = fecha_elem.get_text().strip()
-                        fecha_parseada = self.normalizar_fecha(fecha_texto)
+                        fecha_parseada = self.parse_date(fecha_texto)
                         if fecha_parseada:
                             details['published_date'] = fecha_parseada
 
@@ -648,33 +526,6 @@ class DiarioConcepcionScraper(BaseScraper):
 
         return details
 
-    def normalizar_fecha(self, fecha_texto):
-        """Normalizar formato de fecha de Diario Concepción"""
-        # Formato: "23 de marzo 2025"
-        meses = {
-            'enero': 1, 'febrero': 2, 'marzo': 3, 'abril': 4,
-            'mayo': 5, 'junio': 6, 'julio': 7, 'agosto': 8,
-            'septiembre': 9, 'octubre': 10, 'noviembre': 11, 'diciembre': 12
-        }
-
-        try:
-            # Limpiar y dividir
-            fecha_limpia = fecha_texto.lower().replace(' de ', ' ')
-            partes = fecha_limpia.split()
-
-            if len(partes) >= 3:
-                dia = int(partes[0])
-                mes_nombre = partes[1]
-                año = int(partes[2])
-
-                if mes_nombre in meses:
-                    mes = meses[mes_nombre]
-                    return datetime(año, mes, dia)
-        except Exception as e:
-            self.logger.error(f"Error normalizando fecha '{fecha_texto}': {e}")
-
-        return None
-
     def scrape(self):
         """Override del método scrape para agregar logging detallado"""
         print("🚀 INICIANDO SCRAPING DIARIO CONCEPCIÓN - PYMEMAD")
@@ -1,37 +1,26 @@
 from apps.scrapers.base import BaseScraper
-from bs4 import BeautifulSoup
-from datetime import datetime
 import re
-import time
 from urllib.parse import urljoin
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
 
 class EmolScraper(BaseScraper):
-    def __init__(self):
-        super().__init__('Emol')
+    source_name = 'Emol'
         
     def get_source_config(self):
         return {
             'base_url': 'https://www.emol.com',
             'search_url': 'https://www.emol.com/buscador/?query=pymemad',
-            'requires_selenium': True
+            'requires_selenium': True,
+            'detail_selectors': ['#contenidos', '.EmolText', 'div[itemprop="articleBody"]'],
+            'list_selector': '#listNews li',
         }
     
-    def extract_news_list(self, html_content):
-        soup = BeautifulSoup(html_content, 'html.parser')
-        news_list = []
+    def iter_news_pages(self, html_content):
+        soup = self.parse_list(html_content)
         
         try:
             if self.driver:
-                wait = WebDriverWait(self.driver, 30)
-                
-                # Esperar que cargue la página
-                self.logger.info("Esperando que carguen los resultados...")
-                time.sleep(5)
-                
                 # Procesar múltiples páginas
                 max_paginas = 3
                 pagina_actual = 1
@@ -40,15 +29,13 @@ class EmolScraper(BaseScraper):
                     self.logger.info(f"Procesando página {pagina_actual}...")
                     
                     # Esperar que cargue la lista de noticias
-                    try:
-                        wait.until(EC.presence_of_element_located((By.ID, "listNews")))
-                    except:
+                    if not self.wait_for_selector('#listNews'):
                         self.logger.warning("No se encontró la lista de noticias")
                         break
                     
                     # Obtener HTML actualizado
                     html_content = self.driver.page_source
-                    soup = BeautifulSoup(html_content, 'html.parser')
+                    soup = self.parse_list(html_content)
                     
                     # Buscar la lista de noticias
                     list_news = soup.find('ul', id='listNews')
@@ -67,11 +54,13 @@ class EmolScraper(BaseScraper):
                     items = list_news.find_all('li', id='ContenedorLinkNoticia')
                     self.logger.info(f"Encontrados {len(items)} items de noticias")
                     
+                    news_list = []
                     for item in items:
                         noticia = self.extraer_datos_noticia(item)
                         if noticia:
                             news_list.append(noticia)
                             self.logger.info(f"Noticia encontrada: {noticia['title'][:60]}...")
+                    yield news_list
                     
                     # Intentar ir a la siguiente página
                     if pagina_actual < max_paginas:
@@ -80,14 +69,11 @@ class EmolScraper(BaseScraper):
                             break
                         
                         pagina_actual += 1
-                        time.sleep(3)
                     else:
                         break
                         
         except Exception as e:
             self.logger.error(f"Error extrayendo lista de noticias: {e}")
-            
-        return news_list
     
     def extraer_datos_noticia(self, item):
         """Extraer datos de una noticia específica de Emol"""
@@ -129,9 +115,7 @@ class EmolScraper(BaseScraper):
                 link = next_link.find_element(By.TAG_NAME, "a")
                 if link:
                     self.logger.info("Navegando a siguiente página")
-                    self.driver.execute_script("arguments[0].click();", link)
-                    time.sleep(3)
-                    return True
+                    return self.click_and_wait(link)
             
             # Alternativa: buscar por número de página
             try:
@@ -139,9 +123,7 @@ class EmolScraper(BaseScraper):
                 for link in page_links:
                     if link.get_text().strip() == str(pagina_actual + 1):
                         self.logger.info(f"Navegando a página {pagina_actual + 1}")
-                        self.driver.execute_script("arguments[0].click();", link)
-                        time.sleep(3)
-                        return True
+                        return self.click_and_wait(link)
             except:
                 pass
             
@@ -168,16 +150,9 @@ class EmolScraper(BaseScraper):
                 details['excerpt'] = "Contenido de El Mercurio Digital"
                 return details
             
-            if self.driver:
-                self.driver.get(news_url)
-                time.sleep(4)
-                html = self.driver.page_source
-            else:
-                import requests
-                response = requests.get(news_url)
-                html = response.text
+            html = self.fetch_detail_html(news_url)
             
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.parse_html(html)
             
             # Buscar contenido principal
             contenido = ""
@@ -245,7 +220,7 @@ class EmolScraper(BaseScraper):
                         fecha_texto = fecha_elem.get_text().strip()
                     
                     if fecha_texto:
-                        fecha_normalizada = self.normalizar_fecha_emol(fecha_texto)
+                        fecha_normalizada = self.parse_date(fecha_texto)
                         if fecha_normalizada:
                             details['published_date'] = fecha_normalizada
                             break
@@ -292,27 +267,3 @@ class EmolScraper(BaseScraper):
             self.logger.error(f"Error extrayendo detalles de {news_url}: {e}")
         
         return details
-    
-    def normalizar_fecha_emol(self, fecha_texto):
-        """Normalizar formato de fecha de Emol"""
-        try:
-            # Emol usa formato: "DD/MM/YYYY"
-            if '/' in fecha_texto:
-                partes = fecha_texto.split('/')
-                if len(partes) == 3:
-                    dia = int(partes[0])
-                    mes = int(partes[1])
-                    año = int(partes[2])
-                    return datetime(año, mes, dia)
-            
-            # Si es formato ISO datetime
-            if 'T' in fecha_texto or '-' in fecha_texto:
-                try:
-                    return datetime.fromisoformat(fecha_texto.replace('Z', '+00:00'))
-                except:
-                    pass
-                    
-        except Exception as e:
-            self.logger.error(f"Error normalizando fecha '{fecha_texto}': {e}")
-        
-        return None
\ No newline at end of file
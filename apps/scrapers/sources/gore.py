@@ -1,107 +1,28 @@
 from apps.scrapers.base import BaseScraper
-from bs4 import BeautifulSoup
-from datetime import datetime
+from apps.scrapers.parsing import class_strainer
 import re
-import time
 from urllib.parse import urljoin
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
 
 class GoreScraper(BaseScraper):
-    def __init__(self):
-        super().__init__('GORE Biobío')
-
-    def save_news(self, news_data):
-        """Override para actualizar noticias existentes"""
-        try:
-            from apps.news.models import News
-
-            # Verificar qué datos estamos intentando guardar
-            print(f"Procesando: {news_data.get('title', 'Sin título')[:50]}...")
-
-            # Buscar si ya existe
-            try:
-                news = News.objects.get(url=news_data['url'])
-                # Ya existe - actualizar
-                updated = False
-
-                # Actualizar fecha si tenemos una nueva y es diferente
-                if news_data.get('published_date') and news.published_date != news_data['published_date']:
-                    news.published_date = news_data['published_date']
-                    updated = True
-                    print(f"Fecha actualizada: {news_data['published_date']}")
-
-                # Actualizar contenido si es más largo o si no teníamos
-                if news_data.get('content'):
-                    if not news.content or len(news_data['content']) > len(news.content):
-                        news.content = news_data['content']
-                        news.excerpt = news_data.get('excerpt', '')
-                        updated = True
-                        print(f"Contenido actualizado: {len(news_data['content'])} caracteres")
-
-                # Actualizar imagen si es diferente o no teníamos
-                if news_data.get('image_url') and news.image_url != news_data['image_url']:
-                    news.image_url = news_data['image_url']
-                    updated = True
-                    print(f"Imagen actualizada: {news_data['image_url']}")
-
-                # Actualizar autor si no teníamos
-                if news_data.get('author') and not news.author:
-                    news.author = news_data['author']
-                    updated = True
-                    print(f"Autor actualizado: {news_data['author']}")
-
-                if updated:
-                    news.save()
-                    print(f"✅ Actualizada: {news_data['title'][:50]}...")
-                    return True
-                else:
-                    print(f"Sin cambios: {news_data['title'][:50]}...")
-                    return False
-
-            except News.DoesNotExist:
-                # No existe - crear nueva
-                news = News.objects.create(
-                    source=self.source,
-                    title=news_data.get('title', ''),
-                    url=news_data['url'],
-                    content=news_data.get('content', ''),
-                    excerpt=news_data.get('excerpt', ''),
-                    published_date=news_data.get('published_date'),
-                    image_url=news_data.get('image_url', ''),
-                    author=news_data.get('author', ''),
-                )
-                print(f"✅ Nueva noticia guardada: {news_data['title'][:50]}...")
-                return True
-
-        except Exception as e:
-            print(f"Error guardando/actualizando noticia: {e}")
-            print(f"Datos problemáticos: {news_data}")
-            import traceback
-            print(traceback.format_exc())
-            return False
+    source_name = 'GORE Biobío'
 
     def get_source_config(self):
         return {
             'base_url': 'https://gorebiobio.cl',
             'search_url': 'https://gorebiobio.cl/?s=pymemad',
-            'requires_selenium': True
+            'requires_selenium': True,
+            'detail_selectors': ['div.post_content'],
+            'list_selector': 'article.w-grid-item',
+            'list_strainer': class_strainer('article', 'w-grid-item'),
         }
 
-    def extract_news_list(self, html_content):
-        soup = BeautifulSoup(html_content, 'html.parser')
-        news_list = []
+    def iter_news_pages(self, html_content):
+        soup = self.parse_list(html_content)
 
         try:
             if self.driver:
-                wait = WebDriverWait(self.driver, 30)
-
-                # Esperar que cargue la página
-                self.logger.info("Esperando que carguen los resultados...")
-                time.sleep(5)
-
                 # Procesar múltiples páginas
                 max_paginas = 3
                 pagina_actual = 1
@@ -110,20 +31,16 @@ class GoreScraper(BaseScraper):
                     self.logger.info(f"Procesando página {pagina_actual}...")
 
                     # Esperar que cargue el grid de noticias
-                    try:
-                        wait.until(EC.presence_of_element_located((By.CLASS_NAME, "w-grid-list")))
-                    except:
+                    if not self.wait_for_selector('.w-grid-list'):
                         self.logger.warning("No se encontró el grid de noticias")
                         # Intentar con selector alternativo
-                        try:
-                            wait.until(EC.presence_of_element_located((By.CLASS_NAME, "w-grid-item")))
-                        except:
+                        if not self.wait_for_selector('.w-grid-item'):
                             self.logger.warning("No se encontraron resultados")
                             break
 
                     # Obtener HTML actualizado
                     html_content = self.driver.page_source
-                    soup = BeautifulSoup(html_content, 'html.parser')
+                    soup = self.parse_list(html_content)
 
                     # Buscar el contenedor principal del grid
                     grid_list = soup.find('div', class_='w-grid-list')
@@ -137,11 +54,13 @@ class GoreScraper(BaseScraper):
 
                     self.logger.info(f"Encontrados {len(articulos)} artículos")
 
+                    news_list = []
                     for articulo in articulos:
                         noticia = self.extraer_datos_articulo(articulo)
                         if noticia:
                             news_list.append(noticia)
                             self.logger.info(f"Noticia encontrada: {noticia['title'][:60]}...")
+                    yield news_list
 
                     # Intentar ir a la siguiente página
                     if pagina_actual < max_paginas:
@@ -150,15 +69,12 @@ class GoreScraper(BaseScraper):
                             break
 
                         pagina_actual += 1
-                        time.sleep(3)
                     else:
                         break
 
         except Exception as e:
             print(f"Error extrayendo lista de noticias: {e}")
 
-        return news_list
-
     def extraer_datos_articulo(self, articulo):
         """Extraer datos de un artículo específico de GORE"""
         try:
@@ -207,8 +123,7 @@ class GoreScraper(BaseScraper):
             for button in next_buttons:
                 if button.is_displayed() and button.is_enabled():
                     self.logger.info("Navegando a siguiente página")
-                    self.driver.execute_script("arguments[0].click();", button)
-                    return True
+                    return self.click_and_wait(button)
 
             # Opción 2: Números de página
             pagination = self.driver.find_elements(By.CSS_SELECTOR,
@@ -230,19 +145,13 @@ class GoreScraper(BaseScraper):
                         page_num = int(elem.get_text().strip())
                         if page_num == current_page + 1:
                             self.logger.info(f"Navegando a página {page_num}")
-                            self.driver.execute_script("arguments[0].click();", elem)
-                            return True
+                            return self.click_and_wait(elem)
                     except:
                         pass
 
             # Opción 3: Scroll infinito
             # GORE podría usar carga dinámica
-            old_height = self.driver.execute_script("return document.body.scrollHeight")
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(3)
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-
-            if new_height > old_height:
+            if self.scroll_and_wait():
                 self.logger.info("Cargadas más noticias mediante scroll")
                 return True
 
@@ -262,16 +171,9 @@ class GoreScraper(BaseScraper):
         }
 
         try:
-            if self.driver:
-                self.driver.get(news_url)
-                time.sleep(3)
-                html = self.driver.page_source
-            else:
-                import requests
-                response = requests.get(news_url)
-                html = response.text
+            html = self.fetch_detail_html(news_url)
 
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.parse_html(html)
 
             # EXTRAER CONTENIDO - Basado en la estructura real de GORE
             contenido = ""
@@ -319,14 +221,14 @@ class GoreScraper(BaseScraper):
                 # Obtener del atributo datetime
                 fecha_iso = fecha_elem.get('datetime')
                 if fecha_iso:
-                    fecha = self.parse_datetime_iso(fecha_iso)
+                    fecha = self.parse_date(fecha_iso)
                     if fecha:
                         details['published_date'] = fecha
                         print(f"Fecha extraída: {fecha_iso} -> {fecha}")
                 else:
                     # Intentar del texto (formato: 12/09/2022)
                     fecha_texto = fecha_elem.get_text().strip()
-                    fecha = self.normalizar_fecha_gore(fecha_texto)
+                    fecha = self.parse_date(fecha_texto)
                     if fecha:
                         details['published_date'] = fecha
 
@@ -371,33 +273,3 @@ class GoreScraper(BaseScraper):
             print(f"Error extrayendo detalles de {news_url}: {e}")
 
         return details
-
-    def parse_datetime_iso(self, datetime_str):
-        """Parsear fecha en formato ISO con timezone"""
-        try:
-            # Formato ejemplo: "2022-09-12T17:55:46-03:00"
-            # Remover timezone para simplificar
-            if 'T' in datetime_str:
-                fecha_parte = datetime_str.split('T')[0]
-                año, mes, dia = fecha_parte.split('-')
-                return datetime(int(año), int(mes), int(dia))
-        except Exception as e:
-            print(f"Error parseando datetime ISO '{datetime_str}': {e}")
-        return None
-
-    def normalizar_fecha_gore(self, fecha_texto):
-        """Normalizar formato de fecha de GORE"""
-        try:
-            # Formato: DD/MM/YYYY (12/09/2022)
-            if '/' in fecha_texto:
-                partes = fecha_texto.split('/')
-                if len(partes) == 3:
-                    dia = int(partes[0])
-                    mes = int(partes[1])
-                    año = int(partes[2])
-                    return datetime(año, mes, dia)
-
-        except Exception as e:
-            print(f"Error normalizando fecha '{fecha_texto}': {e}")
-
-        return None
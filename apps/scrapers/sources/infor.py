@@ -1,37 +1,28 @@
 from apps.scrapers.base import BaseScraper
-from bs4 import BeautifulSoup
-from datetime import datetime
+from apps.scrapers.parsing import class_strainer
 import re
-import time
 from urllib.parse import urljoin
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
 
 class InforScraper(BaseScraper):
-    def __init__(self):
-        super().__init__('INFOR')
+    source_name = 'INFOR'
         
     def get_source_config(self):
         return {
             'base_url': 'https://lme.infor.cl',
             'search_url': 'https://lme.infor.cl/index.php/component/search/?searchword=pymemad&ordering=newest&searchphrase=all&limit=20',
-            'requires_selenium': True
+            'requires_selenium': True,
+            'detail_selectors': ['.item-page', '.article-content'],
+            'list_selector': 'div.pagelistcont',
+            'list_strainer': class_strainer('div', 'pagelistcont'),
         }
     
-    def extract_news_list(self, html_content):
-        soup = BeautifulSoup(html_content, 'html.parser')
-        news_list = []
+    def iter_news_pages(self, html_content):
+        soup = self.parse_list(html_content)
         
         try:
             if self.driver:
-                wait = WebDriverWait(self.driver, 30)
-                
-                # Esperar que cargue la página
-                self.logger.info("Esperando que carguen los resultados...")
-                time.sleep(5)
-                
                 # Procesar múltiples páginas
                 max_paginas = 3
                 pagina_actual = 1
@@ -40,25 +31,25 @@ class InforScraper(BaseScraper):
                     self.logger.info(f"Procesando página {pagina_actual}...")
                     
                     # Esperar que carguen los resultados
-                    try:
-                        wait.until(EC.presence_of_element_located((By.CLASS_NAME, "pagelistcont")))
-                    except:
+                    if not self.wait_for_selector('.pagelistcont'):
                         self.logger.warning("No se encontraron resultados en esta página")
                         break
                     
                     # Obtener HTML actualizado
                     html_content = self.driver.page_source
-                    soup = BeautifulSoup(html_content, 'html.parser')
+                    soup = self.parse_list(html_content)
                     
                     # Buscar todos los contenedores de noticias
                     contenedores = soup.find_all('div', class_='pagelistcont')
                     self.logger.info(f"Encontrados {len(contenedores)} contenedores de noticias")
                     
+                    news_list = []
                     for contenedor in contenedores:
                         noticia = self.extraer_datos_noticia(contenedor)
                         if noticia:
                             news_list.append(noticia)
                             self.logger.info(f"Noticia encontrada: {noticia['title'][:60]}...")
+                    yield news_list
                     
                     # Intentar ir a la siguiente página
                     if pagina_actual < max_paginas:
@@ -67,14 +58,11 @@ class InforScraper(BaseScraper):
                             break
                         
                         pagina_actual += 1
-                        time.sleep(3)
                     else:
                         break
                         
         except Exception as e:
             self.logger.error(f"Error extrayendo lista de noticias: {e}")
-            
-        return news_list
     
     def extraer_datos_noticia(self, contenedor):
         """Extraer datos de una noticia específica de INFOR"""
@@ -128,8 +116,7 @@ class InforScraper(BaseScraper):
                     # Verificar si no está deshabilitado
                     if 'disabled' not in link.get_attribute('class'):
                         self.logger.info(f"Navegando a: {texto}")
-                        self.driver.execute_script("arguments[0].click();", link)
-                        return True
+                        return self.click_and_wait(link)
             
             return False
             
@@ -147,16 +134,9 @@ class InforScraper(BaseScraper):
         }
         
         try:
-            if self.driver:
-                self.driver.get(news_url)
-                time.sleep(3)
-                html = self.driver.page_source
-            else:
-                import requests
-                response = requests.get(news_url)
-                html = response.text
+            html = self.fetch_detail_html(news_url)
             
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.parse_html(html)
             
             # Buscar contenido principal
             contenido = ""
@@ -217,7 +197,7 @@ class InforScraper(BaseScraper):
                 match = re.search(patron, html)
                 if match:
                     fecha_texto = match.group(1)
-                    fecha_normalizada = self.normalizar_fecha_infor(fecha_texto)
+                    fecha_normalizada = self.parse_date(fecha_texto)
                     if fecha_normalizada:
                         details['published_date'] = fecha_normalizada
                         break
@@ -250,29 +230,3 @@ class InforScraper(BaseScraper):
             self.logger.error(f"Error extrayendo detalles de {news_url}: {e}")
         
         return details
-    
-    def normalizar_fecha_infor(self, fecha_texto):
-        """Normalizar formato de fecha de INFOR"""
-        # INFOR usa formato: "19 Diciembre 2022"
-        meses = {
-            'enero': 1, 'febrero': 2, 'marzo': 3, 'abril': 4,
-            'mayo': 5, 'junio': 6, 'julio': 7, 'agosto': 8,
-            'septiembre': 9, 'octubre': 10, 'noviembre': 11, 'diciembre': 12
-        }
-        
-        try:
-            # Dividir la fecha
-            partes = fecha_texto.strip().split()
-            if len(partes) >= 3:
-                dia = int(partes[0])
-                mes_nombre = partes[1].lower()
-                año = int(partes[2])
-                
-                if mes_nombre in meses:
-                    mes = meses[mes_nombre]
-                    return datetime(año, mes, dia)
-                    
-        except Exception as e:
-            self.logger.error(f"Error normalizando fecha '{fecha_texto}': {e}")
-        
-        return None
\ No newline at end of file
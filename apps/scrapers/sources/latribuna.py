@@ -1,109 +1,34 @@
 from apps.scrapers.base import BaseScraper
-from bs4 import BeautifulSoup
-from datetime import datetime
+from bs4 import SoupStrainer
 import re
-import time
 from urllib.parse import urljoin
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
 
 class LatribunaScraper(BaseScraper):
-    def __init__(self):
-        super().__init__('La Tribuna')
-
-    def save_news(self, news_data):
-        """Override para actualizar noticias existentes"""
-        try:
-            from apps.news.models import News
-
-            # Verificar qué datos estamos intentando guardar
-            print(f"Procesando: {news_data.get('title', 'Sin título')[:50]}...")
-
-            # Buscar si ya existe
-            try:
-                news = News.objects.get(url=news_data['url'])
-                # Ya existe - actualizar
-                updated = False
-
-                # Actualizar fecha si tenemos una nueva y es diferente
-                if news_data.get('published_date') and news.published_date != news_data['published_date']:
-                    news.published_date = news_data['published_date']
-                    updated = True
-                    print(f"Fecha actualizada: {news_data['published_date']}")
-
-                # Actualizar contenido si es más largo o si no teníamos
-                if news_data.get('content'):
-                    if not news.content or len(news_data['content']) > len(news.content):
-                        news.content = news_data['content']
-                        news.excerpt = news_data.get('excerpt', '')
-                        updated = True
-                        print(f"Contenido actualizado: {len(news_data['content'])} caracteres")
-
-                # Actualizar imagen si es diferente o no teníamos
-                if news_data.get('image_url') and news.image_url != news_data['image_url']:
-                    news.image_url = news_data['image_url']
-                    updated = True
-                    print(f"Imagen actualizada: {news_data['image_url']}")
-
-                # Actualizar autor si no teníamos
-                if news_data.get('author') and not news.author:
-                    news.author = news_data['author']
-                    updated = True
-                    print(f"Autor actualizado: {news_data['author']}")
-
-                if updated:
-                    news.save()
-                    print(f"✅ Actualizada: {news_data['title'][:50]}...")
-                    return True
-                else:
-                    print(f"Sin cambios: {news_data['title'][:50]}...")
-                    return False
-
-            except News.DoesNotExist:
-                # No existe - crear nueva
-                news = News.objects.create(
-                    source=self.source,
-                    title=news_data.get('title', ''),
-                    url=news_data['url'],
-                    content=news_data.get('content', ''),
-                    excerpt=news_data.get('excerpt', ''),
-                    published_date=news_data.get('published_date'),
-                    image_url=news_data.get('image_url', ''),
-                    author=news_data.get('author', ''),
-                )
-                print(f"✅ Nueva noticia guardada: {news_data['title'][:50]}...")
-                return True
-
-        except Exception as e:
-            print(f"Error guardando/actualizando noticia: {e}")
-            print(f"Datos problemáticos: {news_data}")
-            import traceback
-            print(traceback.format_exc())
-            return False
+    source_name = 'La Tribuna'
 
     def get_source_config(self):
         return {
             'base_url': 'https://www.latribuna.cl',
             'search_url': 'https://www.latribuna.cl/buscador/?search=Pymemad',
-            'requires_selenium': True
+            'requires_selenium': True,
+            'detail_selectors': ['div.post-main'],
+            'list_selector': '#Result article.post-main__post',
+            'list_strainer': SoupStrainer(id='Result'),
+            # La búsqueda tarda en responder
+            'wait_timeout': 20,
         }
 
-    def extract_news_list(self, html_content):
-        soup = BeautifulSoup(html_content, 'html.parser')
-        news_list = []
+    def iter_news_pages(self, html_content):
+        soup = self.parse_list(html_content)
 
         try:
             if self.driver:
-                wait = WebDriverWait(self.driver, 30)
-
-                # Esperar más tiempo inicial para que carguen los resultados
-                print("Esperando que carguen los resultados iniciales...")
-                time.sleep(15)
-
                 # Esperar a que aparezca el contenedor de resultados
-                wait.until(EC.presence_of_element_located((By.ID, "Result")))
+                if not self.wait_for_selector('#Result'):
+                    self.logger.warning("No se encontró el contenedor de resultados")
+                    return
                 print("Contenedor de resultados cargado")
 
                 urls_procesadas = set()  # Para evitar duplicados
@@ -114,12 +39,9 @@ class LatribunaScraper(BaseScraper):
                 while carga_actual <= max_cargas and cargas_sin_nuevas_noticias < 3:
                     print(f"Procesando carga {carga_actual}...")
 
-                    # Esperar un poco antes de procesar
-                    time.sleep(3)
-
                     # Obtener HTML actualizado
                     html_content = self.driver.page_source
-                    soup = BeautifulSoup(html_content, 'html.parser')
+                    soup = self.parse_list(html_content)
 
                     # Buscar el contenedor de resultados
                     result_container = soup.select_one('#Result')
@@ -134,6 +56,7 @@ class LatribunaScraper(BaseScraper):
 
                     # Contar noticias nuevas en esta carga
                     noticias_nuevas_carga = 0
+                    news_list = []
                     for articulo in articulos:
                         noticia = self.extraer_datos_articulo(articulo)
                         if noticia and noticia['url'] not in urls_procesadas:
@@ -141,6 +64,7 @@ class LatribunaScraper(BaseScraper):
                             news_list.append(noticia)
                             noticias_nuevas_carga += 1
                             print(f"Noticia encontrada: {noticia['title'][:60]}...")
+                    yield news_list
 
                     print(f"Carga {carga_actual}: {noticias_nuevas_carga} noticias nuevas de {len(articulos)} totales")
 
@@ -157,19 +81,13 @@ class LatribunaScraper(BaseScraper):
                             print("No hay más resultados para cargar")
                             break
 
-                        # Esperar más tiempo después de hacer clic
-                        print("Esperando que carguen nuevos resultados...")
-                        time.sleep(8)
-
                     carga_actual += 1
 
-                print(f"Total artículos únicos encontrados: {len(news_list)}")
+                print(f"Total artículos únicos encontrados: {len(urls_procesadas)}")
 
         except Exception as e:
             self.logger.error(f"Error extrayendo lista de noticias: {e}")
 
-        return news_list
-
     def extraer_datos_articulo(self, articulo):
         """Extraer datos de un artículo específico de La Tribuna"""
         try:
@@ -227,23 +145,9 @@ class LatribunaScraper(BaseScraper):
 
                     if boton_cargar.is_displayed() and boton_cargar.is_enabled():
                         print(f"Haciendo clic en CARGAR MÁS (selector: {selector})...")
-                        self.driver.execute_script("arguments[0].click();", boton_cargar)
-
-                        # Esperar a que aparezca el spinner de carga
-                        time.sleep(3)
-
-                        # Verificar si hay spinner de carga y esperarlo
-                        try:
-                            spinner = self.driver.find_element(By.ID, "cargando")
-                            if spinner.is_displayed():
-                                print("Esperando que termine de cargar...")
-                                wait = WebDriverWait(self.driver, 20)
-                                wait.until_not(EC.visibility_of_element_located((By.ID, "cargando")))
-                        except:
-                            # Si no hay spinner, continuar
-                            pass
 
-                        return True
+                        # Esperar a que se agreguen artículos al listado
+                        return self.click_and_wait(boton_cargar)
 
                 except Exception:
                     continue
@@ -265,16 +169,9 @@ class LatribunaScraper(BaseScraper):
         }
 
         try:
-            if self.driver:
-                self.driver.get(news_url)
-                time.sleep(3)
-                html = self.driver.page_source
-            else:
-                import requests
-                response = requests.get(news_url)
-                html = response.text
+            html = self.fetch_detail_html(news_url)
 
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.parse_html(html)
 
             # Extraer contenido principal
             contenido = ""
@@ -328,7 +225,7 @@ class LatribunaScraper(BaseScraper):
                 fecha_texto = re.sub(r'^\s*', '', fecha_texto).strip()
 
                 # La fecha está en formato "08 Febrero 2025"
-                fecha_normalizada = self.normalizar_fecha_latribuna(fecha_texto)
+                fecha_normalizada = self.parse_date(fecha_texto)
                 if fecha_normalizada:
                     details['published_date'] = fecha_normalizada
                     print(f"Fecha extraída: {fecha_texto} -> {fecha_normalizada}")
@@ -364,66 +261,3 @@ class LatribunaScraper(BaseScraper):
             self.logger.error(f"Error extrayendo detalles de {news_url}: {e}")
 
         return details
-
-    def normalizar_fecha_latribuna(self, fecha_texto):
-        """Normalizar formato de fecha de La Tribuna"""
-        meses = {
-            'enero': 1, 'febrero': 2, 'marzo': 3, 'abril': 4,
-            'mayo': 5, 'junio': 6, 'julio': 7, 'agosto': 8,
-            'septiembre': 9, 'octubre': 10, 'noviembre': 11, 'diciembre': 12,
-            'ene': 1, 'feb': 2, 'mar': 3, 'abr': 4,
-            'may': 5, 'jun': 6, 'jul': 7, 'ago': 8,
-            'sep': 9, 'oct': 10, 'nov': 11, 'dic': 12
-        }
-
-        try:
-            # Limpiar el texto de fecha
-            fecha_limpia = fecha_texto.strip()
-
-            # Si es formato ISO datetime
-            if 'T' in fecha_limpia or (fecha_limpia.count('-') == 2 and len(fecha_limpia) >= 10):
-                try:
-                    return datetime.fromisoformat(fecha_limpia.replace('Z', '+00:00'))
-                except:
-                    pass
-
-            # Formato típico de La Tribuna: "08 Febrero 2025"
-            # Puede venir con o sin "de"
-            fecha_limpia = fecha_limpia.lower()
-            fecha_limpia = fecha_limpia.replace(' de ', ' ').replace(',', '').strip()
-
-            # Dividir en partes
-            partes = fecha_limpia.split()
-
-            if len(partes) >= 3:
-                try:
-                    # Intentar extraer día, mes y año
-                    dia = int(partes[0])
-                    mes_nombre = partes[1].lower()
-                    año = int(partes[2])
-
-                    # Buscar el mes en el diccionario
-                    mes_num = None
-                    for mes_key, mes_valor in meses.items():
-                        if mes_key == mes_nombre or mes_nombre.startswith(mes_key):
-                            mes_num = mes_valor
-                            break
-
-                    if mes_num:
-                        fecha_resultado = datetime(año, mes_num, dia)
-                        print(f"Fecha parseada correctamente: {fecha_texto} -> {fecha_resultado}")
-                        return fecha_resultado
-                    else:
-                        print(f"No se pudo encontrar el mes '{mes_nombre}' en el diccionario")
-
-                except ValueError as ve:
-                    print(f"Error parseando partes de la fecha: {ve}")
-                    pass
-
-            # Si llegamos aquí, intentar otros formatos
-            print(f"No se pudo parsear la fecha: '{fecha_texto}'")
-
-        except Exception as e:
-            self.logger.error(f"Error normalizando fecha '{fecha_texto}': {e}")
-
-        return None
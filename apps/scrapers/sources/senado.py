@@ -1,112 +1,32 @@
 from apps.scrapers.base import BaseScraper
-from bs4 import BeautifulSoup
-from datetime import datetime
+from apps.scrapers.parsing import class_strainer
 import re
-import time
 from urllib.parse import urljoin
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
 
 class SenadoScraper(BaseScraper):
-    def __init__(self):
-        super().__init__('Senado Chile')
-
-    def save_news(self, news_data):
-        """Override para actualizar noticias existentes"""
-        try:
-            from apps.news.models import News
-
-            # Verificar qué datos estamos intentando guardar
-            print(f"Procesando: {news_data.get('title', 'Sin título')[:50]}...")
-
-            # Buscar si ya existe
-            try:
-                news = News.objects.get(url=news_data['url'])
-                # Ya existe - actualizar
-                updated = False
-
-                # Actualizar fecha si tenemos una nueva y es diferente
-                if news_data.get('published_date') and news.published_date != news_data['published_date']:
-                    news.published_date = news_data['published_date']
-                    updated = True
-                    print(f"Fecha actualizada: {news_data['published_date']}")
-
-                # Actualizar contenido si es más largo o si no teníamos
-                if news_data.get('content'):
-                    if not news.content or len(news_data['content']) > len(news.content):
-                        news.content = news_data['content']
-                        news.excerpt = news_data.get('excerpt', '')
-                        updated = True
-                        print(f"Contenido actualizado: {len(news_data['content'])} caracteres")
-
-                # Actualizar imagen si es diferente o no teníamos
-                if news_data.get('image_url') and news.image_url != news_data['image_url']:
-                    news.image_url = news_data['image_url']
-                    updated = True
-                    print(f"Imagen actualizada: {news_data['image_url']}")
-
-                # Actualizar autor si no teníamos
-                if news_data.get('author') and not news.author:
-                    news.author = news_data['author']
-                    updated = True
-                    print(f"Autor actualizado: {news_data['author']}")
-
-                if updated:
-                    news.save()
-                    print(f"✅ Actualizada: {news_data['title'][:50]}...")
-                    return True
-                else:
-                    print(f"Sin cambios: {news_data['title'][:50]}...")
-                    return False
-
-            except News.DoesNotExist:
-                # No existe - crear nueva
-                news = News.objects.create(
-                    source=self.source,
-                    title=news_data.get('title', ''),
-                    url=news_data['url'],
-                    content=news_data.get('content', ''),
-                    excerpt=news_data.get('excerpt', ''),
-                    published_date=news_data.get('published_date'),
-                    image_url=news_data.get('image_url', ''),
-                    author=news_data.get('author', ''),
-                )
-                print(f"✅ Nueva noticia guardada: {news_data['title'][:50]}...")
-                return True
-
-        except Exception as e:
-            print(f"Error guardando/actualizando noticia: {e}")
-            print(f"Datos problemáticos: {news_data}")
-            import traceback
-            print(traceback.format_exc())
-            return False
+    source_name = 'Senado Chile'
 
     def get_source_config(self):
         return {
             'base_url': 'https://www.senado.cl',
             'search_url': 'https://www.senado.cl/search?search=pymemad',
-            'requires_selenium': True
+            'requires_selenium': True,
+            'detail_selectors': ['main div.dynamic-content', 'article div.dynamic-content'],
+            'list_selector': 'a.card',
+            'list_strainer': class_strainer('a', 'card'),
         }
 
     def extract_news_list(self, html_content):
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = self.parse_list(html_content)
         news_list = []
 
         try:
             if self.driver:
-                wait = WebDriverWait(self.driver, 30)
-
-                # Esperar que cargue la página
-                self.logger.info("Esperando que carguen los resultados...")
-                time.sleep(5)
-
                 # Esperar que aparezcan las tarjetas de noticias
-                try:
-                    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "a.card")))
+                if self.wait_for_selector('a.card'):
                     print("Resultados de búsqueda cargados")
-                except:
+                else:
                     self.logger.warning("No se encontraron resultados")
                     return news_list
 
@@ -118,7 +38,7 @@ class SenadoScraper(BaseScraper):
                 while scroll_actual < max_scrolls:
                     # Obtener HTML actualizado
                     html_content = self.driver.page_source
-                    soup = BeautifulSoup(html_content, 'html.parser')
+                    soup = self.parse_list(html_content)
 
                     # Buscar todas las tarjetas de noticias
                     # Estructura: <a class="card color-blue-100 link-reset d-block mb-4" href="...">
@@ -142,12 +62,7 @@ class SenadoScraper(BaseScraper):
 
                     # Hacer scroll para cargar más
                     if scroll_actual < max_scrolls - 1:
-                        old_height = self.driver.execute_script("return document.body.scrollHeight")
-                        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                        time.sleep(3)
-                        new_height = self.driver.execute_script("return document.body.scrollHeight")
-
-                        if new_height == old_height:
+                        if not self.scroll_and_wait():
                             print("No hay más contenido para cargar")
                             break
 
@@ -231,16 +146,9 @@ class SenadoScraper(BaseScraper):
         }
 
         try:
-            if self.driver:
-                self.driver.get(news_url)
-                time.sleep(3)
-                html = self.driver.page_source
-            else:
-                import requests
-                response = requests.get(news_url)
-                html = response.text
+            html = self.fetch_detail_html(news_url)
 
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.parse_html(html)
 
             # EXTRAER CONTENIDO - Buscar en el main o article
             contenido = ""
@@ -294,7 +202,7 @@ class SenadoScraper(BaseScraper):
             fecha_elem = soup.find('p', class_='text--md', string=re.compile(r'\w+\s+\d+\s+de\s+\w+\s+de\s+\d{4}'))
             if fecha_elem:
                 fecha_texto = fecha_elem.get_text().strip()
-                fecha = self.normalizar_fecha_senado(fecha_texto)
+                fecha = self.parse_date(fecha_texto)
                 if fecha:
                     details['published_date'] = fecha
                     print(f"Fecha extraída: {fecha_texto} -> {fecha}")
@@ -343,42 +251,3 @@ class SenadoScraper(BaseScraper):
             self.logger.error(f"Error extrayendo detalles de {news_url}: {e}")
 
         return details
-
-    def normalizar_fecha_senado(self, fecha_texto):
-        """Normalizar formato de fecha del Senado"""
-        meses = {
-            'enero': 1, 'febrero': 2, 'marzo': 3, 'abril': 4,
-            'mayo': 5, 'junio': 6, 'julio': 7, 'agosto': 8,
-            'septiembre': 9, 'octubre': 10, 'noviembre': 11, 'diciembre': 12
-        }
-
-        try:
-            # Formato: "Martes 4 de Agosto de 2015" o "7 de junio de 2024"
-            # Limpiar el texto
-            fecha_limpia = fecha_texto.strip()
-
-            # Remover el día de la semana si existe
-            dias_semana = ['lunes', 'martes', 'miércoles', 'jueves', 'viernes', 'sábado', 'domingo']
-            for dia in dias_semana:
-                fecha_limpia = re.sub(f'^{dia}\\s+', '', fecha_limpia, flags=re.IGNORECASE)
-
-            # Buscar patrón: "DD de MES de YYYY"
-            match = re.search(r'(\d+)\s+de\s+(\w+)\s+de\s+(\d{4})', fecha_limpia, re.IGNORECASE)
-
-            if match:
-                dia = int(match.group(1))
-                mes_nombre = match.group(2).lower()
-                año = int(match.group(3))
-
-                # Buscar el mes
-                mes_num = meses.get(mes_nombre, None)
-
-                if mes_num:
-                    return datetime(año, mes_num, dia)
-                else:
-                    print(f"Mes no reconocido: '{mes_nombre}'")
-
-        except Exception as e:
-            self.logger.error(f"Error normalizando fecha '{fecha_texto}': {e}")
-
-        return None
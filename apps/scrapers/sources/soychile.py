@@ -1,109 +1,32 @@
 from apps.scrapers.base import BaseScraper
-from bs4 import BeautifulSoup
-from datetime import datetime
+from apps.scrapers.parsing import class_strainer
 import re
-import time
 from urllib.parse import urljoin, urlparse
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
 
 class SoyChileScraper(BaseScraper):
-    def __init__(self):
-        super().__init__('SoyChile')
-
-    def save_news(self, news_data):
-        """Override para actualizar noticias existentes"""
-        try:
-            from apps.news.models import News
-
-            # Verificar qué datos estamos intentando guardar
-            print(f"Procesando: {news_data.get('title', 'Sin título')[:50]}...")
-
-            # Buscar si ya existe
-            try:
-                news = News.objects.get(url=news_data['url'])
-                # Ya existe - actualizar
-                updated = False
-
-                # Actualizar fecha si tenemos una nueva y es diferente
-                if news_data.get('published_date') and news.published_date != news_data['published_date']:
-                    news.published_date = news_data['published_date']
-                    updated = True
-                    print(f"Fecha actualizada: {news_data['published_date']}")
-
-                # Actualizar contenido si es más largo o si no teníamos
-                if news_data.get('content'):
-                    if not news.content or len(news_data['content']) > len(news.content):
-                        news.content = news_data['content']
-                        news.excerpt = news_data.get('excerpt', '')
-                        updated = True
-                        print(f"Contenido actualizado: {len(news_data['content'])} caracteres")
-
-                # Actualizar imagen si es diferente o no teníamos
-                if news_data.get('image_url') and news.image_url != news_data['image_url']:
-                    news.image_url = news_data['image_url']
-                    updated = True
-                    print(f"Imagen actualizada: {news_data['image_url']}")
-
-                # Actualizar autor si no teníamos
-                if news_data.get('author') and not news.author:
-                    news.author = news_data['author']
-                    updated = True
-                    print(f"Autor actualizado: {news_data['author']}")
-
-                if updated:
-                    news.save()
-                    print(f"✅ Actualizada: {news_data['title'][:50]}...")
-                    return True
-                else:
-                    print(f"Sin cambios: {news_data['title'][:50]}...")
-                    return False
-
-            except News.DoesNotExist:
-                # No existe - crear nueva
-                news = News.objects.create(
-                    source=self.source,
-                    title=news_data.get('title', ''),
-                    url=news_data['url'],
-                    content=news_data.get('content', ''),
-                    excerpt=news_data.get('excerpt', ''),
-                    published_date=news_data.get('published_date'),
-                    image_url=news_data.get('image_url', ''),
-                    author=news_data.get('author', ''),
-                )
-                print(f"✅ Nueva noticia guardada: {news_data['title'][:50]}...")
-                return True
-
-        except Exception as e:
-            print(f"Error guardando/actualizando noticia: {e}")
-            print(f"Datos problemáticos: {news_data}")
-            import traceback
-            print(traceback.format_exc())
-            return False
+    source_name = 'SoyChile'
 
     def get_source_config(self):
         return {
             'base_url': 'https://www.soychile.cl',
             'search_url': 'https://www.soychile.cl/buscador?query=pymemad',
-            'requires_selenium': True
+            'requires_selenium': True,
+            'detail_selectors': ['#textoDetalle', 'div.note-inner-text', 'div.note-inner-content'],
+            'list_selector': 'ul.list-group li.list-group-item',
+            'list_strainer': class_strainer('ul', 'list-group'),
         }
 
     def extract_news_list(self, html_content):
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = self.parse_list(html_content)
         news_list = []
 
         try:
             if self.driver:
-                wait = WebDriverWait(self.driver, 30)
-
-                # Esperar que carguen los resultados
-                print("Esperando que carguen los resultados...")
-                time.sleep(5)
-
                 # Esperar a que aparezca la lista de resultados
-                wait.until(EC.presence_of_element_located((By.CLASS_NAME, "list-group")))
+                if not self.wait_for_selector('.list-group'):
+                    self.logger.warning("No se encontró la lista de resultados")
+                    return news_list
                 print("Lista de resultados cargada")
 
                 urls_procesadas = set()
@@ -111,7 +34,7 @@ class SoyChileScraper(BaseScraper):
 
                 # Obtener HTML actualizado
                 html_content = self.driver.page_source
-                soup = BeautifulSoup(html_content, 'html.parser')
+                soup = self.parse_list(html_content)
 
                 # Buscar el contenedor de resultados (ul con class="list-group")
                 lista_resultados = soup.find('ul', class_='list-group')
@@ -136,12 +59,13 @@ class SoyChileScraper(BaseScraper):
                 if self.driver:
                     print("Intentando cargar más resultados con scroll...")
                     for i in range(3):  # Hacer 3 scrolls
-                        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                        time.sleep(3)
+                        if not self.scroll_and_wait():
+                            print("No hay más contenido para cargar")
+                            break
 
                         # Actualizar soup
                         html_content = self.driver.page_source
-                        soup = BeautifulSoup(html_content, 'html.parser')
+                        soup = self.parse_list(html_content)
                         lista_resultados = soup.find('ul', class_='list-group')
 
                         if lista_resultados:
@@ -232,16 +156,9 @@ class SoyChileScraper(BaseScraper):
         }
 
         try:
-            if self.driver:
-                self.driver.get(news_url)
-                time.sleep(3)
-                html = self.driver.page_source
-            else:
-                import requests
-                response = requests.get(news_url)
-                html = response.text
+            html = self.fetch_detail_html(news_url)
 
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.parse_html(html)
 
             # EXTRAER CONTENIDO - Basado en la estructura real de SoyChile
             contenido = ""
@@ -275,7 +192,7 @@ class SoyChileScraper(BaseScraper):
                 contenido_raw = contenido_raw.replace('<p></p>', '\n\n')
 
                 # Crear un nuevo soup para procesar el contenido limpio
-                content_soup = BeautifulSoup(contenido_raw, 'html.parser')
+                content_soup = self.parse_html(contenido_raw)
 
                 # Obtener todo el texto
                 contenido = content_soup.get_text().strip()
@@ -296,13 +213,13 @@ class SoyChileScraper(BaseScraper):
             if fecha_elem:
                 fecha_texto = fecha_elem.get_text().strip()
                 # Formato: "13 de Septiembre de 2023 | 00:10"
-                fecha = self.normalizar_fecha_soychile_detalle(fecha_texto)
+                fecha = self.parse_date(fecha_texto)
 
             # Si no encontramos, buscar en meta tags
             if not fecha:
                 meta_date = soup.find('meta', {'property': 'article:published_time'})
                 if meta_date and meta_date.get('content'):
-                    fecha = self.parse_iso_date(meta_date.get('content'))
+                    fecha = self.parse_date(meta_date.get('content'))
 
             if fecha:
                 details['published_date'] = fecha
@@ -331,90 +248,3 @@ class SoyChileScraper(BaseScraper):
             self.logger.error(f"Error extrayendo detalles de {news_url}: {e}")
 
         return details
-
-    def normalizar_fecha_soychile_detalle(self, fecha_texto):
-        """Normalizar formato de fecha del detalle de SoyChile"""
-        meses = {
-            'enero': 1, 'febrero': 2, 'marzo': 3, 'abril': 4,
-            'mayo': 5, 'junio': 6, 'julio': 7, 'agosto': 8,
-            'septiembre': 9, 'octubre': 10, 'noviembre': 11, 'diciembre': 12
-        }
-
-        try:
-            # Formato: "13 de Septiembre de 2023 | 00:10"
-            # Remover la hora
-            fecha_limpia = fecha_texto.split('|')[0].strip()
-
-            # Remover "de"
-            fecha_limpia = fecha_limpia.replace(' de ', ' ')
-
-            # Dividir en partes
-            partes = fecha_limpia.split()
-
-            if len(partes) >= 3:
-                dia = int(partes[0])
-                mes_nombre = partes[1].lower()
-                año = int(partes[2])
-
-                # Buscar el mes
-                mes_num = meses.get(mes_nombre, None)
-
-                if mes_num:
-                    return datetime(año, mes_num, dia)
-
-        except Exception as e:
-            self.logger.error(f"Error normalizando fecha detalle '{fecha_texto}': {e}")
-
-        return None
-
-    def normalizar_fecha_soychile(self, fecha_texto):
-        """Normalizar formato de fecha de SoyChile"""
-        try:
-            # Limpiar el texto
-            fecha_limpia = fecha_texto.strip()
-
-            # Formato común en SoyChile: "2022-7-18" o "18-07-2022"
-            # También puede venir como "2022-07-18"
-
-            # Intentar formato YYYY-M-D o YYYY-MM-DD
-            match = re.match(r'(\d{4})-(\d{1,2})-(\d{1,2})', fecha_limpia)
-            if match:
-                año = int(match.group(1))
-                mes = int(match.group(2))
-                dia = int(match.group(3))
-                return datetime(año, mes, dia)
-
-            # Intentar formato D-M-YYYY o DD-MM-YYYY
-            match = re.match(r'(\d{1,2})-(\d{1,2})-(\d{4})', fecha_limpia)
-            if match:
-                dia = int(match.group(1))
-                mes = int(match.group(2))
-                año = int(match.group(3))
-                return datetime(año, mes, dia)
-
-            # Intentar formato con /
-            fecha_limpia = fecha_limpia.replace('/', '-')
-            match = re.match(r'(\d{1,2})-(\d{1,2})-(\d{4})', fecha_limpia)
-            if match:
-                dia = int(match.group(1))
-                mes = int(match.group(2))
-                año = int(match.group(3))
-                return datetime(año, mes, dia)
-
-            print(f"No se pudo parsear la fecha: '{fecha_texto}'")
-
-        except Exception as e:
-            self.logger.error(f"Error normalizando fecha '{fecha_texto}': {e}")
-
-        return None
-
-    def parse_iso_date(self, date_string):
-        """Parsear fecha en formato ISO"""
-        try:
-            # Remover timezone si existe
-            if 'T' in date_string:
-                return datetime.fromisoformat(date_string.replace('Z', '+00:00').split('+')[0])
-            else:
-                return datetime.fromisoformat(date_string)
-        except:
-            return None
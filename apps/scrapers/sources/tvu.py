@@ -1,37 +1,28 @@
 from apps.scrapers.base import BaseScraper
-from bs4 import BeautifulSoup
-from datetime import datetime
+from apps.scrapers.parsing import class_strainer
 import re
-import time
 from urllib.parse import urljoin
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
 
 class TvuScraper(BaseScraper):
-    def __init__(self):
-        super().__init__('TVU')
+    source_name = 'TVU'
         
     def get_source_config(self):
         return {
             'base_url': 'https://www.tvu.cl',
             'search_url': 'https://www.tvu.cl/search?s=pymemad',
-            'requires_selenium': True
+            'requires_selenium': True,
+            'detail_selectors': ['.the-content', '.content-article', '.entry-content', '[itemprop="articleBody"]'],
+            'list_selector': '.main-search__list .main-search__item',
+            'list_strainer': class_strainer('div', 'main-search__list'),
         }
     
-    def extract_news_list(self, html_content):
-        soup = BeautifulSoup(html_content, 'html.parser')
-        news_list = []
+    def iter_news_pages(self, html_content):
+        soup = self.parse_list(html_content)
         
         try:
             if self.driver:
-                wait = WebDriverWait(self.driver, 30)
-                
-                # Esperar que cargue la página
-                self.logger.info("Esperando que carguen los resultados...")
-                time.sleep(5)
-                
                 # Procesar múltiples páginas
                 max_paginas = 3
                 pagina_actual = 1
@@ -40,15 +31,13 @@ class TvuScraper(BaseScraper):
                     self.logger.info(f"Procesando página {pagina_actual}...")
                     
                     # Esperar que carguen los resultados
-                    try:
-                        wait.until(EC.presence_of_element_located((By.CLASS_NAME, "main-search__list")))
-                    except:
+                    if not self.wait_for_selector('.main-search__list'):
                         self.logger.warning("No se encontraron resultados en esta página")
                         break
                     
                     # Obtener HTML actualizado
                     html_content = self.driver.page_source
-                    soup = BeautifulSoup(html_content, 'html.parser')
+                    soup = self.parse_list(html_content)
                     
                     # Buscar el contenedor de resultados
                     search_list = soup.find('div', class_='main-search__list')
@@ -61,11 +50,13 @@ class TvuScraper(BaseScraper):
                     items = search_list.find_all('div', class_='main-search__item')
                     self.logger.info(f"Encontrados {len(items)} items de búsqueda")
                     
+                    news_list = []
                     for item in items:
                         noticia = self.extraer_datos_noticia(item)
                         if noticia:
                             news_list.append(noticia)
                             self.logger.info(f"Noticia encontrada: {noticia['title'][:60]}...")
+                    yield news_list
                     
                     # Intentar ir a la siguiente página
                     if pagina_actual < max_paginas:
@@ -74,14 +65,11 @@ class TvuScraper(BaseScraper):
                             break
                         
                         pagina_actual += 1
-                        time.sleep(3)
                     else:
                         break
                         
         except Exception as e:
             self.logger.error(f"Error extrayendo lista de noticias: {e}")
-            
-        return news_list
     
     def extraer_datos_noticia(self, item):
         """Extraer datos de una noticia específica de TVU"""
@@ -131,8 +119,7 @@ class TvuScraper(BaseScraper):
                 if any(x in texto for x in ['siguiente', 'next', '»', '→']):
                     if link.is_displayed() and link.is_enabled():
                         self.logger.info("Navegando a siguiente página")
-                        self.driver.execute_script("arguments[0].click();", link)
-                        return True
+                        return self.click_and_wait(link)
             
             # Buscar por números de página
             current_url = self.driver.current_url
@@ -144,8 +131,8 @@ class TvuScraper(BaseScraper):
                     next_page = current_page + 1
                     next_url = re.sub(r'(?:page|p)=\d+', f'{match.group(0)[0]}={next_page}', current_url)
                     self.logger.info(f"Navegando a página {next_page}")
-                    self.driver.get(next_url)
-                    return True
+                    self.navigate(next_url)
+                    return self.wait_for_selector()
             
             return False
             
@@ -163,16 +150,9 @@ class TvuScraper(BaseScraper):
         }
         
         try:
-            if self.driver:
-                self.driver.get(news_url)
-                time.sleep(3)
-                html = self.driver.page_source
-            else:
-                import requests
-                response = requests.get(news_url)
-                html = response.text
+            html = self.fetch_detail_html(news_url)
             
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.parse_html(html)
             
             # Buscar contenido principal
             contenido = ""
@@ -243,7 +223,7 @@ class TvuScraper(BaseScraper):
                         fecha_texto = fecha_elem.get_text().strip()
                     
                     if fecha_texto:
-                        fecha_normalizada = self.normalizar_fecha_tvu(fecha_texto)
+                        fecha_normalizada = self.parse_date(fecha_texto)
                         if fecha_normalizada:
                             details['published_date'] = fecha_normalizada
                             break
@@ -290,41 +270,3 @@ class TvuScraper(BaseScraper):
                     return categoria.replace('-', ' ').title()
         
         return "Noticias"
-    
-    def normalizar_fecha_tvu(self, fecha_texto):
-        """Normalizar formato de fecha de TVU"""
-        # TVU usa formato: "15 de noviembre 2022"
-        meses = {
-            'enero': 1, 'febrero': 2, 'marzo': 3, 'abril': 4,
-            'mayo': 5, 'junio': 6, 'julio': 7, 'agosto': 8,
-            'septiembre': 9, 'octubre': 10, 'noviembre': 11, 'diciembre': 12
-        }
-        
-        try:
-            # Si es formato ISO datetime
-            if 'T' in fecha_texto or (fecha_texto.count('-') == 2 and len(fecha_texto) >= 10):
-                try:
-                    return datetime.fromisoformat(fecha_texto.replace('Z', '+00:00'))
-                except:
-                    pass
-            
-            # Quitar "de" y dividir
-            fecha_limpia = fecha_texto.lower().replace(' de ', ' ')
-            partes = fecha_limpia.split()
-            
-            if len(partes) >= 3:
-                try:
-                    dia = int(partes[0])
-                    mes_nombre = partes[1]
-                    año = int(partes[2])
-                    
-                    if mes_nombre in meses:
-                        mes = meses[mes_nombre]
-                        return datetime(año, mes, dia)
-                except:
-                    pass
-                    
-        except Exception as e:
-            self.logger.error(f"Error normalizando fecha '{fecha_texto}': {e}")
-        
-        return None
\ No newline at end of file
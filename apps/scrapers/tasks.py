@@ -0,0 +1,101 @@
+# apps/scrapers/tasks.py - Scraping periódico por fuente
+from celery import shared_task
+from celery.exceptions import SoftTimeLimitExceeded
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from datetime import timedelta
+import logging
+
+from apps.news.models import NewsSource, ScrapingLog
+from apps.scrapers.orchestrator import scrape_source
+from apps.scrapers.scheduling import is_due, schedule_next
+from apps.scrapers.sources import SCRAPERS, get_scraper
+
+logger = logging.getLogger('scrapers')
+
+SCRAPING_QUEUE = 'scraping'
+
+
+@shared_task(queue='short_tasks')
+def dispatch_due_sources():
+    """
+    Encola en la cola 'scraping' las fuentes cuya próxima corrida ya llegó.
+    Corre cada minuto desde beat; el intervalo de cada fuente lo decide
+    apps.scrapers.scheduling.
+    """
+    now = timezone.now()
+    dispatched = []
+
+    # Sin instanciar los scrapers: solo las fuentes con turno vencido
+    source_keys = {scraper_class.source_name: key for key, scraper_class in SCRAPERS.items()}
+    sources = {
+        source.name: source
+        for source in NewsSource.objects.filter(name__in=source_keys, is_active=True).filter(
+            Q(next_scrape_at__isnull=True) | Q(next_scrape_at__lte=now)
+        )
+    }
+    # Fuentes que aún no tienen NewsSource: el scraper la crea (una sola vez)
+    existing = set(NewsSource.objects.filter(name__in=source_keys).values_list('name', flat=True))
+    for name in set(source_keys) - existing:
+        try:
+            sources[name] = get_scraper(source_keys[name]).source
+        except Exception as e:
+            logger.error(f"❌ Error creando la fuente {source_keys[name]}: {e}")
+
+    for name, source in sources.items():
+        source_key = source_keys[name]
+        try:
+            if not is_due(source, now):
+                continue
+
+            # Reservar el turno para no volver a encolarla mientras espera en la cola;
+            # al terminar, schedule_next fija la próxima corrida real
+            source.next_scrape_at = now + timedelta(minutes=source.scrape_interval)
+            source.save(update_fields=['next_scrape_at', 'updated_at'])
+
+            scrape_source_task.apply_async(args=[source_key], queue=SCRAPING_QUEUE)
+            dispatched.append(source_key)
+        except Exception as e:
+            logger.error(f"❌ Error programando {source_key}: {e}")
+
+    if dispatched:
+        logger.info(f"Fuentes encoladas: {', '.join(dispatched)}")
+    return dispatched
+
+
+@shared_task(
+    queue=SCRAPING_QUEUE,
+    soft_time_limit=getattr(settings, 'SCRAPER_TASK_TIME_LIMIT', 1800),
+    time_limit=getattr(settings, 'SCRAPER_TASK_TIME_LIMIT', 1800) + 60,
+)
+def scrape_source_task(source_key, incremental=True):
+    """
+    Scrapea una fuente. El candado de la fuente lo toma scrape_source, así que
+    si ya está corriendo (otra tarea o el cronjob) esta termina sin hacer nada.
+    """
+    try:
+        result = scrape_source(source_key, options={'incremental': incremental})
+    except SoftTimeLimitExceeded:
+        # BaseScraper.scrape ya cerró su log y el navegador; por si cortó antes o después
+        ScrapingLog.objects.filter(
+            source__name=SCRAPERS[source_key.lower()].source_name,
+            status='running',
+        ).update(
+            status='failed',
+            error_message='Límite de tiempo de la tarea alcanzado',
+            finished_at=timezone.now(),
+        )
+        logger.error(f"❌ {source_key}: límite de tiempo de la tarea alcanzado")
+        raise
+
+    if result['status'] != 'locked':
+        source = NewsSource.objects.get(name=SCRAPERS[source_key.lower()].source_name)
+        next_run = schedule_next(source)
+        result['next_run'] = next_run.isoformat()
+
+    logger.info(
+        f"{source_key}: {result['status']}, {result['news_saved']}/{result['news_found']} guardadas "
+        f"en {result['duration']:.1f}s"
+    )
+    return result
@@ -1,3 +1,44 @@
-from django.test import TestCase
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+
+from apps.news.models import NewsSource
+from apps.scrapers.base import BaseScraper
+from apps.scrapers.parsing import available_parsers
+from apps.scrapers.replay import Fixture, ReplayRunner
+from apps.scrapers.sources import SCRAPERS, get_scraper
+
+
+def unsaved_source(scraper):
+    """NewsSource sin guardar: la reproducción no necesita base de datos"""
+    return NewsSource(name=scraper.source_name, base_url=scraper.get_source_config()['base_url'])
+
+
+@mock.patch.object(BaseScraper, 'get_or_create_source', unsaved_source)
+class ReplayFixturesTest(SimpleTestCase):
+    """Reproduce las páginas grabadas de cada fuente y las compara con su golden.json"""
+
+    def test_every_source_has_a_complete_fixture(self):
+        for source_key in SCRAPERS:
+            with self.subTest(source=source_key):
+                self.assertEqual(Fixture(source_key).missing(), [])
+
+    def test_replay_matches_golden_with_every_parser(self):
+        for parser in available_parsers():
+            for source_key in SCRAPERS:
+                with self.subTest(parser=parser, source=source_key), \
+                        override_settings(SCRAPER_HTML_PARSER=parser):
+                    report = ReplayRunner(get_scraper(source_key), Fixture(source_key)).run()
+
+                    self.assertTrue(report['news_list'])
+                    self.assertTrue(report['details'])
+                    for field, score in report['accuracy'].items():
+                        self.assertEqual(score, 1.0, f"{source_key}.{field} con {parser}")
+
+    def test_replay_command_passes(self):
+        stdout = StringIO()
+        call_command('replay_scrapers', repeat=1, fail_under=1.0, stdout=stdout)
+        for source_key in SCRAPERS:
+            self.assertIn(f'\n{source_key}:', stdout.getvalue())
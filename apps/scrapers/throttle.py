@@ -0,0 +1,168 @@
+"""
+Límite de peticiones por host y circuit breaker por fuente
+
+HostRateLimiter: token bucket en Redis por host, compartido por todos los
+procesos y workers. Cada petición (HTTP o navegación del navegador) toma un
+token; los tokens se reponen a SCRAPER_HOST_RATE por segundo hasta
+SCRAPER_HOST_BURST. El cálculo ocurre en un script Lua (atómico) con el
+reloj de Redis, así que no depende de los relojes de cada máquina.
+
+SourceCircuitBreaker: cuenta las fallas consecutivas de una fuente en
+NewsSource. Al llegar a SCRAPER_BREAKER_THRESHOLD el circuito se abre: la
+corrida en curso se corta y las siguientes se saltan hasta
+circuit_open_until, con una espera que se duplica cada vez que vuelve a
+abrirse. Pasada la espera se permite una corrida de prueba; un acierto lo
+cierra.
+"""
+import logging
+import time
+from datetime import timedelta
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.utils import timezone
+from django_redis import get_redis_connection
+
+logger = logging.getLogger('scrapers.throttle')
+
+TOKEN_BUCKET_LUA = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + (now - ts) * rate / 1000)
+
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = math.ceil((1 - tokens) * 1000 / rate)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst * 1000 / rate) + 1000)
+return wait
+"""
+
+
+class HostRateLimiter:
+    """
+    Uso:
+        limiter = HostRateLimiter()
+        limiter.wait(url)   # bloquea hasta que haya un token para el host
+    """
+
+    def __init__(self, rate=None, burst=None, max_wait=None):
+        self.rate = rate or getattr(settings, 'SCRAPER_HOST_RATE', 2.0)
+        self.burst = burst or getattr(settings, 'SCRAPER_HOST_BURST', 5)
+        self.max_wait = max_wait if max_wait is not None else getattr(settings, 'SCRAPER_HOST_MAX_WAIT', 30)
+        self.prefix = settings.CACHES['default'].get('KEY_PREFIX', '')
+        self._script = None
+
+    def rate_for(self, host):
+        """Tasa del host (SCRAPER_HOST_RATES permite ajustar hosts puntuales)"""
+        overrides = getattr(settings, 'SCRAPER_HOST_RATES', {})
+        return float(overrides.get(host, self.rate))
+
+    def _take(self, host):
+        """Milisegundos a esperar antes de volver a intentar (0 = token tomado)"""
+        if self._script is None:
+            self._script = get_redis_connection('default').register_script(TOKEN_BUCKET_LUA)
+        key = f'{self.prefix}:scrapers:bucket:{host}'
+        return int(self._script(keys=[key], args=[self.rate_for(host), self.burst]))
+
+    def wait(self, url):
+        """
+        Espera un token para el host de `url`. Retorna los segundos
+        esperados. Si Redis no responde o se supera max_wait, sigue sin
+        token (un límite caído no debe detener el scraping).
+        """
+        host = urlsplit(url).netloc.lower()
+        if not host:
+            return 0.0
+
+        started = time.monotonic()
+        while True:
+            try:
+                wait_ms = self._take(host)
+            except Exception as e:
+                logger.warning(f"Límite por host no disponible ({host}): {e}")
+                return time.monotonic() - started
+            if wait_ms <= 0:
+                return time.monotonic() - started
+
+            waited = time.monotonic() - started
+            if waited + wait_ms / 1000 > self.max_wait:
+                logger.warning(f"{host}: más de {self.max_wait}s esperando turno, se sigue sin token")
+                return waited
+            time.sleep(wait_ms / 1000)
+
+
+_limiter = None
+
+
+def get_rate_limiter():
+    """Limitador compartido por proceso"""
+    global _limiter
+    if _limiter is None:
+        _limiter = HostRateLimiter()
+    return _limiter
+
+
+class CircuitOpenError(Exception):
+    """La fuente acumuló demasiadas fallas seguidas"""
+
+
+class SourceCircuitBreaker:
+    """
+    Uso:
+        breaker = SourceCircuitBreaker(source)
+        if not breaker.allow_run():
+            ...  # saltar la corrida
+        breaker.record_success() / breaker.record_failure()
+    """
+
+    def __init__(self, source, threshold=None, backoff_minutes=None, max_backoff_minutes=None):
+        self.source = source
+        self.threshold = threshold or getattr(settings, 'SCRAPER_BREAKER_THRESHOLD', 5)
+        self.backoff_minutes = backoff_minutes or getattr(settings, 'SCRAPER_BREAKER_BACKOFF', 15)
+        self.max_backoff_minutes = max_backoff_minutes or getattr(settings, 'SCRAPER_BREAKER_MAX_BACKOFF', 24 * 60)
+
+    def allow_run(self, now=None):
+        return not self.source.is_circuit_open(now)
+
+    def record_success(self):
+        source = self.source
+        if source.consecutive_failures or source.circuit_open_until or source.circuit_trips:
+            source.consecutive_failures = 0
+            source.circuit_open_until = None
+            source.circuit_trips = 0
+            self._save()
+
+    def record_failure(self):
+        """
+        Suma una falla. Si se alcanza el umbral abre el circuito y lanza
+        CircuitOpenError para cortar la corrida.
+        """
+        source = self.source
+        source.consecutive_failures += 1
+        if source.consecutive_failures < self.threshold:
+            self._save()
+            return
+
+        minutes = min(self.max_backoff_minutes, self.backoff_minutes * 2 ** source.circuit_trips)
+        source.circuit_open_until = timezone.now() + timedelta(minutes=minutes)
+        # Sin reiniciar el contador: en la corrida de prueba basta una falla para reabrirlo
+        source.circuit_trips += 1
+        self._save()
+        raise CircuitOpenError(
+            f"{source.consecutive_failures} fallas seguidas; circuito abierto por {minutes} min "
+            f"(hasta {timezone.localtime(source.circuit_open_until):%H:%M})"
+        )
+
+    def _save(self):
+        self.source.save(update_fields=['consecutive_failures', 'circuit_open_until', 'circuit_trips', 'updated_at'])
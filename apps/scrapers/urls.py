@@ -0,0 +1,8 @@
+from django.urls import path
+from apps.scrapers import views
+
+app_name = 'scrapers'
+
+urlpatterns = [
+    path('metrics/', views.ScraperMetricsView.as_view(), name='metrics'),
+]
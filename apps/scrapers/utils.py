@@ -0,0 +1,75 @@
+"""
+Utilidades compartidas por los scrapers
+"""
+import hashlib
+import math
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Parámetros de tracking que no cambian el contenido de la página
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid',
+    'ref', 'ref_src', 'share', 'amp', 'utm_id',
+}
+
+
+def canonicalize_url(url):
+    """
+    Forma canónica de una URL de noticia para comparar duplicados:
+    https, host en minúsculas sin 'www.', sin parámetros de tracking,
+    sin fragmento y sin slash final.
+    """
+    if not url:
+        return ''
+
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    ]
+    path = parts.path.rstrip('/') or '/'
+
+    return urlunsplit(('https', host, path, urlencode(sorted(query)), ''))
+
+
+def url_variants(url):
+    """
+    Variantes con las que una URL pudo haberse guardado en News.url
+    (http/https, con/sin 'www.', con/sin slash final).
+    """
+    canonical = urlsplit(canonicalize_url(url))
+    variants = {url}
+    for scheme in ('https', 'http'):
+        for host in (canonical.netloc, f'www.{canonical.netloc}'):
+            for path in {canonical.path, canonical.path.rstrip('/') + '/'}:
+                variants.add(urlunsplit((scheme, host, path, canonical.query, '')))
+    return variants
+
+
+class BloomFilter:
+    """
+    Filtro de Bloom simple (serializable con pickle, apto para la cache).
+    Responde "seguro no está" o "probablemente está".
+    """
+
+    def __init__(self, capacity=10000, error_rate=0.01):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:], 'big') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, value):
+        for position in self._positions(value):
+            self.bits[position // 8] |= 1 << (position % 8)
+
+    def __contains__(self, value):
+        return all(self.bits[position // 8] & (1 << (position % 8)) for position in self._positions(value))
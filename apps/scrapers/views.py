@@ -1,3 +1,39 @@
-from django.shortcuts import render
+from datetime import timedelta
 
-# Create your views here.
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import JsonResponse
+from django.utils import timezone
+from django.views import View
+
+from apps.news.models import ScrapingLog
+from apps.permissions.mixins import ACLPermissionMixin
+from apps.scrapers.metrics import summarize_logs
+
+
+class ScraperMetricsView(ACLPermissionMixin, LoginRequiredMixin, View):
+    """
+    p50/p95 por fuente de la duración de cada fase del scraping en los
+    últimos ?days=N días (por defecto 7, máximo 90). Opcional ?source=<nombre>.
+    """
+    module_code = 'dashboard'
+    required_action = 'view'
+
+    def get(self, request, *args, **kwargs):
+        try:
+            days = min(90, max(1, int(request.GET.get('days', 7))))
+        except ValueError:
+            days = 7
+
+        logs = ScrapingLog.objects.filter(
+            created_at__gte=timezone.now() - timedelta(days=days),
+            status='completed',
+        ).select_related('source').only('source__name', 'created_at', 'metrics')
+
+        source = request.GET.get('source')
+        if source:
+            logs = logs.filter(source__name__iexact=source)
+
+        return JsonResponse({
+            'days': days,
+            'sources': summarize_logs(logs),
+        })
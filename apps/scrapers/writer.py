@@ -0,0 +1,259 @@
+"""
+Escritura por lotes de noticias scrapeadas
+
+Acumula las noticias de una corrida y las guarda en lotes con un único
+INSERT ... ON CONFLICT (url) DO UPDATE por lote, en vez de 2-3 consultas por
+noticia. Las reglas de mezcla con lo ya guardado son las mismas que usaban
+los save_news de cada fuente:
+
+- fecha: se actualiza si viene una y es distinta
+- contenido: se reemplaza (junto al excerpt) solo si el nuevo es más largo
+- imagen: se actualiza si viene una y es distinta
+- autor: solo se completa si no teníamos
+- relevancia (is_pymemad_related): se fija al crear la noticia; después no
+  se pisa, por si se corrigió a mano
+
+Después de cada lote se marcan como copia (News.duplicate_of) las noticias
+cuya huella SimHash está a pocos bits de otra más antigua de los últimos
+días, de cualquier fuente.
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.news.feed import invalidate_feed
+from apps.news.fingerprints import SIMHASH_BANDS, hamming_distance, to_unsigned
+from apps.news.models import News
+from apps.news.search import update_search_vectors
+
+NEWS_FIELDS = ['title', 'content', 'excerpt', 'published_date', 'image_url', 'author']
+BAND_FIELDS = [f'simhash_band_{band}' for band in range(SIMHASH_BANDS)]
+FINGERPRINT_FIELDS = ['simhash', *BAND_FIELDS]
+# Texto que se puede recortar sin perder la noticia; las URLs recortadas quedan rotas
+TRUNCATE_FIELDS = ['title', 'author']
+UPSERT_FIELDS = ['content', 'excerpt', 'published_date', 'image_url', 'author', 'scraped_date', *FINGERPRINT_FIELDS]
+
+
+class NewsWriter:
+    """
+    Uso:
+        writer = NewsWriter(source)
+        for news_data in ...:
+            writer.add(news_data)
+        writer.flush()
+        writer.created, writer.updated, writer.duplicates
+    """
+
+    def __init__(self, source, batch_size=None, logger=None):
+        self.source = source
+        self.batch_size = batch_size or getattr(settings, 'SCRAPER_WRITE_BATCH_SIZE', 50)
+        self.logger = logger or logging.getLogger('scrapers.writer')
+        self.created = 0
+        self.updated = 0
+        self.failed = 0
+        self.duplicates = 0
+        self.saved_urls = []
+        self._buffer = {}
+
+    def add(self, news_data):
+        """Agrega una noticia al lote; guarda el lote si se llenó"""
+        news_data = self.normalize(news_data)
+        if news_data is None:
+            self.failed += 1
+            return
+        if not news_data.get('url'):
+            return
+
+        self._buffer[news_data['url']] = news_data
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Guarda el lote pendiente"""
+        if not self._buffer:
+            return
+
+        batch = self._buffer
+        self._buffer = {}
+
+        try:
+            with transaction.atomic():
+                self._write_batch(batch)
+        except Exception as e:
+            self.failed += len(batch)
+            self.logger.error(f"Error guardando lote de {len(batch)} noticias: {e}")
+
+    def _write_batch(self, batch):
+        now = timezone.now()
+        existing = {
+            news.url: news
+            for news in News.objects.filter(url__in=list(batch)).only('url', *NEWS_FIELDS)
+        }
+
+        to_write = []
+        unchanged_urls = []
+        created = []
+        updated = []
+
+        for url, news_data in batch.items():
+            news = existing.get(url)
+            if news is None:
+                news = News(
+                    source=self.source,
+                    url=url,
+                    scraped_date=now,
+                    is_pymemad_related=news_data.get('is_pymemad_related', True),
+                    **{field: news_data.get(field) or self._empty(field) for field in NEWS_FIELDS},
+                )
+                news.update_fingerprint()
+                to_write.append(news)
+                created.append(url)
+            elif self.merge(news, news_data):
+                # Instancia sin pk: el conflicto por url resuelve el UPDATE
+                news = News(
+                    source=self.source,
+                    url=url,
+                    scraped_date=now,
+                    **{field: getattr(news, field) for field in NEWS_FIELDS},
+                )
+                news.update_fingerprint()
+                to_write.append(news)
+                updated.append(url)
+            else:
+                unchanged_urls.append(url)
+
+        if to_write:
+            News.objects.bulk_create(
+                to_write,
+                update_conflicts=True,
+                unique_fields=['url'],
+                update_fields=UPSERT_FIELDS,
+            )
+
+        # Marcar como revisadas las que no cambiaron (ver --refresh-days)
+        if unchanged_urls:
+            News.objects.filter(url__in=unchanged_urls).update(scraped_date=now)
+
+        duplicates = 0
+        if to_write:
+            update_search_vectors(News.objects.filter(url__in=created + updated))
+            duplicates = self.mark_duplicates(created + updated, now)
+            # Al confirmar el lote, para no cachear páginas sin estas noticias
+            transaction.on_commit(lambda: invalidate_feed(self.source.pk))
+
+        self.created += len(created)
+        self.updated += len(updated)
+        self.duplicates += duplicates
+        self.saved_urls.extend(created + updated)
+        self.logger.info(
+            f"Lote guardado: {len(created)} nuevas, {len(updated)} actualizadas, "
+            f"{len(unchanged_urls)} sin cambios, {duplicates} casi duplicadas"
+        )
+
+    def mark_duplicates(self, urls, now):
+        """
+        Asigna duplicate_of a las noticias de `urls` que son casi iguales a
+        una anterior (menor id) dentro de la ventana. Retorna cuántas quedaron
+        marcadas como copia.
+        """
+        max_distance = getattr(settings, 'SCRAPER_DUPLICATE_MAX_DISTANCE', 3)
+        window_days = getattr(settings, 'SCRAPER_DUPLICATE_WINDOW_DAYS', 7)
+
+        items = list(
+            News.objects.filter(url__in=urls, simhash__isnull=False)
+            .values('id', 'duplicate_of_id', *FINGERPRINT_FIELDS)
+        )
+        if not items:
+            return 0
+
+        # Candidatos: comparten al menos una banda con alguna noticia del lote
+        band_filter = Q()
+        for field in BAND_FIELDS:
+            band_filter |= Q(**{f'{field}__in': {item[field] for item in items}})
+        candidates = list(
+            News.objects.filter(band_filter, scraped_date__gte=now - timedelta(days=window_days))
+            .values('id', 'duplicate_of_id', *FINGERPRINT_FIELDS)
+            .order_by('id')
+        )
+
+        changes = {}
+        duplicates = 0
+        for item in items:
+            representative = None
+            for candidate in candidates:
+                if candidate['id'] >= item['id']:
+                    break
+                if not any(candidate[field] == item[field] for field in BAND_FIELDS):
+                    continue
+                if hamming_distance(to_unsigned(candidate['simhash']), to_unsigned(item['simhash'])) <= max_distance:
+                    representative = candidate['duplicate_of_id'] or candidate['id']
+                    break
+
+            if representative is not None:
+                duplicates += 1
+            if representative != item['duplicate_of_id']:
+                changes.setdefault(representative, []).append(item['id'])
+
+        for representative, ids in changes.items():
+            News.objects.filter(id__in=ids).update(duplicate_of_id=representative)
+        return duplicates
+
+    def merge(self, news, news_data):
+        """Aplica las reglas de mezcla sobre `news`. Retorna True si cambió algo"""
+        updated = False
+
+        if news_data.get('published_date') and news.published_date != news_data['published_date']:
+            news.published_date = news_data['published_date']
+            updated = True
+
+        if news_data.get('content'):
+            if not news.content or len(news_data['content']) > len(news.content):
+                news.content = news_data['content']
+                news.excerpt = news_data.get('excerpt', '')
+                updated = True
+
+        if news_data.get('image_url') and news.image_url != news_data['image_url']:
+            news.image_url = news_data['image_url']
+            updated = True
+
+        if news_data.get('author') and not news.author:
+            news.author = news_data['author']
+            updated = True
+
+        return updated
+
+    def normalize(self, news_data):
+        """
+        Ajusta los campos al modelo y asegura fechas con zona horaria.
+        Retorna None si la noticia no se puede guardar (URL demasiado larga).
+        """
+        news_data = dict(news_data)
+
+        url = news_data.get('url')
+        if url and len(url) > News._meta.get_field('url').max_length:
+            # Recortada sería otra clave única, que no apunta a la noticia
+            self.logger.warning(f"URL demasiado larga, se descarta: {url[:120]}...")
+            return None
+
+        image_url = news_data.get('image_url')
+        if image_url and len(image_url) > News._meta.get_field('image_url').max_length:
+            news_data['image_url'] = None
+
+        for field in TRUNCATE_FIELDS:
+            max_length = News._meta.get_field(field).max_length
+            value = news_data.get(field)
+            if max_length and isinstance(value, str) and len(value) > max_length:
+                news_data[field] = value[:max_length]
+
+        published_date = news_data.get('published_date')
+        if published_date and timezone.is_naive(published_date):
+            news_data['published_date'] = timezone.make_aware(published_date)
+
+        return news_data
+
+    def _empty(self, field):
+        return None if field == 'published_date' else ''
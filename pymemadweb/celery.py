@@ -26,6 +26,9 @@ app.conf.beat_scheduler = 'django_celery_beat.schedulers.DatabaseScheduler'
 app.conf.task_queues = (
     Queue('long_tasks', Exchange('long_tasks'), routing_key='long.tasks'),
     Queue('short_tasks', Exchange('short_tasks'), routing_key='short.tasks'),
+    # Scrapers: worker propio (celery -A pymemadweb worker -Q scraping -c N),
+    # N = cuántas fuentes pueden correr a la vez
+    Queue('scraping', Exchange('scraping'), routing_key='scraping'),
 )
 # Explicitly include accounts tasks
 app.autodiscover_tasks(['apps.accounts']) #NUEVO
@@ -1,13 +1,28 @@
 # pymemadweb/middleware.py - Versión mejorada
 
 from django.core.cache import cache
-from django_redis import get_redis_connection
+from django.middleware.cache import UpdateCacheMiddleware
 from django.conf import settings
 import logging
 
+from apps.core.cache_invalidation import invalidate_cache
+from apps.core.cache_tags import register_page
+
 logger = logging.getLogger(__name__)
 
 
+class TaggedUpdateCacheMiddleware(UpdateCacheMiddleware):
+    """
+    UpdateCacheMiddleware que registra cada página cacheada en el índice de
+    tags (ver apps.core.cache_tags), para invalidarla sin SCAN
+    """
+
+    def process_response(self, request, response):
+        response = super().process_response(request, response)
+        register_page(request, response, self)
+        return response
+
+
 class SmartCacheInvalidationMiddleware:
     """
     Middleware para invalidar cache inteligentemente cuando
@@ -44,49 +59,23 @@ class SmartCacheInvalidationMiddleware:
     def invalidate_related_cache(self, request):
         """Invalida cache relacionado con la acción"""
         try:
-            # Usar Redis directamente para mejor control
-            redis_conn = get_redis_connection("default")
-            prefix = settings.CACHES['default'].get('KEY_PREFIX', '')
-
-            # Patrones a limpiar cuando se edita contenido
-            patterns_to_clear = [
-                f"{prefix}:*home*",
-                f"{prefix}:*latest*",
-                f"{prefix}:*recent*",
-                f"{prefix}:*list*",
-                f"{prefix}:*page*",
-                f"{prefix}:*GET:*",  # Cache del middleware
-                f"{prefix}:*HEAD:*",
-            ]
+            # Home y listados: basta con cambiar la generación (O(1))
+            namespaces = ['home', 'news_list']
+
+            # Tags a limpiar cuando se edita contenido: páginas completas y listados
+            tags_to_clear = ['page', 'list:news']
 
             # Si es una acción sobre noticias o contenido
             if 'news' in request.path or 'magazine' in request.path:
-                patterns_to_clear.extend([
-                    f"{prefix}:*news*",
-                    f"{prefix}:*magazine*",
-                    f"{prefix}:*members*",
-                ])
-            
+                namespaces.extend(['categories', 'tags'])
+                tags_to_clear.extend(['list:magazine', 'list:members'])
+
             # Si es una acción sobre miembros
             if 'members' in request.path:
-                patterns_to_clear.extend([
-                    f"{prefix}:*members*",
-                    f"{prefix}:*directory*",
-                ])
-
-            # Limpiar usando SCAN para evitar bloqueos
-            total_deleted = 0
-            for pattern in patterns_to_clear:
-                cursor = 0
-                batch_count = 0
-                while batch_count < 100:  # Limitar a 100 keys por patrón
-                    cursor, keys = redis_conn.scan(cursor, match=pattern, count=10)
-                    if keys:
-                        redis_conn.delete(*keys)
-                        total_deleted += len(keys)
-                        batch_count += len(keys)
-                    if cursor == 0:
-                        break
+                tags_to_clear.extend(['list:members', 'list:directory'])
+
+            # Fuera de la request: las ediciones seguidas se purgan una sola vez
+            total_deleted = invalidate_cache(tags_to_clear, namespaces)
 
             if total_deleted > 0:
                 logger.info(
@@ -31,6 +31,7 @@ DJANGO_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',  # Búsqueda de texto completo en noticias
 ]
 
 THIRD_PARTY_APPS = [
@@ -63,7 +64,7 @@ INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 
 
 MIDDLEWARE = [
-    'django.middleware.cache.UpdateCacheMiddleware',  # PRIMERO - Para cache
+    'pymemadweb.middleware.TaggedUpdateCacheMiddleware',  # PRIMERO - Para cache (registra tags)
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.locale.LocaleMiddleware',  # Importante
@@ -388,10 +389,23 @@ if not os.path.exists(LOGS_DIR):
 # Redis Configuration
 REDIS_BASE_URL = os.environ.get('REDIS_BASE_URL', 'redis://localhost:6379/0')
 
+# Cache en memoria del proceso delante de Redis (ver apps.core.cache_backends)
+CACHE_L1_ENABLED = os.environ.get('CACHE_L1_ENABLED', 'True') == 'True'
+CACHE_L1_TIMEOUT = int(os.environ.get('CACHE_L1_TIMEOUT', 30))  # Segundos máximos de un valor en memoria
+CACHE_L1_MAX_ENTRIES = int(os.environ.get('CACHE_L1_MAX_ENTRIES', 1000))  # Entradas por proceso
+CACHE_L1_KEY_PREFIXES = [  # Familias de claves que se guardan también en memoria
+    'cache:generation:',
+    'all_categories_',
+    'all_tags_',
+    'popular_tags_',
+    'home_data_',
+    'categories_with_count_',
+]
+
 # Redis Cache Configuration
 CACHES = {
     'default': {
-        'BACKEND': 'django_redis.cache.RedisCache',
+        'BACKEND': 'apps.core.cache_backends.TwoTierRedisCache' if CACHE_L1_ENABLED else 'django_redis.cache.RedisCache',
         'LOCATION': REDIS_BASE_URL,
         'OPTIONS': {
             'CLIENT_CLASS': 'django_redis.client.DefaultClient',
@@ -407,6 +421,11 @@ CACHES = {
         'KEY_PREFIX': 'pymemad',
         'VERSION': 1,
         'TIMEOUT': 60 * 60,  # 1 hora por defecto
+        'L1': {
+            'KEY_PREFIXES': CACHE_L1_KEY_PREFIXES,
+            'TIMEOUT': CACHE_L1_TIMEOUT,
+            'MAX_ENTRIES': CACHE_L1_MAX_ENTRIES,
+        },
     }
 }
 
@@ -415,6 +434,16 @@ CACHE_MIDDLEWARE_ALIAS = 'default'
 CACHE_MIDDLEWARE_SECONDS = 60 * 15  # 15 minutos para páginas completas
 CACHE_MIDDLEWARE_KEY_PREFIX = 'pymemad'
 
+# Invalidación diferida (ver apps.core.cache_invalidation)
+CACHE_INVALIDATION_ASYNC = os.environ.get('CACHE_INVALIDATION_ASYNC', 'True') == 'True'  # False = purgar en la misma request
+CACHE_INVALIDATION_WINDOW = int(os.environ.get('CACHE_INVALIDATION_WINDOW', 5))  # Segundos que se agrupan las ediciones
+
+# Protección contra estampidas (ver apps.core.cache_compute)
+CACHE_XFETCH_BETA = float(os.environ.get('CACHE_XFETCH_BETA', 1.0))  # Refresco anticipado (0 = desactivado)
+CACHE_STALE_TTL = int(os.environ.get('CACHE_STALE_TTL', 300))  # Segundos que se sirve un valor vencido mientras se recalcula
+CACHE_LOCK_TIMEOUT = int(os.environ.get('CACHE_LOCK_TIMEOUT', 30))  # Duración máxima del lock de recálculo
+CACHE_LOCK_WAIT = int(os.environ.get('CACHE_LOCK_WAIT', 5))  # Espera sin valor viejo antes de calcular igual
+
 # Configuración variable por tipo de contenido (adaptado a pymemaddir)
 CACHE_TIMES = {
     'home': 60 * 30,           # 30 minutos para página principal
@@ -427,6 +456,7 @@ CACHE_TIMES = {
     'contact': 60 * 10,        # 10 minutos para contacto
     'dashboard': 0,            # No cachear dashboard (requiere login)
     'api': 60 * 5,             # 5 minutos para APIs futuras
+    'news_feed': 60 * 60,      # 1 hora por página del feed (se invalida por generación)
     'static_components': 60 * 60,  # 1 hora para componentes estáticos
 }
 
@@ -491,6 +521,39 @@ DJANGO_REDIS_CLOSE_CONNECTION = False  # Reutilizar conexiones
 # Señales para limpiar cache al editar
 CACHE_INVALIDATION_ON_SAVE = True  # Flag para activar limpieza automática
 
+# Scrapers Configuration
+SCRAPER_BROWSER_MAX_PAGES = int(os.environ.get('SCRAPER_BROWSER_MAX_PAGES', 50))  # Reciclar Chrome tras N páginas
+SCRAPER_DETAIL_CONCURRENCY = int(os.environ.get('SCRAPER_DETAIL_CONCURRENCY', 16))  # Descargas de detalle simultáneas
+SCRAPER_DETAIL_CONCURRENCY_PER_HOST = int(os.environ.get('SCRAPER_DETAIL_CONCURRENCY_PER_HOST', 4))
+SCRAPER_WRITE_BATCH_SIZE = int(os.environ.get('SCRAPER_WRITE_BATCH_SIZE', 50))  # Noticias por INSERT ... ON CONFLICT
+SCRAPER_WAIT_TIMEOUT = int(os.environ.get('SCRAPER_WAIT_TIMEOUT', 10))  # Máximo por espera de carga (s)
+SCRAPER_WAIT_BUDGET = int(os.environ.get('SCRAPER_WAIT_BUDGET', 180))  # Máximo esperando por fuente y corrida (s)
+SCRAPER_HTML_PARSER = os.environ.get('SCRAPER_HTML_PARSER', '')  # Backend de BeautifulSoup; vacío = lxml si está instalado
+SCRAPER_DUPLICATE_MAX_DISTANCE = int(os.environ.get('SCRAPER_DUPLICATE_MAX_DISTANCE', 3))  # Bits de diferencia SimHash (< 4 bandas)
+SCRAPER_DUPLICATE_WINDOW_DAYS = int(os.environ.get('SCRAPER_DUPLICATE_WINDOW_DAYS', 7))  # Días hacia atrás para buscar la original
+SCRAPER_TASK_TIME_LIMIT = int(os.environ.get('SCRAPER_TASK_TIME_LIMIT', 1800))  # Máximo por tarea Celery de una fuente (s)
+SCRAPER_LOCK_TIMEOUT = int(os.environ.get('SCRAPER_LOCK_TIMEOUT', 3600))  # Expiración del candado por fuente (s), > time limit
+SCRAPER_MIN_INTERVAL = int(os.environ.get('SCRAPER_MIN_INTERVAL', 15))  # Minutos mínimos entre corridas de una fuente
+SCRAPER_MAX_INTERVAL = int(os.environ.get('SCRAPER_MAX_INTERVAL', 720))  # Minutos máximos entre corridas de una fuente
+SCRAPER_BUSY_THRESHOLD = int(os.environ.get('SCRAPER_BUSY_THRESHOLD', 5))  # Noticias guardadas por corrida para acelerar
+SCRAPER_YIELD_WINDOW = int(os.environ.get('SCRAPER_YIELD_WINDOW', 5))  # Corridas recientes que se promedian
+SCRAPER_ARCHIVE_HTML = os.environ.get('SCRAPER_ARCHIVE_HTML', 'False') == 'True'  # Guardar el HTML descargado (ver reparse_news)
+SCRAPER_ARCHIVE_LOCATION = os.environ.get('SCRAPER_ARCHIVE_LOCATION', '')  # Directorio local; vacío = storage de media (S3)
+SCRAPER_ARCHIVE_LEVEL = int(os.environ.get('SCRAPER_ARCHIVE_LEVEL', 10))  # Nivel de compresión zstd
+SCRAPER_HOST_RATE = float(os.environ.get('SCRAPER_HOST_RATE', 2))  # Peticiones por segundo a un mismo host (todos los workers)
+SCRAPER_HOST_BURST = int(os.environ.get('SCRAPER_HOST_BURST', 5))  # Ráfaga máxima por host
+SCRAPER_HOST_MAX_WAIT = int(os.environ.get('SCRAPER_HOST_MAX_WAIT', 30))  # Máximo esperando turno antes de seguir (s)
+SCRAPER_HOST_RATES = {}  # Tasas puntuales por host, p. ej. {'www.emol.com': 1}
+SCRAPER_BREAKER_THRESHOLD = int(os.environ.get('SCRAPER_BREAKER_THRESHOLD', 5))  # Fallas seguidas que abren el circuito
+SCRAPER_BREAKER_BACKOFF = int(os.environ.get('SCRAPER_BREAKER_BACKOFF', 15))  # Minutos de la primera apertura (se duplica)
+SCRAPER_BREAKER_MAX_BACKOFF = int(os.environ.get('SCRAPER_BREAKER_MAX_BACKOFF', 1440))  # Tope de la espera (min)
+SCRAPER_STOP_AFTER_KNOWN = int(os.environ.get('SCRAPER_STOP_AFTER_KNOWN', 20))  # Incremental: cortar tras N URLs conocidas seguidas (0 = nunca)
+SCRAPER_RELEVANCE_MODE = os.environ.get('SCRAPER_RELEVANCE_MODE', 'defer')  # Ítems del listado poco relevantes: 'defer', 'skip' o '' (sin filtro)
+SCRAPER_RELEVANCE_LIST_THRESHOLD = float(os.environ.get('SCRAPER_RELEVANCE_LIST_THRESHOLD', 0.3))  # Puntaje mínimo de título/extracto
+SCRAPER_RELEVANCE_CONTENT_THRESHOLD = float(os.environ.get('SCRAPER_RELEVANCE_CONTENT_THRESHOLD', 0.6))  # Puntaje para is_pymemad_related
+SCRAPER_RELEVANCE_DEFER_LIMIT = int(os.environ.get('SCRAPER_RELEVANCE_DEFER_LIMIT', 10))  # Poco relevantes cuyo detalle se pide por corrida
+SCRAPER_RELEVANCE_TERMS = {}  # Términos extra o pesos puntuales, p. ej. {'eucalipto': 1.5}
+
 # Celery Configuration
 CELERY_BROKER_URL = REDIS_BASE_URL
 CELERY_RESULT_BACKEND = REDIS_BASE_URL
@@ -550,6 +613,13 @@ CELERY_BEAT_SCHEDULE = {
         'options': {'queue': 'long_tasks'}
     },
 
+    # Encolar las fuentes de noticias que ya tocan (intervalo adaptativo por fuente)
+    'dispatch-news-scrapers': {
+        'task': 'apps.scrapers.tasks.dispatch_due_sources',
+        'schedule': crontab(minute='*'),  # Cada minuto
+        'options': {'queue': 'short_tasks'}
+    },
+
     # Limpieza de cache huérfano semanalmente
     'cleanup-orphaned-cache': {
         'task': 'apps.core.tasks.cleanup_orphaned_cache',
@@ -37,6 +37,8 @@ urlpatterns += i18n_patterns(
     # Páginas principales del sitio
     path('', include('apps.landing.urls')),
     path('dashboard/', include('apps.panel.urls')),
+    path('dashboard/scrapers/', include('apps.scrapers.urls')),
+    path('dashboard/news/', include('apps.news.urls')),
 
     # Autenticación y cuentas
     path('accounts/', include('apps.accounts.urls')),